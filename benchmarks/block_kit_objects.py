@@ -0,0 +1,75 @@
+"""Measures the cost of building and serializing large Block Kit option sets.
+
+Builds a select menu with many option groups of 100 options each, as large
+modals do, then serializes it with `to_dict`.
+
+Usage:
+    python -m benchmarks.block_kit_objects [--groups 100] [--repeat 5]
+"""
+
+# Standard Imports
+import argparse
+import gc
+import time
+import tracemalloc
+
+# Internal Imports
+from slack.web.classes.elements import StaticSelectElement
+from slack.web.classes.objects import Option, OptionGroup, PlainTextObject
+
+
+def build_menu(groups):
+    return StaticSelectElement(
+        placeholder=PlainTextObject(text="Pick a project"),
+        action_id="project",
+        option_groups=[
+            OptionGroup(
+                label=f"Team {group}",
+                options=[
+                    Option(
+                        text=PlainTextObject(text=f"Project {group}-{n}"),
+                        value=f"{group}-{n}",
+                    )
+                    for n in range(100)
+                ],
+            )
+            for group in range(groups)
+        ],
+    )
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    options = args.groups * 100
+
+    build = best_of(args.repeat, lambda: build_menu(args.groups))
+    menu = build_menu(args.groups)
+    serialize = best_of(args.repeat, menu.to_dict)
+
+    gc.collect()
+    tracemalloc.start()
+    menu = build_menu(args.groups)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del menu
+
+    print(f"options                {options:>10}")
+    print(f"build                  {build / options * 1e6:>10.2f} us/option")
+    print(f"to_dict                {serialize / options * 1e6:>10.2f} us/option")
+    print(f"retained memory        {size / options:>10.0f} bytes/option")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Load tests the EventsApiReceiver on a local port.
+
+Signed Events API requests are sent concurrently to a receiver whose only
+callback counts events, optionally sleeping to simulate slow handlers. The
+ack latency seen by the sender (which must stay well under Slack's 3 second
+window) and the rate at which events are handled are reported.
+
+Usage:
+    python -m benchmarks.events_receiver_load [--requests 5000] [--concurrency 100]
+        [--handler-delay 0.0] [--workers 10] [--max-queue-size 1000]
+"""
+
+# Standard Imports
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+# ThirdParty Imports
+import aiohttp
+from aiohttp import web
+
+# Internal Imports
+from slack.events import EventsApiReceiver
+from slack.signature import SignatureVerifier
+
+SIGNING_SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+PORT = 8766
+
+
+async def send_requests(args, latencies, statuses):
+    signer = SignatureVerifier(SIGNING_SECRET)
+    url = f"http://localhost:{PORT}/slack/events"
+    pending = iter(range(args.requests))
+
+    async def sender(session):
+        for n in pending:
+            timestamp = str(int(time.time()))
+            body = json.dumps(
+                {
+                    "type": "event_callback",
+                    "event_id": f"Ev{n}",
+                    "team_id": "T1",
+                    "event": {"type": "message", "text": "x" * 200, "channel": "C1"},
+                }
+            )
+            headers = {
+                "Content-Type": "application/json",
+                "X-Slack-Request-Timestamp": timestamp,
+                "X-Slack-Signature": signer.generate_signature(
+                    timestamp=timestamp, body=body
+                ),
+            }
+            start = time.perf_counter()
+            async with session.post(url, data=body, headers=headers) as response:
+                await response.read()
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+            latencies.append(time.perf_counter() - start)
+
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(sender(session) for _ in range(args.concurrency)))
+
+
+async def main(args):
+    handled = []
+
+    @EventsApiReceiver.run_on(event="message")
+    async def count(**payload):
+        if args.handler_delay:
+            await asyncio.sleep(args.handler_delay)
+        handled.append(time.perf_counter())
+
+    receiver = EventsApiReceiver(
+        signing_secret=SIGNING_SECRET,
+        workers=args.workers,
+        max_queue_size=args.max_queue_size,
+    )
+    runner = web.AppRunner(receiver.app)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", PORT)
+    await site.start()
+
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await send_requests(args, latencies, statuses)
+    sent = time.perf_counter() - start
+    await receiver._queue.join()
+    drained = time.perf_counter() - start
+    await runner.cleanup()
+
+    latencies.sort()
+    print(f"requests sent        {args.requests:>10}")
+    print(f"responses            {statuses}")
+    print(f"acks/s               {args.requests / sent:>10,.0f}")
+    print(f"ack latency p50      {statistics.median(latencies) * 1000:>10.2f} ms")
+    print(
+        f"ack latency p99      {latencies[int(len(latencies) * 0.99)] * 1000:>10.2f} ms"
+    )
+    print(f"ack latency max      {latencies[-1] * 1000:>10.2f} ms")
+    print(f"events handled       {len(handled):>10}")
+    print(f"events handled/s     {len(handled) / drained:>10,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--handler-delay", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--max-queue-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,169 @@
+"""Compares the HTTP/2 transport with aiohttp's HTTP/1.1 connection pool.
+
+Sends bursts of concurrent api.test calls to a local hypercorn server,
+running in its own process, which answers HTTP/1.1 and HTTP/2 (cleartext,
+with prior knowledge) alike after a simulated network latency. Reports the
+requests per second and the number of connections each transport opened.
+
+Requires the 'http2' extra and hypercorn:
+    pip install slackclient[http2] hypercorn
+
+Usage:
+    python -m benchmarks.http2_transport [--requests 5000] [--concurrency 1000]
+        [--latency 0.05] [--connections 4] [--pool 100]
+"""
+
+# Standard Imports
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+
+# ThirdParty Imports
+import aiohttp
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+# Internal Imports
+import slack
+from slack.web.transports import AiohttpTransport, HTTP2Transport
+
+
+class SlackServer:
+    """An ASGI app answering every method like api.test, after a latency.
+
+    '/stats' answers with the connections and HTTP versions seen since the
+    last time it was called.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.peers = set()
+        self.http_versions = set()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                await send({"type": message["type"] + ".complete"})
+                if message["type"] == "lifespan.shutdown":
+                    return
+        if scope["path"] == "/stats":
+            stats = {
+                "connections": len(self.peers),
+                "versions": sorted(self.http_versions),
+            }
+            self.peers.clear()
+            self.http_versions.clear()
+            await self.respond(send, stats)
+            return
+        self.peers.add(tuple(scope["client"]))
+        self.http_versions.add(scope["http_version"])
+        body, more_body = b"", True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        await asyncio.sleep(self.latency)
+        await self.respond(send, {"ok": True, "args": json.loads(body or b"{}")})
+
+    @staticmethod
+    async def respond(send, data):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps(data).encode()})
+
+
+def serve_forever(bind, latency, max_streams):
+    config = Config()
+    config.bind = [bind]
+    config.backlog = 4096
+    config.h2_max_concurrent_streams = max_streams
+    config.keep_alive_max_requests = 10**9
+    config.loglevel = "WARNING"
+    asyncio.run(serve(SlackServer(latency), config))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def burst(transport, base_url, requests, concurrency):
+    client = slack.WebClient(
+        token="xoxb-1", base_url=base_url, run_async=True, transport=transport
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(n):
+        async with semaphore:
+            await client.api_call("api.test", json={"n": n})
+
+    start, cpu_start = time.perf_counter(), time.process_time()
+    await asyncio.gather(*(call(n) for n in range(requests)))
+    return time.perf_counter() - start, time.process_time() - cpu_start
+
+
+async def run(args, base_url):
+    session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=args.pool))
+    transports = {
+        f"aiohttp, HTTP/1.1 ({args.pool} connection pool)": (
+            AiohttpTransport(session=session)
+        ),
+        f"httpx, HTTP/2 ({args.connections} connections)": HTTP2Transport(
+            connections=args.connections, timeout=60, http1=False
+        ),
+    }
+    try:
+        for name, transport in transports.items():
+            # Warms the connections up.
+            await burst(transport, base_url, args.concurrency, args.concurrency)
+            seconds, cpu_seconds = await burst(
+                transport, base_url, args.requests, args.concurrency
+            )
+            async with aiohttp.ClientSession() as stats_session:
+                async with stats_session.get(base_url + "../stats") as response:
+                    stats = await response.json()
+            print(
+                f"{name:<40} {args.requests / seconds:>10,.0f} requests/s"
+                f" {cpu_seconds / args.requests * 1e6:>8.0f} us CPU/request"
+                f" {stats['connections']:>6} connections"
+                f" (HTTP/{', '.join(stats['versions'])})"
+            )
+    finally:
+        await session.close()
+        for transport in transports.values():
+            await transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--connections", type=int, default=4)
+    parser.add_argument("--pool", type=int, default=100)
+    args = parser.parse_args()
+
+    bind = f"127.0.0.1:{free_port()}"
+    server = multiprocessing.Process(
+        target=serve_forever, args=(bind, args.latency, args.concurrency), daemon=True
+    )
+    server.start()
+    time.sleep(1)
+    try:
+        asyncio.run(run(args, f"http://{bind}/api/"))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Measures the cold start import cost of the slack package.
+
+Each import statement is run in a fresh interpreter with `python -X importtime`
+and the cumulative time of the imported module is reported. The median of
+several runs is compared against a budget so that cold start regressions
+(e.g. `import slack` pulling in aiohttp again) are caught.
+
+Usage:
+    python benchmarks/import_time.py [--runs 15] [--no-budget]
+"""
+
+# Standard Imports
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# The module each statement imports last, and its budget in milliseconds.
+# Budgets are generous on purpose: they're meant to catch heavy imports
+# creeping in, not to measure small fluctuations between machines.
+BUDGETS = {
+    "import slack": ("slack", 25),
+    "import slack.web.classes.blocks": ("slack.web.classes.blocks", 50),
+    "from slack.web.client import WebClient": ("slack.web.client", 500),
+    "from slack.rtm.client import RTMClient": ("slack.rtm.client", 500),
+}
+
+# Modules that must not be imported by the lightweight entry points.
+HEAVY_MODULES = ("aiohttp", "asyncio")
+LIGHTWEIGHT_STATEMENTS = (
+    "import slack",
+    "import slack.web.classes.blocks",
+    "from slack.signature import SignatureVerifier",
+)
+
+
+def measure(statement: str, module: str) -> int:
+    """Returns the cumulative import time of `module` in microseconds."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative = max(cumulative, int(parts[1]))
+    return cumulative
+
+
+def imported_modules(statement: str) -> set:
+    """Returns the names of all modules loaded by the statement."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--no-budget", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+    for statement, (module, budget_ms) in BUDGETS.items():
+        # The first run writes the bytecode cache, so it's not counted.
+        measure(statement, module)
+        timings = [measure(statement, module) for _ in range(args.runs)]
+        median_ms = statistics.median(timings) / 1000
+        print(f"{statement:<45} {median_ms:>8.2f} ms  (budget {budget_ms} ms)")
+        if median_ms > budget_ms:
+            failures.append(f"'{statement}' took {median_ms:.2f} ms")
+
+    for statement in LIGHTWEIGHT_STATEMENTS:
+        heavy = sorted(set(HEAVY_MODULES) & imported_modules(statement))
+        if heavy:
+            failures.append(f"'{statement}' imports {', '.join(heavy)}")
+
+    if failures and not args.no_budget:
+        print("\nImport time budget exceeded:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Compares rendering a Template with rebuilding the Block Kit objects.
+
+Builds a message like the onboarding message of the PythOnBoardingBot
+tutorial, changing the user and the task checkmarks for every recipient.
+
+Usage:
+    python -m benchmarks.message_templates [--messages 10000] [--repeat 5]
+"""
+
+# Standard Imports
+import argparse
+import json
+import time
+
+# Internal Imports
+from slack.web.classes.blocks import (
+    ActionsBlock,
+    ContextBlock,
+    DividerBlock,
+    SectionBlock,
+)
+from slack.web.classes.elements import ButtonElement
+from slack.web.classes.objects import MarkdownTextObject, PlainTextObject
+from slack.web.classes.templates import Slot, Template
+
+
+def build_blocks(user, reaction_checkmark, pin_checkmark):
+    return [
+        SectionBlock(
+            text=MarkdownTextObject(
+                text=f"Welcome to Slack, <@{user}>! :wave: We're so glad you're here.\n\n"
+                "*Get started by completing the steps below:*"
+            )
+        ),
+        DividerBlock(),
+        SectionBlock(
+            text=MarkdownTextObject(
+                text=f"{reaction_checkmark} *Add an emoji reaction to this message*"
+            )
+        ),
+        ContextBlock(
+            elements=[
+                MarkdownTextObject(
+                    text=":information_source: *<https://get.slack.help/hc/en-us/"
+                    "articles/206870317|Learn How to Use Emoji Reactions>*"
+                )
+            ]
+        ),
+        DividerBlock(),
+        SectionBlock(
+            text=MarkdownTextObject(text=f"{pin_checkmark} *Pin this message*")
+        ),
+        ContextBlock(
+            elements=[
+                MarkdownTextObject(
+                    text=":information_source: *<https://get.slack.help/hc/en-us/"
+                    "articles/205239997|Learn How to Pin a Message>*"
+                )
+            ]
+        ),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Skip the tutorial"),
+                    action_id="skip",
+                    value="skip",
+                )
+            ]
+        ),
+    ]
+
+
+def rebuild(n):
+    blocks = build_blocks(f"U{n:08}", ":white_check_mark:", ":white_large_square:")
+    return [block.to_dict() for block in blocks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    template = Template(build_blocks(Slot("user"), Slot("reaction"), Slot("pin")))
+    compile_time = time.perf_counter() - start
+
+    def render(n):
+        return template.render(
+            user=f"U{n:08}",
+            reaction=":white_check_mark:",
+            pin=":white_large_square:",
+        )
+
+    assert json.dumps(render(1)) == json.dumps(rebuild(1))
+
+    results = {}
+    for name, build in (("rebuild + to_dict", rebuild), ("Template.render", render)):
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for n in range(args.messages):
+                build(n)
+            timings.append(time.perf_counter() - start)
+        results[name] = min(timings) / args.messages
+
+    print(f"{'compile template':<22} {compile_time * 1e6:>10.2f} us")
+    for name, per_message in results.items():
+        print(f"{name:<22} {per_message * 1e6:>10.2f} us/message")
+    speedup = results["rebuild + to_dict"] / results["Template.render"]
+    print(f"{'speedup':<22} {speedup:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
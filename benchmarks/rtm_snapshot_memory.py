@@ -0,0 +1,90 @@
+"""Compares the memory used by the rtm.start snapshot as dicts and EntityTables.
+
+Builds a synthetic rtm.start payload with users shaped like those of
+`tests/data/rtm.start.json`, each with their own email and avatar hashes,
+and measures, with tracemalloc, the memory held by the decoded payload and
+by its compact form.
+
+Usage:
+    python -m benchmarks.rtm_snapshot_memory [--users 50000] [--channels 5000]
+"""
+
+# Standard Imports
+import argparse
+import gc
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+
+# Internal Imports
+from slack.rtm.snapshot import compact_snapshot
+
+RTM_START_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "data", "rtm.start.json"
+)
+
+
+def synthetic_payload(users, channels):
+    """Encodes an rtm.start payload with the given number of users and channels."""
+    with open(RTM_START_PATH) as rtm_start:
+        template = json.load(rtm_start)
+    user, channel = template["users"][0], template["channels"][0]
+    avatar_hash = "4f1bd7fd71e645fa19620504b4c0e3ba"
+
+    def make_user(n):
+        user_hash = hashlib.md5(str(n).encode()).hexdigest()
+        profile = {
+            key: value.replace(avatar_hash, user_hash)
+            for key, value in user["profile"].items()
+        }
+        profile["email"] = f"user{n}@example.com"
+        return {**user, "id": f"U{n:08d}", "name": f"user{n}", "profile": profile}
+
+    payload = dict(template)
+    payload["users"] = [make_user(n) for n in range(users)]
+    payload["channels"] = [
+        {**channel, "id": f"C{n:08d}", "name": f"channel{n}"} for n in range(channels)
+    ]
+    return json.dumps(payload)
+
+
+def measure(build):
+    """Returns what build() returns and the memory it holds, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50000)
+    parser.add_argument("--channels", type=int, default=5000)
+    args = parser.parse_args()
+
+    body = synthetic_payload(args.users, args.channels)
+    decoded, decoded_size = measure(lambda: json.loads(body))
+    compact, compact_size = measure(lambda: compact_snapshot(json.loads(body)))
+
+    ids = compact["users"].ids
+    start = time.perf_counter()
+    for entity_id in ids[:: max(1, len(ids) // 1000)]:
+        compact["users"].get(entity_id)
+    lookups = min(len(ids), 1000)
+    lookup_time = (time.perf_counter() - start) / lookups
+
+    print(f"payload                {len(body) / 2 ** 20:>10.1f} MiB of JSON")
+    print(f"decoded dicts          {decoded_size / 2 ** 20:>10.1f} MiB")
+    print(f"EntityTables           {compact_size / 2 ** 20:>10.1f} MiB")
+    print(f"reduction              {decoded_size / compact_size:>10.1f}x")
+    print(f"materialize a user     {lookup_time * 1e6:>10.1f} us")
+    del decoded
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Runs the hot path benchmarks and records their results as JSON.
+
+Covers the overhead of `api_call` with an in-memory transport, requests per
+second against the local emulator (tests/emulator.py), RTM events per
+second through `_read_messages` and `_dispatch_event`, pagination
+throughput, and `to_dict` on a large Block Kit message.
+
+Results are written as JSON with `--output`; `--compare` prints the change
+of every benchmark against a previous run's JSON, e.g.:
+
+    python -m benchmarks.suite --output baseline.json
+    git checkout my-branch
+    python -m benchmarks.suite --compare baseline.json
+
+Usage:
+    python -m benchmarks.suite [--repeat 5] [--quick] [--only NAME ...]
+        [--output results.json] [--compare baseline.json]
+"""
+
+# Standard Imports
+import argparse
+import asyncio
+import collections
+import datetime
+import json
+import platform
+import sys
+import time
+
+# ThirdParty Imports
+import aiohttp
+
+# Internal Imports
+import slack
+from slack.version import __version__
+from slack.web.classes.blocks import ActionsBlock, DividerBlock, SectionBlock
+from slack.web.classes.elements import (
+    ButtonElement,
+    ImageElement,
+    StaticSelectElement,
+)
+from slack.web.classes.objects import MarkdownTextObject, Option
+from slack.web.interceptors import Interceptor
+from slack.web.transports import InMemoryTransport, make_response
+from tests.emulator import SlackEmulator, Workspace
+
+# Each benchmark takes the scale of the run and returns the number of
+# operations done and the seconds they took.
+BENCHMARKS = collections.OrderedDict()
+
+
+def benchmark(name: str, unit: str):
+    def register(function):
+        BENCHMARKS[name] = (function, unit)
+        return function
+
+    return register
+
+
+def run_in_new_loop(coroutine_function, *args):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine_function(loop, *args))
+    finally:
+        loop.close()
+
+
+def _api_calls(scale, interceptors=()):
+    response = make_response(
+        {"ok": True, "channel": "C0123456789", "ts": "1503435956.000247"}
+    )
+    transport = InMemoryTransport(lambda http_verb, api_url, req_args: response)
+
+    async def run(loop, calls):
+        client = slack.WebClient(
+            token="xoxb-1",
+            loop=loop,
+            run_async=True,
+            transport=transport,
+            interceptors=interceptors,
+        )
+        start = time.perf_counter()
+        for n in range(calls):
+            await client.chat_postMessage(channel="C0123456789", text=f"Deploy {n}")
+        return calls, time.perf_counter() - start
+
+    return run_in_new_loop(run, int(2000 * scale))
+
+
+@benchmark("api_call (in-memory transport)", "call")
+def api_call_overhead(scale):
+    """Everything but the network: arguments, headers, decoding, SlackResponse."""
+    return _api_calls(scale)
+
+
+@benchmark("api_call (3 interceptors)", "call")
+def api_call_interceptors(scale):
+    """The cost of the interceptor chain, with interceptors that do nothing."""
+    return _api_calls(scale, [Interceptor(), Interceptor(), Interceptor()])
+
+
+async def _concurrent_requests(loop, calls, shared_session):
+    emulator = SlackEmulator(Workspace(users=10, channels=1), rate_limits=False)
+    base_url = await emulator.start()
+    session = aiohttp.ClientSession() if shared_session else None
+    client = slack.WebClient(
+        token="xoxb-1", base_url=base_url, loop=loop, run_async=True, session=session
+    )
+    concurrency = 50
+
+    async def worker(count):
+        for _ in range(count):
+            await client.api_test()
+
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(worker(calls // concurrency) for _ in range(concurrency))
+        )
+        return calls, time.perf_counter() - start
+    finally:
+        if session is not None:
+            await session.close()
+        await emulator.stop()
+
+
+@benchmark("requests (new session per call)", "request")
+def requests_new_session(scale):
+    return run_in_new_loop(_concurrent_requests, int(500 * scale), False)
+
+
+@benchmark("requests (shared session)", "request")
+def requests_shared_session(scale):
+    return run_in_new_loop(_concurrent_requests, int(500 * scale), True)
+
+
+@benchmark("pagination (users.list)", "user")
+def pagination(scale):
+    async def start(loop, users):
+        emulator = SlackEmulator(Workspace(users=users, channels=1), rate_limits=False)
+        return emulator, await emulator.start()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    emulator, base_url = loop.run_until_complete(start(loop, int(2000 * scale)))
+    client = slack.WebClient(token="xoxb-1", base_url=base_url, loop=loop)
+    try:
+        start = time.perf_counter()
+        users = sum(len(page["members"]) for page in client.users_list(limit=200))
+        return users, time.perf_counter() - start
+    finally:
+        loop.run_until_complete(emulator.stop())
+        loop.close()
+
+
+@benchmark("rtm events", "event")
+def rtm_events(scale):
+    async def run(loop, events):
+        emulator = SlackEmulator(Workspace(users=100, channels=10), rate_limits=False)
+        base_url = await emulator.start()
+        received = 0
+        timing = {}
+
+        @slack.RTMClient.run_on(event="hello")
+        async def flood(**payload):
+            timing["start"] = time.perf_counter()
+            await emulator.flood(events)
+
+        @slack.RTMClient.run_on(event="message")
+        def count(**payload):
+            nonlocal received
+            received += 1
+            if received == events:
+                timing["end"] = time.perf_counter()
+                payload["rtm_client"].stop()
+
+        rtm_client = slack.RTMClient(
+            token="xoxb-1",
+            base_url=base_url,
+            loop=loop,
+            run_async=True,
+            auto_reconnect=False,
+        )
+        try:
+            await asyncio.wait_for(rtm_client.start(), 60)
+        finally:
+            slack.RTMClient._callbacks = collections.defaultdict(list)
+            await emulator.stop()
+        return received, timing["end"] - timing["start"]
+
+    return run_in_new_loop(run, int(5000 * scale))
+
+
+def large_message(sections):
+    options = [Option(text=f"Option {n}", value=f"option-{n}") for n in range(20)]
+    blocks = []
+    for n in range(sections):
+        blocks.append(
+            SectionBlock(
+                text=MarkdownTextObject(text=f"*Incident {n}*\nDatabase latency is up"),
+                fields=[f"*Service:*\napi-{n}", "*Severity:*\nHigh"],
+                accessory=ImageElement(
+                    image_url=f"https://example.com/graphs/{n}.png", alt_text="Graph"
+                ),
+            )
+        )
+        blocks.append(
+            ActionsBlock(
+                elements=[
+                    ButtonElement(text="Acknowledge", action_id=f"ack-{n}", value="1"),
+                    StaticSelectElement(
+                        placeholder="Assign to",
+                        action_id=f"assign-{n}",
+                        options=options,
+                    ),
+                ]
+            )
+        )
+        blocks.append(DividerBlock())
+    return blocks
+
+
+@benchmark("to_dict (50 block message)", "message")
+def block_kit_to_dict(scale):
+    blocks = large_message(sections=17)[:50]
+    messages = int(100 * scale)
+    start = time.perf_counter()
+    for _ in range(messages):
+        [block.to_dict() for block in blocks]
+    return messages, time.perf_counter() - start
+
+
+def run(names, repeat, scale):
+    results = collections.OrderedDict()
+    for name in names:
+        function, unit = BENCHMARKS[name]
+        samples = []
+        for _ in range(repeat):
+            operations, seconds = function(scale)
+            samples.append(seconds / operations)
+        best = min(samples)
+        results[name] = {
+            "unit": unit,
+            "seconds_per_op": best,
+            "ops_per_second": 1 / best,
+            "samples": samples,
+        }
+        print(f"{name:<34} {best * 1e6:>10.2f} us/{unit:<8} {1 / best:>12,.0f} /s")
+    return results
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+    print(f"\nCompared with {baseline_path} (lower is better):")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["seconds_per_op"], result["seconds_per_op"]
+        change = (after - before) / before * 100
+        print(
+            f"{name:<34} {before * 1e6:>10.2f} -> {after * 1e6:>10.2f} us"
+            f" ({change:+.1f}%)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--quick", action="store_true", help="Run a tenth of the operations."
+    )
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), metavar="NAME")
+    parser.add_argument("--output", help="The file to write the JSON results to.")
+    parser.add_argument("--compare", help="The JSON results of a previous run.")
+    args = parser.parse_args()
+
+    scale = 0.1 if args.quick else 1
+    results = run(args.only or list(BENCHMARKS), args.repeat, scale)
+    if args.output:
+        report = {
+            "slackclient": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "argv": sys.argv[1:],
+            "results": results,
+        }
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -127,7 +127,12 @@ setup(
         exclude=["docs", "docs-src", "tests", "tests.*", "tutorial"]
     ),
     install_requires=["aiohttp>3.5.2"],
-    extras_require={"optional": ["aiodns>1.0"]},
+    extras_require={
+        "optional": ["aiodns>1.0"],
+        "http2": ["httpx[http2]>=0.26"],
+        "prometheus": ["prometheus_client>=0.8"],
+        "opentelemetry": ["opentelemetry-api>=1.12"],
+    },
     setup_requires=["pytest-runner"],
     test_suite="tests",
     tests_require=tests_require,
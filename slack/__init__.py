@@ -1,8 +1,43 @@
 import logging
+import sys
+from importlib import import_module
 from logging import NullHandler
 
-from slack.web.client import WebClient  # noqa
-from slack.rtm.client import RTMClient  # noqa
-
 # Set default logging handler to avoid "No handler found" warnings.
 logging.getLogger(__name__).addHandler(NullHandler())
+
+# The clients pull in aiohttp and asyncio, which is expensive for tools that
+# only need e.g. the Block Kit classes. They're imported on first access.
+_lazy_attributes = {
+    "WebClient": "slack.web.client",
+    "RTMClient": "slack.rtm.client",
+}
+_lazy_submodules = {
+    "errors",
+    "events",
+    "instrumentation",
+    "recording",
+    "rtm",
+    "signature",
+    "web",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        """Imports the clients and subpackages when they're first accessed."""
+        if name in _lazy_attributes:
+            value = getattr(import_module(_lazy_attributes[name]), name)
+        elif name in _lazy_submodules:
+            value = import_module(f"{__name__}.{name}")
+        else:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_attributes) | _lazy_submodules)
+
+else:  # Module level __getattr__ isn't supported before Python 3.7 (PEP 562).
+    from slack.web.client import WebClient  # noqa
+    from slack.rtm.client import RTMClient  # noqa
@@ -0,0 +1,83 @@
+"""A Python module for linking callbacks to Slack events."""
+
+# Standard Imports
+import collections
+import inspect
+from typing import Callable, DefaultDict
+
+# Internal Imports
+import slack.errors as client_err
+
+
+class CallbackRegistry:
+    """Stores the callbacks linked to each event for the class it's mixed into.
+
+    Each class using this mixin should define its own `_callbacks` so that
+    callbacks registered for one kind of client aren't run by another.
+
+    Methods:
+        on: Stores and links callbacks to events.
+        run_on: Decorator that stores and links callbacks to events.
+    """
+
+    _callbacks: DefaultDict = collections.defaultdict(list)
+
+    @classmethod
+    def run_on(cls, *, event: str):
+        """A decorator to store and link a callback to an event."""
+
+        def decorator(callback):
+            cls.on(event=event, callback=callback)
+            return callback
+
+        return decorator
+
+    @classmethod
+    def on(cls, *, event: str, callback: Callable):
+        """Stores and links the callback(s) to the event.
+
+        Args:
+            event (str): A string that specifies a Slack or websocket event.
+                e.g. 'channel_joined' or 'open'
+            callback (Callable): Any object or a list of objects that can be called.
+                e.g. <function say_hello at 0x101234567> or
+                [<function say_hello at 0x10123>,<function say_bye at 0x10456>]
+
+        Raises:
+            SlackClientError: The specified callback is not callable.
+            SlackClientError: The callback must accept keyword arguments (**kwargs).
+        """
+        if isinstance(callback, list):
+            for cb in callback:
+                cls._validate_callback(cb)
+            previous_callbacks = cls._callbacks[event]
+            cls._callbacks[event] = list(set(previous_callbacks + callback))
+        else:
+            cls._validate_callback(callback)
+            cls._callbacks[event].append(callback)
+
+    @staticmethod
+    def _validate_callback(callback):
+        """Checks if the specified callback is callable and accepts a kwargs param.
+
+        Args:
+            callback (obj): Any object or a list of objects that can be called.
+                e.g. <function say_hello at 0x101234567>
+
+        Raises:
+            SlackClientError: The specified callback is not callable.
+            SlackClientError: The callback must accept keyword arguments (**kwargs).
+        """
+
+        cb_name = callback.__name__ if hasattr(callback, "__name__") else callback
+        if not callable(callback):
+            msg = "The specified callback '{}' is not callable.".format(cb_name)
+            raise client_err.SlackClientError(msg)
+        callback_params = inspect.signature(callback).parameters.values()
+        if not any(
+            param for param in callback_params if param.kind == param.VAR_KEYWORD
+        ):
+            msg = "The callback '{}' must accept keyword arguments (**kwargs).".format(
+                cb_name
+            )
+            raise client_err.SlackClientError(msg)
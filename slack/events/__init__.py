@@ -0,0 +1,7 @@
+from slack.events.deduplication import (  # noqa
+    DeduplicationStore,
+    EventDeduplicator,
+    MemoryDeduplicationStore,
+    SQLiteDeduplicationStore,
+)
+from slack.events.receiver import EventsApiReceiver  # noqa
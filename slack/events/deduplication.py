@@ -0,0 +1,177 @@
+"""A Python module for dropping events Slack delivers more than once."""
+
+# Standard Imports
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Mapping, Optional
+
+
+class DeduplicationStore:
+    """The interface of the stores recording which events were received.
+
+    Stores shared by several processes (e.g. a Redis store, using
+    `SET event_id 1 NX EX ttl` for `add` and `DEL event_id` for `discard`)
+    must make `add` an atomic check-and-set.
+    """
+
+    def add(self, event_id: str) -> bool:
+        """Records the event id.
+
+        Returns:
+            True if the event id wasn't recorded yet, False otherwise.
+        """
+        raise NotImplementedError
+
+    def discard(self, event_id: str):
+        """Forgets the event id, so that its next delivery is handled."""
+        raise NotImplementedError
+
+
+class MemoryDeduplicationStore(DeduplicationStore):
+    """Records event ids in memory, for a single process.
+
+    Attributes:
+        max_size (int): The maximum number of event ids kept. The least
+            recently seen ids are forgotten first. Default is 10000.
+        ttl (int): The number of seconds an event id is kept. Slack retries
+            an event up to 3 times over about 5 minutes. Default is 900.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 10000,
+        ttl: int = 60 * 15,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        # Event ids mapped to the time they can be forgotten, least recently
+        # seen first.
+        self._event_ids: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._event_ids)
+
+    def add(self, event_id: str) -> bool:
+        now = self._clock()
+        event_ids = self._event_ids
+        expires_at = event_ids.get(event_id)
+        if expires_at is not None and expires_at > now:
+            event_ids.move_to_end(event_id)
+            return False
+        event_ids[event_id] = now + self.ttl
+        event_ids.move_to_end(event_id)
+        while len(event_ids) > self.max_size:
+            event_ids.popitem(last=False)
+        return True
+
+    def discard(self, event_id: str):
+        self._event_ids.pop(event_id, None)
+
+
+class SQLiteDeduplicationStore(DeduplicationStore):
+    """Records event ids in a SQLite database, shared by local processes.
+
+    Attributes:
+        path (str): The path of the database file. e.g. '/tmp/slack_events.db'
+        ttl (int): The number of seconds an event id is kept. Default is 900.
+    """
+
+    def __init__(
+        self, path: str, *, ttl: int = 60 * 15, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS slack_event_ids "
+            "(event_id TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+        )
+        self._next_purge = 0.0
+
+    def add(self, event_id: str) -> bool:
+        now = self._clock()
+        with self._lock:
+            if now >= self._next_purge:
+                self._connection.execute(
+                    "DELETE FROM slack_event_ids WHERE expires_at <= ?", (now,)
+                )
+                self._next_purge = now + self.ttl / 10
+            # An expired id that wasn't purged yet is replaced.
+            self._connection.execute(
+                "DELETE FROM slack_event_ids WHERE event_id = ? AND expires_at <= ?",
+                (event_id, now),
+            )
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO slack_event_ids (event_id, expires_at) VALUES (?, ?)",
+                (event_id, now + self.ttl),
+            )
+            return cursor.rowcount == 1
+
+    def discard(self, event_id: str):
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM slack_event_ids WHERE event_id = ?", (event_id,)
+            )
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+
+class EventDeduplicator:
+    """Detects Events API events Slack has already delivered.
+
+    Slack retries an event when your app doesn't acknowledge it quickly
+    enough, setting the X-Slack-Retry-Num header. Each delivery carries the
+    same 'event_id', which is recorded in a store with an O(1) lookup.
+
+    Attributes:
+        store (DeduplicationStore): Where event ids are recorded.
+            Default is a MemoryDeduplicationStore.
+        hits (int): The number of deliveries detected as duplicates.
+        misses (int): The number of deliveries seen for the first time.
+        retries (int): The number of deliveries Slack marked as retries.
+    """
+
+    def __init__(self, store: Optional[DeduplicationStore] = None):
+        self.store = store if store is not None else MemoryDeduplicationStore()
+        self.hits = 0
+        self.misses = 0
+        self.retries = 0
+
+    def is_duplicate(self, envelope: dict, headers: Mapping[str, str]) -> bool:
+        """Records the event, reporting whether it was received before.
+
+        Args:
+            envelope (dict): The payload Slack sent. e.g. {"event_id": "Ev1", ...}
+            headers (dict): The request headers.
+
+        Returns:
+            True if the event was already delivered.
+        """
+        if "X-Slack-Retry-Num" in headers or "x-slack-retry-num" in headers:
+            self.retries += 1
+        event_id = envelope.get("event_id")
+        if event_id is None:
+            return False
+        if self.store.add(event_id):
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def forget(self, envelope: dict):
+        """Forgets an event that couldn't be handled, so that its retry will be."""
+        event_id = envelope.get("event_id")
+        if event_id is not None:
+            self.store.discard(event_id)
@@ -0,0 +1,270 @@
+"""A Python module for receiving Slack's Events API and interactivity requests."""
+
+# Standard Imports
+import asyncio
+import collections
+import functools
+import inspect
+import json
+import logging
+from typing import DefaultDict, Optional, Tuple
+from urllib.parse import parse_qsl
+
+# ThirdParty Imports
+from aiohttp import web
+
+# Internal Imports
+from slack.callbacks import CallbackRegistry
+from slack.events.deduplication import EventDeduplicator
+from slack.signature import SignatureVerifier
+from slack.web.classes.interactions import parse_interactive_event
+from slack.web.client import WebClient
+
+
+class EventsApiReceiver(CallbackRegistry):
+    """An EventsApiReceiver is an HTTP endpoint for Slack's Events API.
+
+    Slack sends events, interactive payloads (e.g. button clicks and view
+    submissions) and slash commands to your app as HTTP requests. This
+    receiver verifies their signatures, answers Slack's `url_verification`
+    challenge and acknowledges each request as soon as it's queued, well
+    within Slack's 3 second window. Queued events are then handed to your
+    callbacks by a fixed number of workers.
+
+    Callbacks are linked to events the same way they are for the RTMClient,
+    with `run_on` or `on`, and receive the following keyword arguments:
+        receiver (EventsApiReceiver): This receiver.
+        web_client (WebClient): A client authenticated with `token`.
+        data (dict): The event. e.g. {"type": "app_mention", "text": "Hi"}
+        envelope (dict): The whole payload Slack sent, including e.g.
+            'team_id' and 'event_id'.
+        interaction (InteractiveEvent): For interactive payloads and slash
+            commands, the payload parsed by `slack.web.classes.interactions`
+            or None.
+
+    Events API events are dispatched by their type (e.g. 'app_mention'),
+    interactive payloads by theirs (e.g. 'block_actions') and slash commands
+    by the command (e.g. '/weather').
+
+    Attributes:
+        signing_secret (str): Your app's signing secret.
+        token (str): A string specifying an xoxp or xoxb token for the
+            WebClient passed to callbacks. Default is None.
+        path (str): The path Slack sends requests to. Default is '/slack/events'.
+        max_queue_size (int): The maximum number of events waiting for a
+            worker. When the queue is full requests are answered with a 503
+            so that Slack retries them later. Default is 1000.
+        workers (int): The number of events handled concurrently. Default is 10.
+        verifier (SignatureVerifier): Verifies the requests. Default is a
+            SignatureVerifier for `signing_secret`.
+        deduplicator (EventDeduplicator): Drops the events Slack delivers
+            again, e.g. when retrying. Duplicates are acknowledged but not
+            dispatched. Default is an EventDeduplicator keeping event ids in
+            memory.
+
+    Methods:
+        on: Stores and links callbacks to events.
+        run_on: Decorator that stores and links callbacks to events.
+        start: Runs an HTTP server for the receiver.
+
+    Example:
+    ```python
+    import os
+    from slack.events import EventsApiReceiver
+
+    @EventsApiReceiver.run_on(event="app_mention")
+    async def say_hello(**payload):
+        data = payload["data"]
+        web_client = payload["web_client"]
+        await web_client.chat_postMessage(channel=data["channel"], text="Hi!")
+
+    receiver = EventsApiReceiver(
+        signing_secret=os.environ["SLACK_SIGNING_SECRET"],
+        token=os.environ["SLACK_API_TOKEN"],
+    )
+    receiver.start(port=3000)
+    ```
+
+    Note:
+        Any attributes or methods prefixed with _underscores are
+        intended to be "private" internal use only. They may be changed or
+        removed at anytime.
+    """
+
+    _callbacks: DefaultDict = collections.defaultdict(list)
+
+    def __init__(
+        self,
+        *,
+        signing_secret: str,
+        token: Optional[str] = None,
+        path: str = "/slack/events",
+        max_queue_size: int = 1000,
+        workers: int = 10,
+        verifier: Optional[SignatureVerifier] = None,
+        deduplicator: Optional[EventDeduplicator] = None,
+        base_url: str = WebClient.BASE_URL,
+        headers: Optional[dict] = None,
+    ):
+        self.signing_secret = signing_secret
+        self.token = token
+        self.path = path
+        self.max_queue_size = max_queue_size
+        self.workers = workers
+        self.verifier = verifier or SignatureVerifier(signing_secret)
+        self.deduplicator = deduplicator or EventDeduplicator()
+        self.base_url = base_url
+        self.headers = headers or {}
+        self._logger = logging.getLogger(__name__)
+        self._queue = None
+        self._workers = []
+        self._web_client = None
+        self._app = None
+
+    @property
+    def app(self) -> web.Application:
+        """The aiohttp application serving the receiver.
+
+        Use this to mount the receiver in an existing aiohttp server.
+        """
+        if self._app is None:
+            self._app = web.Application()
+            self._app.router.add_post(self.path, self._handle_request)
+            self._app.on_startup.append(self._start_workers)
+            self._app.on_cleanup.append(self._stop_workers)
+        return self._app
+
+    def start(self, *, host: str = "0.0.0.0", port: int = 3000):
+        """Runs an HTTP server for the receiver until it's interrupted.
+
+        Args:
+            host (str): The interface to listen on. Default is '0.0.0.0'.
+            port (int): The port to listen on. Default is 3000.
+        """
+        web.run_app(self.app, host=host, port=port)
+
+    async def _start_workers(self, app):
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._web_client = WebClient(
+            token=self.token,
+            base_url=self.base_url,
+            run_async=True,
+            loop=asyncio.get_event_loop(),
+            headers=self.headers,
+        )
+        self._workers = [
+            asyncio.ensure_future(self._work()) for _ in range(self.workers)
+        ]
+
+    async def _stop_workers(self, app):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _handle_request(self, request: web.Request) -> web.Response:
+        """Verifies, acknowledges and queues a request sent from Slack."""
+        body = await request.read()
+        if not self.verifier.is_valid_request(body, request.headers):
+            self._logger.warning("Received a request with an invalid signature.")
+            return web.Response(status=401)
+
+        try:
+            event, kwargs = self._parse_request(body, request.content_type)
+        except ValueError:
+            return web.Response(status=400)
+        if event == "url_verification":
+            return web.json_response({"challenge": kwargs["data"].get("challenge")})
+
+        envelope = kwargs["envelope"]
+        if self.deduplicator.is_duplicate(envelope, request.headers):
+            self._logger.debug("Dropping duplicate event '%s'.", envelope["event_id"])
+            return web.Response()
+
+        try:
+            self._queue.put_nowait((event, kwargs))
+        except asyncio.QueueFull:
+            self._logger.warning("The event queue is full. Dropping '%s'.", event)
+            # Let Slack's retry of this event through.
+            self.deduplicator.forget(envelope)
+            return web.Response(status=503)
+        return web.Response()
+
+    @staticmethod
+    def _parse_request(body: bytes, content_type: str) -> Tuple[str, dict]:
+        """Extracts the event to dispatch and its callback arguments.
+
+        Returns:
+            A tuple of the event and the keyword arguments for its callbacks.
+            e.g. ('app_mention', {'data': {...}, 'envelope': {...}})
+
+        Raises:
+            ValueError: The body isn't a payload Slack sends.
+        """
+        if content_type == "application/json":
+            envelope = json.loads(body)
+            if not isinstance(envelope, dict):
+                raise ValueError("The body isn't a JSON object.")
+            if envelope.get("type") == "url_verification":
+                return "url_verification", {"data": envelope, "envelope": envelope}
+            data = envelope.get("event")
+            if not isinstance(data, dict) or "type" not in data:
+                raise ValueError("The body doesn't contain an event.")
+            return data["type"], {"data": data, "envelope": envelope}
+
+        form = dict(parse_qsl(body.decode("utf-8")))
+        if "payload" in form:
+            # Interactive components send their payload as a JSON form field.
+            payload = json.loads(form["payload"])
+            if not isinstance(payload, dict):
+                raise ValueError("The payload isn't a JSON object.")
+            event = payload.get("type")
+        elif "command" in form:
+            payload = form
+            event = payload["command"]
+        else:
+            raise ValueError("The body isn't an interactive payload or command.")
+        return (
+            event,
+            {
+                "data": payload,
+                "envelope": payload,
+                "interaction": parse_interactive_event(payload),
+            },
+        )
+
+    async def _work(self):
+        """Dispatches queued events until the worker is cancelled."""
+        while True:
+            event, kwargs = await self._queue.get()
+            try:
+                await self._dispatch_event(event, **kwargs)
+            except Exception:
+                self._logger.exception("Failed to handle the '%s' event.", event)
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch_event(self, event, **kwargs):
+        """Executes the callbacks linked to the event.
+
+        Coroutine callbacks run on the event loop with an async WebClient.
+        Other callbacks run in the loop's default executor with a WebClient
+        of their own, so that they don't block the loop.
+
+        Args:
+            event (str): The type of event. e.g. 'app_mention'
+            kwargs: The data, envelope and interaction to pass along.
+        """
+        for callback in self._callbacks[event]:
+            if inspect.iscoroutinefunction(callback):
+                await callback(receiver=self, web_client=self._web_client, **kwargs)
+            else:
+                web_client = WebClient(
+                    token=self.token, base_url=self.base_url, headers=self.headers
+                )
+                await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    functools.partial(
+                        callback, receiver=self, web_client=web_client, **kwargs
+                    ),
+                )
@@ -0,0 +1,420 @@
+"""A Python module for instrumenting the clients with metrics and traces.
+
+The WebClient and the RTMClient report to an `Instrumentation`, whose hooks
+do nothing unless they're overridden. Clients without one (the default)
+skip the hooks entirely. PrometheusInstrumentation and
+OpenTelemetryInstrumentation report to those libraries, which are optional
+dependencies: `pip install slackclient[prometheus]` or
+`pip install slackclient[opentelemetry]`. TransferStats keeps totals of
+the bytes each method received, without any dependency.
+
+Example:
+```python
+instrumentation = PrometheusInstrumentation()
+web_client = WebClient(token=slack_token, instrumentation=instrumentation)
+rtm_client = RTMClient(token=slack_token, instrumentation=instrumentation)
+prometheus_client.start_http_server(8000)
+```
+"""
+
+# Standard Imports
+from typing import Any, Dict, List, NamedTuple, Optional
+
+
+class RequestMetrics(NamedTuple):
+    """The measurements of a Web API request.
+
+    Attributes:
+        method (str): The Web API method. e.g. 'chat.postMessage'
+        http_verb (str): The HTTP verb. e.g. 'POST'
+        status_code (int): The HTTP status code, or 0 if the request failed
+            without a response.
+        duration (float): The number of seconds from sending the request to
+            receiving the whole response.
+        bytes_sent (int): The size of the request body, as the transport
+            encoded it, or None if it's unknown (e.g. the request failed).
+        bytes_received (int): The size of the response body, decompressed.
+        connection_reused (bool): Whether the request was sent over a
+            connection a previous request used, or None if the transport
+            doesn't tell.
+        error (str): The name of the exception raised by the transport, or
+            the 'error' of a response that isn't ok. e.g. 'ratelimited'
+        bytes_transferred (int): The size of the response body as it was
+            received, e.g. gzip compressed, or None if it's unknown.
+    """
+
+    method: str
+    http_verb: str
+    status_code: int
+    duration: float
+    bytes_sent: Optional[int]
+    bytes_received: int
+    connection_reused: Optional[bool]
+    error: Optional[str]
+    bytes_transferred: Optional[int] = None
+
+
+class Instrumentation:
+    """The hooks the clients report to. Every hook does nothing by default."""
+
+    def request_started(self, method: str) -> Any:
+        """A Web API request is about to be sent.
+
+        Returns:
+            Any context the instrumentation needs back when the request
+            ends, e.g. a tracing span.
+        """
+        return None
+
+    def request_ended(self, metrics: RequestMetrics, context: Any):
+        """A Web API request received its response, or failed."""
+
+    def retry_scheduled(self, method: str, attempt: int, wait: float):
+        """A rate limited request will be sent again after `wait` seconds.
+
+        Args:
+            attempt (int): The number of the coming attempt, from 1.
+        """
+
+    def rtm_connected(self, attempt: int):
+        """The RTMClient connected. Attempts after the first are reconnections."""
+
+    def rtm_event_dispatched(self, event: str, latency: float):
+        """An RTM event is dispatched to its callbacks.
+
+        Args:
+            event (str): The event's type. e.g. 'message'
+            latency (float): The number of seconds since its frame was received.
+        """
+
+    def rtm_callback_ran(self, event: str, callback: str, duration: float):
+        """An RTM callback returned (or raised) after `duration` seconds."""
+
+
+class MethodTransfers(NamedTuple):
+    """The totals of the responses a Web API method received.
+
+    Attributes:
+        method (str): The Web API method. e.g. 'users.list'
+        requests (int): The number of responses.
+        bytes_received (int): Their body bytes, decompressed.
+        bytes_transferred (int): Their body bytes as received, e.g.
+            compressed. Responses whose transferred size is unknown count
+            their decompressed size.
+    """
+
+    method: str
+    requests: int
+    bytes_received: int
+    bytes_transferred: int
+
+
+class TransferStats(Instrumentation):
+    """Totals the response bytes of each Web API method, to find the
+    heaviest calls.
+
+    Example:
+    ```python
+    stats = TransferStats()
+    client = WebClient(token=slack_token, instrumentation=stats)
+    ...
+    for method in stats.heaviest(5):
+        print(method.method, method.bytes_transferred, method.bytes_received)
+    ```
+    """
+
+    def __init__(self):
+        # The method mapped to its requests, received and transferred bytes.
+        self._totals: Dict[str, List[int]] = {}
+
+    def request_ended(self, metrics, context):
+        totals = self._totals.get(metrics.method)
+        if totals is None:
+            totals = self._totals[metrics.method] = [0, 0, 0]
+        transferred = metrics.bytes_transferred
+        totals[0] += 1
+        totals[1] += metrics.bytes_received
+        totals[2] += metrics.bytes_received if transferred is None else transferred
+
+    def get(self, method: str) -> Optional[MethodTransfers]:
+        """The totals of a method, or None if it wasn't called."""
+        totals = self._totals.get(method)
+        if totals is None:
+            return None
+        return MethodTransfers(method, *totals)
+
+    def heaviest(self, count: int = 10) -> List[MethodTransfers]:
+        """The methods that transferred the most bytes, heaviest first."""
+        methods = [MethodTransfers(method, *t) for method, t in self._totals.items()]
+        methods.sort(key=lambda m: m.bytes_transferred, reverse=True)
+        return methods[:count]
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Reports to Prometheus metrics, with the prometheus_client library.
+
+    Metrics:
+        slack_api_requests_total (method, status): Requests sent.
+        slack_api_request_duration_seconds (method): Request durations.
+        slack_api_requests_in_flight (method): Requests awaiting responses.
+        slack_api_request_bytes_sent_total (method): Request body bytes.
+        slack_api_response_bytes_received_total (method): Response body
+            bytes, decompressed.
+        slack_api_response_bytes_transferred_total (method): Response body
+            bytes as received, e.g. compressed.
+        slack_api_connections_reused_total (method): Requests sent over a
+            connection that was already used.
+        slack_api_retries_total (method): Rate limited requests retried.
+        slack_api_rate_limit_wait_seconds_total (method): Time waited
+            before retrying rate limited requests.
+        slack_rtm_connections_total: RTM connections, reconnections included.
+        slack_rtm_events_total (event): RTM events received.
+        slack_rtm_dispatch_latency_seconds: Time from receiving an event's
+            frame to dispatching it.
+        slack_rtm_callback_duration_seconds (event, callback): Callback
+            durations.
+
+    Attributes:
+        registry (CollectorRegistry): The registry the metrics are in.
+            Default is prometheus_client's global registry.
+    """
+
+    def __init__(self, *, registry=None, namespace: str = "slack"):
+        try:
+            import prometheus_client as prometheus
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusInstrumentation requires prometheus_client. "
+                "Install it with: pip install slackclient[prometheus]"
+            ) from e
+        if registry is None:
+            registry = prometheus.REGISTRY
+        self.registry = registry
+
+        def metric(kind, name, documentation, labels=()):
+            return kind(
+                name, documentation, labels, namespace=namespace, registry=registry
+            )
+
+        Counter, Gauge, Histogram = (
+            prometheus.Counter,
+            prometheus.Gauge,
+            prometheus.Histogram,
+        )
+        self._requests = metric(
+            Counter, "api_requests", "Web API requests sent.", ("method", "status")
+        )
+        self._request_duration = metric(
+            Histogram,
+            "api_request_duration_seconds",
+            "Web API request durations.",
+            ("method",),
+        )
+        self._in_flight = metric(
+            Gauge,
+            "api_requests_in_flight",
+            "Web API requests awaiting their response.",
+            ("method",),
+        )
+        self._bytes_sent = metric(
+            Counter, "api_request_bytes_sent", "Request body bytes.", ("method",)
+        )
+        self._bytes_received = metric(
+            Counter,
+            "api_response_bytes_received",
+            "Response body bytes, decompressed.",
+            ("method",),
+        )
+        self._bytes_transferred = metric(
+            Counter,
+            "api_response_bytes_transferred",
+            "Response body bytes as received, e.g. compressed.",
+            ("method",),
+        )
+        self._connections_reused = metric(
+            Counter,
+            "api_connections_reused",
+            "Requests sent over a connection that was already used.",
+            ("method",),
+        )
+        self._retries = metric(
+            Counter, "api_retries", "Rate limited requests retried.", ("method",)
+        )
+        self._rate_limit_wait = metric(
+            Counter,
+            "api_rate_limit_wait_seconds",
+            "Time waited before retrying rate limited requests.",
+            ("method",),
+        )
+        self._rtm_connections = metric(
+            Counter, "rtm_connections", "RTM connections, reconnections included."
+        )
+        self._rtm_events = metric(
+            Counter, "rtm_events", "RTM events received.", ("event",)
+        )
+        self._rtm_dispatch_latency = metric(
+            Histogram,
+            "rtm_dispatch_latency_seconds",
+            "Time from receiving an RTM event's frame to dispatching it.",
+        )
+        self._rtm_callback_duration = metric(
+            Histogram,
+            "rtm_callback_duration_seconds",
+            "RTM callback durations.",
+            ("event", "callback"),
+        )
+
+    def request_started(self, method):
+        self._in_flight.labels(method).inc()
+
+    def request_ended(self, metrics, context):
+        method = metrics.method
+        self._in_flight.labels(method).dec()
+        self._requests.labels(method, str(metrics.status_code)).inc()
+        self._request_duration.labels(method).observe(metrics.duration)
+        if metrics.bytes_sent:
+            self._bytes_sent.labels(method).inc(metrics.bytes_sent)
+        self._bytes_received.labels(method).inc(metrics.bytes_received)
+        if metrics.bytes_transferred is not None:
+            self._bytes_transferred.labels(method).inc(metrics.bytes_transferred)
+        if metrics.connection_reused:
+            self._connections_reused.labels(method).inc()
+
+    def retry_scheduled(self, method, attempt, wait):
+        self._retries.labels(method).inc()
+        self._rate_limit_wait.labels(method).inc(wait)
+
+    def rtm_connected(self, attempt):
+        self._rtm_connections.inc()
+
+    def rtm_event_dispatched(self, event, latency):
+        self._rtm_events.labels(event).inc()
+        self._rtm_dispatch_latency.observe(latency)
+
+    def rtm_callback_ran(self, event, callback, duration):
+        self._rtm_callback_duration.labels(event, callback).observe(duration)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports to OpenTelemetry metrics, and traces Web API requests.
+
+    Each request is a client span named after its method (e.g.
+    'slack chat.postMessage'). The metrics are named like those of
+    PrometheusInstrumentation, with dots (e.g. 'slack.api.request.duration'),
+    their labels being attributes.
+
+    Attributes:
+        tracer (Tracer): The tracer of the spans. Default is the global
+            tracer provider's.
+        meter (Meter): The meter of the metrics. Default is the global
+            meter provider's.
+    """
+
+    def __init__(self, *, tracer=None, meter=None):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api. "
+                "Install it with: pip install slackclient[opentelemetry]"
+            ) from e
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(__name__)
+        self.meter = meter = meter or metrics.get_meter(__name__)
+        self._requests = meter.create_counter(
+            "slack.api.requests", description="Web API requests sent."
+        )
+        self._request_duration = meter.create_histogram(
+            "slack.api.request.duration", unit="s", description="Request durations."
+        )
+        self._in_flight = meter.create_up_down_counter(
+            "slack.api.requests.in_flight",
+            description="Web API requests awaiting their response.",
+        )
+        self._bytes_sent = meter.create_counter(
+            "slack.api.request.bytes_sent", unit="By", description="Request bytes."
+        )
+        self._bytes_received = meter.create_counter(
+            "slack.api.response.bytes_received",
+            unit="By",
+            description="Response body bytes, decompressed.",
+        )
+        self._bytes_transferred = meter.create_counter(
+            "slack.api.response.bytes_transferred",
+            unit="By",
+            description="Response body bytes as received, e.g. compressed.",
+        )
+        self._connections_reused = meter.create_counter(
+            "slack.api.connections_reused",
+            description="Requests sent over a connection that was already used.",
+        )
+        self._retries = meter.create_counter(
+            "slack.api.retries", description="Rate limited requests retried."
+        )
+        self._rate_limit_wait = meter.create_counter(
+            "slack.api.rate_limit_wait",
+            unit="s",
+            description="Time waited before retrying rate limited requests.",
+        )
+        self._rtm_connections = meter.create_counter(
+            "slack.rtm.connections",
+            description="RTM connections, reconnections included.",
+        )
+        self._rtm_events = meter.create_counter(
+            "slack.rtm.events", description="RTM events received."
+        )
+        self._rtm_dispatch_latency = meter.create_histogram(
+            "slack.rtm.dispatch_latency",
+            unit="s",
+            description="Time from receiving an RTM event's frame to dispatching it.",
+        )
+        self._rtm_callback_duration = meter.create_histogram(
+            "slack.rtm.callback.duration",
+            unit="s",
+            description="RTM callback durations.",
+        )
+
+    def request_started(self, method):
+        self._in_flight.add(1, {"method": method})
+        return self.tracer.start_span(
+            f"slack {method}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={"slack.method": method},
+        )
+
+    def request_ended(self, metrics, context):
+        attributes = {"method": metrics.method}
+        self._in_flight.add(-1, attributes)
+        self._requests.add(1, {**attributes, "status": metrics.status_code})
+        self._request_duration.record(metrics.duration, attributes)
+        if metrics.bytes_sent:
+            self._bytes_sent.add(metrics.bytes_sent, attributes)
+        self._bytes_received.add(metrics.bytes_received, attributes)
+        if metrics.bytes_transferred is not None:
+            self._bytes_transferred.add(metrics.bytes_transferred, attributes)
+        if metrics.connection_reused:
+            self._connections_reused.add(1, attributes)
+
+        span = context
+        span.set_attribute("http.request.method", metrics.http_verb)
+        span.set_attribute("http.response.status_code", metrics.status_code)
+        if metrics.error is not None:
+            span.set_attribute("error.type", metrics.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+    def retry_scheduled(self, method, attempt, wait):
+        self._retries.add(1, {"method": method})
+        self._rate_limit_wait.add(wait, {"method": method})
+
+    def rtm_connected(self, attempt):
+        self._rtm_connections.add(1)
+
+    def rtm_event_dispatched(self, event, latency):
+        self._rtm_events.add(1, {"event": event})
+        self._rtm_dispatch_latency.record(latency)
+
+    def rtm_callback_ran(self, event, callback, duration):
+        self._rtm_callback_duration.record(
+            duration, {"event": event, "callback": callback}
+        )
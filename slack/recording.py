@@ -0,0 +1,232 @@
+"""A Python module for recording Slack traffic and replaying it offline.
+
+Web API calls are recorded by wrapping a client's transport in a
+RecordingTransport, and served back by a ReplayTransport. RTM events are
+recorded by an RTMClient's FrameRecorder, and can be sent again by the
+emulator of the tests (`SlackEmulator.replay`).
+
+Recordings are gzipped files of JSON lines, one per request or frame, each
+with the number of seconds since the recording started ('t').
+
+Example:
+```python
+# Once, against Slack:
+transport = RecordingTransport(AiohttpTransport(), "traffic.jsonl.gz")
+client = WebClient(token=os.environ["SLACK_API_TOKEN"], transport=transport)
+...
+asyncio.get_event_loop().run_until_complete(transport.close())
+
+# Then, offline, as often as needed:
+client = WebClient(token="xoxb-1", transport=ReplayTransport("traffic.jsonl.gz"))
+```
+"""
+
+# Standard Imports
+import asyncio
+import base64
+import collections
+import gzip
+import hashlib
+import json
+import time
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+# ThirdParty Imports
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Internal Imports
+from slack.web.transports import Transport, TransportResponse
+import slack.errors as err
+
+
+class RecordWriter:
+    """Appends records to a recording, as gzipped JSON lines.
+
+    Attributes:
+        path (str): The path of the recording.
+        records (int): The number of records written.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._start = time.monotonic()
+
+    def write(self, record: dict):
+        record = {"t": round(time.monotonic() - self._start, 6), **record}
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.records += 1
+
+    def close(self):
+        self._file.close()
+
+
+def read_records(path: str) -> Iterator[dict]:
+    """Reads the records of a recording, in the order they were written."""
+    with gzip.open(path, "rt", encoding="utf-8") as recording:
+        for line in recording:
+            yield json.loads(line)
+
+
+def request_key(http_verb: str, api_url: str, req_args: dict) -> str:
+    """Identifies a request by its method and arguments.
+
+    Headers (and so tokens) and the contents of files are left out, so
+    that a recording can be replayed with other tokens.
+
+    Returns:
+        A hash of the request. e.g. 'a6e0b6c5e87aafd6b8e57dd7ec7b31c3ae0e4c5b'
+    """
+    data = req_args.get("data")
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if not hasattr(v, "read")}
+    elif isinstance(data, (bytes, str)):
+        # An encoded body, e.g. the JSON of `chat_post_many`.
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        data = hashlib.sha1(data).hexdigest()
+    elif data is not None:
+        data = repr(type(data))
+    arguments = [
+        http_verb,
+        urlsplit(api_url).path.rsplit("/", 1)[-1],
+        req_args.get("params"),
+        req_args.get("json"),
+        data,
+    ]
+    canonical = json.dumps(arguments, sort_keys=True, default=str)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+class RecordingTransport(Transport):
+    """Records the requests sent through another transport, and their responses.
+
+    Each record holds the API method, the request's key (see `request_key`),
+    the response's status, headers and body, and the request's latency.
+
+    Attributes:
+        transport (Transport): The transport requests are sent through.
+        writer (RecordWriter): The writer of the recording.
+    """
+
+    def __init__(self, transport: Transport, path: str):
+        self.transport = transport
+        self.writer = RecordWriter(path)
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        key = request_key(http_verb, api_url, req_args)
+        start = time.monotonic()
+        response = await self.transport.send(
+            http_verb=http_verb, api_url=api_url, req_args=req_args
+        )
+        latency = time.monotonic() - start
+        record = {
+            "method": urlsplit(api_url).path.rsplit("/", 1)[-1],
+            "key": key,
+            "status": response.status_code,
+            "headers": list(response.headers.items()),
+            "latency": round(latency, 6),
+        }
+        try:
+            record["body"] = response.body.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body_base64"] = base64.b64encode(response.body).decode("ascii")
+        self.writer.write(record)
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests with the responses of a recording.
+
+    A request is answered with the next response recorded for the same
+    method and arguments. Identical requests get the recorded responses in
+    order, the last one being repeated once they're used up. Requests whose
+    arguments weren't recorded (e.g. a message with another timestamp) get
+    the next response recorded for their method, unless `strict` is True.
+
+    Attributes:
+        latency (float): How much of the recorded latencies to wait before
+            answering: 1 reproduces them, 0 (the default) answers at once.
+        strict (bool): Whether requests must match a recorded request's
+            arguments. Default is False.
+        requests_replayed (int): The number of requests answered.
+    """
+
+    def __init__(self, path: str, *, latency: float = 0.0, strict: bool = False):
+        self.latency = latency
+        self.strict = strict
+        self.requests_replayed = 0
+        self._by_key: Dict[str, collections.deque] = collections.defaultdict(
+            collections.deque
+        )
+        self._by_method: Dict[str, collections.deque] = collections.defaultdict(
+            collections.deque
+        )
+        for record in read_records(path):
+            self._by_key[record["key"]].append(record)
+            self._by_method[record["method"]].append(record)
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        key = request_key(http_verb, api_url, req_args)
+        method = urlsplit(api_url).path.rsplit("/", 1)[-1]
+        record = self._next(self._by_key.get(key))
+        if record is None and not self.strict:
+            record = self._next(self._by_method.get(method))
+        if record is None:
+            raise err.SlackRequestError(
+                f"The recording has no response to the '{method}' request."
+            )
+
+        if self.latency:
+            await asyncio.sleep(record["latency"] * self.latency)
+        self.requests_replayed += 1
+        if "body" in record:
+            body = record["body"].encode("utf-8")
+        else:
+            body = base64.b64decode(record["body_base64"])
+        headers = CIMultiDictProxy(CIMultiDict(record["headers"]))
+        return TransportResponse(record["status"], headers, body)
+
+    @staticmethod
+    def _next(records: Optional[collections.deque]) -> Optional[dict]:
+        if not records:
+            return None
+        if len(records) > 1:
+            return records.popleft()
+        return records[0]
+
+
+class FrameRecorder:
+    """Records the frames an RTMClient receives.
+
+    Example:
+    ```python
+    recorder = FrameRecorder("events.jsonl.gz")
+    rtm_client = RTMClient(token=slack_token, frame_recorder=recorder)
+    ...
+    recorder.close()
+    ```
+
+    Attributes:
+        writer (RecordWriter): The writer of the recording.
+    """
+
+    def __init__(self, path: str):
+        self.writer = RecordWriter(path)
+
+    def record(self, frame: str):
+        """Records the text of a frame."""
+        self.writer.write({"frame": frame})
+
+    def close(self):
+        self.writer.close()
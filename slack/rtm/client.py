@@ -8,7 +8,8 @@ import collections
 import concurrent
 import inspect
 import signal
-from typing import Optional, Callable, DefaultDict
+import time
+from typing import Optional, DefaultDict, TYPE_CHECKING
 from ssl import SSLContext
 
 # ThirdParty Imports
@@ -16,11 +17,18 @@ import asyncio
 import aiohttp
 
 # Internal Imports
+from slack.callbacks import CallbackRegistry
+from slack.instrumentation import Instrumentation
 from slack.web.client import WebClient
+from slack.web.entity_cache import EntityCache
 import slack.errors as client_err
+import slack.rtm.snapshot as rtm_snapshot
 
+if TYPE_CHECKING:
+    from slack.recording import FrameRecorder
 
-class RTMClient(object):
+
+class RTMClient(CallbackRegistry):
     """An RTMClient allows apps to communicate with the Slack Platform's RTM API.
 
     The event-driven architecture of this client allows you to simply
@@ -55,6 +63,22 @@ class RTMClient(object):
         loop (AbstractEventLoop): An event loop provided by asyncio.
             If None is specified we attempt to use the current loop
             with `get_event_loop`. Default is None.
+        entity_cache (EntityCache): A cache of the workspace's users,
+            conversations and bots, shared with the WebClients passed to
+            callbacks. It's seeded with the initial state when connecting
+            with `rtm.start` and kept up to date as events come in.
+            Default is None.
+        compact_snapshot (bool): When true, the 'users', 'channels',
+            'groups', 'ims' and 'bots' lists of the initial state are stored
+            in `slack.rtm.snapshot.EntityTable`s. They use a fraction of the
+            memory of the decoded lists on large workspaces, and decode
+            records as they're accessed. Default is False.
+        frame_recorder (FrameRecorder): Records the text frames received,
+            to replay them offline. See `slack.recording`. Default is None.
+        instrumentation (Instrumentation): Receives the connections, the
+            events dispatched and the durations of callbacks, and the
+            measurements of the WebClients' requests. See
+            `slack.instrumentation`. Default is None.
 
     Methods:
         ping: Sends a ping message over the websocket to Slack.
@@ -115,6 +139,10 @@ class RTMClient(object):
         ping_interval: Optional[int] = 30,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         headers: Optional[dict] = {},
+        entity_cache: Optional[EntityCache] = None,
+        compact_snapshot: Optional[bool] = False,
+        frame_recorder: Optional["FrameRecorder"] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self.token = token
         self.run_async = run_async
@@ -126,6 +154,10 @@ class RTMClient(object):
         self.connect_method = connect_method
         self.ping_interval = ping_interval
         self.headers = headers
+        self.entity_cache = entity_cache
+        self.compact_snapshot = compact_snapshot
+        self.frame_recorder = frame_recorder
+        self.instrumentation = instrumentation
         self._event_loop = loop or asyncio.get_event_loop()
         self._web_client = None
         self._websocket = None
@@ -135,40 +167,6 @@ class RTMClient(object):
         self._connection_attempts = 0
         self._stopped = False
 
-    @staticmethod
-    def run_on(*, event: str):
-        """A decorator to store and link a callback to an event."""
-
-        def decorator(callback):
-            RTMClient.on(event=event, callback=callback)
-            return callback
-
-        return decorator
-
-    @classmethod
-    def on(cls, *, event: str, callback: Callable):
-        """Stores and links the callback(s) to the event.
-
-        Args:
-            event (str): A string that specifies a Slack or websocket event.
-                e.g. 'channel_joined' or 'open'
-            callback (Callable): Any object or a list of objects that can be called.
-                e.g. <function say_hello at 0x101234567> or
-                [<function say_hello at 0x10123>,<function say_bye at 0x10456>]
-
-        Raises:
-            SlackClientError: The specified callback is not callable.
-            SlackClientError: The callback must accept keyword arguments (**kwargs).
-        """
-        if isinstance(callback, list):
-            for cb in callback:
-                cls._validate_callback(cb)
-            previous_callbacks = cls._callbacks[event]
-            cls._callbacks[event] = list(set(previous_callbacks + callback))
-        else:
-            cls._validate_callback(callback)
-            cls._callbacks[event].append(callback)
-
     def start(self) -> asyncio.Future:
         """Starts an RTM Session with Slack.
 
@@ -266,32 +264,6 @@ class RTMClient(object):
         payload = {"id": self._next_msg_id(), "type": "typing", "channel": channel}
         await self._send_json(payload=payload)
 
-    @staticmethod
-    def _validate_callback(callback):
-        """Checks if the specified callback is callable and accepts a kwargs param.
-
-        Args:
-            callback (obj): Any object or a list of objects that can be called.
-                e.g. <function say_hello at 0x101234567>
-
-        Raises:
-            SlackClientError: The specified callback is not callable.
-            SlackClientError: The callback must accept keyword arguments (**kwargs).
-        """
-
-        cb_name = callback.__name__ if hasattr(callback, "__name__") else callback
-        if not callable(callback):
-            msg = "The specified callback '{}' is not callable.".format(cb_name)
-            raise client_err.SlackClientError(msg)
-        callback_params = inspect.signature(callback).parameters.values()
-        if not any(
-            param for param in callback_params if param.kind == param.VAR_KEYWORD
-        ):
-            msg = "The callback '{}' must accept keyword arguments (**kwargs).".format(
-                cb_name
-            )
-            raise client_err.SlackClientError(msg)
-
     def _next_msg_id(self):
         """Retrieves the next message id.
 
@@ -327,6 +299,11 @@ class RTMClient(object):
                 ) as session:
                     self._session = session
                     url, data = await self._retreive_websocket_info()
+                    if self.compact_snapshot:
+                        # Compacting large workspaces takes a while.
+                        data = await self._event_loop.run_in_executor(
+                            None, rtm_snapshot.compact_snapshot, data
+                        )
                     async with session.ws_connect(
                         url,
                         heartbeat=self.ping_interval,
@@ -335,6 +312,10 @@ class RTMClient(object):
                     ) as websocket:
                         self._logger.debug("The Websocket connection has been opened.")
                         self._websocket = websocket
+                        if self.instrumentation is not None:
+                            self.instrumentation.rtm_connected(
+                                self._connection_attempts
+                            )
                         await self._dispatch_event(event="open", data=data)
                         await self._read_messages()
                         # The websocket has been disconnected, or self._stopped is True
@@ -385,9 +366,14 @@ class RTMClient(object):
                 await self._dispatch_event(event="close")
                 return
             if message.type == aiohttp.WSMsgType.TEXT:
+                received_at = time.perf_counter()
+                if self.frame_recorder is not None:
+                    self.frame_recorder.record(message.data)
                 payload = message.json()
                 event = payload.pop("type", "Unknown")
-                await self._dispatch_event(event, data=payload)
+                if self.entity_cache is not None:
+                    self.entity_cache.handle_rtm_event(event, payload)
+                await self._dispatch_event(event, data=payload, received_at=received_at)
             elif message.type == aiohttp.WSMsgType.ERROR:
                 self._logger.error("Received an error on the websocket: %r", message)
                 await self._dispatch_event(event="error", data=message)
@@ -402,7 +388,7 @@ class RTMClient(object):
             else:
                 self._logger.debug("Received unhandled message type: %r", message)
 
-    async def _dispatch_event(self, event, data=None):
+    async def _dispatch_event(self, event, data=None, received_at=None):
         """Dispatches the event and executes any associated callbacks.
 
         Note: To prevent the app from crashing due to callback errors. We
@@ -419,19 +405,29 @@ class RTMClient(object):
                     "name": "hugbot"
                 }
             }
+            received_at (float): When the event's frame was received, as
+                given by `time.perf_counter()`.
         """
+        instrumentation = self.instrumentation
+        if instrumentation is not None and received_at is not None:
+            instrumentation.rtm_event_dispatched(
+                event, time.perf_counter() - received_at
+            )
         for callback in self._callbacks[event]:
             self._logger.debug(
                 "Running %s callbacks for event: '%s'",
                 len(self._callbacks[event]),
                 event,
             )
+            start = None
             try:
                 if self._stopped and event not in ["close", "error"]:
                     # Don't run callbacks if client was stopped unless they're
                     # close/error callbacks.
                     break
 
+                if instrumentation is not None:
+                    start = time.perf_counter()
                 if inspect.iscoroutinefunction(callback):
                     await callback(
                         rtm_client=self, web_client=self._web_client, data=data
@@ -444,6 +440,13 @@ class RTMClient(object):
                 msg = f"When calling '#{name}()' in the '{module}' module the following error was raised: {err}"
                 self._logger.error(msg)
                 raise
+            finally:
+                if start is not None:
+                    # e.g. functools.partial objects have no name.
+                    name = getattr(callback, "__name__", repr(callback))
+                    instrumentation.rtm_callback_ran(
+                        event, name, time.perf_counter() - start
+                    )
 
     def _execute_in_thread(self, callback, data):
         """Execute the callback in another thread. Wait for and return the results."""
@@ -453,6 +456,8 @@ class RTMClient(object):
             ssl=self.ssl,
             proxy=self.proxy,
             headers=self.headers,
+            entity_cache=self.entity_cache,
+            instrumentation=self.instrumentation,
         )
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             future = executor.submit(
@@ -495,6 +500,8 @@ class RTMClient(object):
                 loop=self._event_loop,
                 session=self._session,
                 headers=self.headers,
+                entity_cache=self.entity_cache,
+                instrumentation=self.instrumentation,
             )
         self._logger.debug("Retrieving websocket info.")
         if self.connect_method in ["rtm.start", "rtm_start"]:
@@ -505,6 +512,8 @@ class RTMClient(object):
         if url is None:
             msg = "Unable to retreive RTM URL from Slack."
             raise client_err.SlackApiError(message=msg, response=resp)
+        if self.entity_cache is not None:
+            self.entity_cache.seed(resp.data)
         return url, resp.data
 
     async def _wait_exponentially(self, exception, max_wait_time=300):
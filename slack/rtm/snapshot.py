@@ -0,0 +1,137 @@
+"""A Python module for storing the rtm.start snapshot compactly."""
+
+# Standard Imports
+import json
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Optional
+
+# The keys of the rtm.start payload holding lists of entities.
+SNAPSHOT_KEYS = ("users", "channels", "groups", "ims", "bots")
+
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Records are compressed with raw deflate (no header or checksum) against a
+# dictionary sampled from the first records of their table. Records of the
+# same kind share most of their keys and many values, so even small records
+# compress well. A larger dictionary makes every decompression slower.
+_WBITS = -zlib.MAX_WBITS
+_DICTIONARY_SAMPLES = 8
+_DICTIONARY_SIZE = 4096
+
+
+class EntityTable(Sequence):
+    """A read-only, memory efficient list of Slack entities. e.g. users
+
+    Decoded JSON objects are large: every record is a dict, and so is each
+    nested object (e.g. a user's 'profile'). An EntityTable keeps the records
+    as compressed JSON in a single buffer instead, and only decodes a record
+    when it's accessed. The ids and names are kept decoded, so that records
+    can be found without decoding any.
+
+    An EntityTable behaves like the list it replaces: it can be indexed and
+    iterated over, yielding dicts. Every access decodes a new dict, so
+    changes made to them aren't stored.
+
+    Attributes:
+        ids (list): The (interned) ids of the records, in order.
+        names (list): The (interned) names of the records, or None for
+            records without a name. e.g. ims
+    """
+
+    __slots__ = ("ids", "names", "_index", "_dictionary", "_buffer", "_offsets")
+
+    def __init__(self, records: Iterable[dict]):
+        intern = sys.intern
+        ids = []
+        names = []
+        encoded = []
+        for record in records:
+            ids.append(intern(record["id"]))
+            name = record.get("name")
+            names.append(intern(name) if isinstance(name, str) else None)
+            encoded.append(_encoder.encode(record).encode("utf-8"))
+        self.ids = ids
+        self.names = names
+        self._index = {entity_id: i for i, entity_id in enumerate(ids)}
+        self._dictionary = b"".join(encoded[:_DICTIONARY_SAMPLES])[-_DICTIONARY_SIZE:]
+
+        chunks = []
+        offsets = array("Q", [0])
+        end = 0
+        for chunk in encoded:
+            compressor = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION,
+                zlib.DEFLATED,
+                _WBITS,
+                zdict=self._dictionary,
+            )
+            chunk = compressor.compress(chunk) + compressor.flush()
+            chunks.append(chunk)
+            end += len(chunk)
+            offsets.append(end)
+        self._buffer = b"".join(chunks)
+        self._offsets = offsets
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EntityTable index out of range")
+        start, end = self._offsets[index], self._offsets[index + 1]
+        decompressor = zlib.decompressobj(_WBITS, zdict=self._dictionary)
+        return json.loads(decompressor.decompress(self._buffer[start:end]))
+
+    def __repr__(self):
+        return f"<EntityTable of {len(self)} records>"
+
+    def index_of(self, entity_id: str) -> int:
+        """Finds the position of a record.
+
+        Raises:
+            KeyError: No record has the id.
+        """
+        return self._index[entity_id]
+
+    def get(self, entity_id: str) -> Optional[dict]:
+        """Decodes the record with the id. e.g. 'U0123ABC'
+
+        Returns:
+            The record, or None if no record has the id.
+        """
+        index = self._index.get(entity_id)
+        if index is None:
+            return None
+        return self[index]
+
+    def name_of(self, entity_id: str) -> Optional[str]:
+        """Retrieves the name of a record, without decoding it."""
+        index = self._index.get(entity_id)
+        if index is None:
+            return None
+        return self.names[index]
+
+
+def compact_snapshot(data: dict) -> dict:
+    """Replaces the entity lists of an rtm.start payload with EntityTables.
+
+    Args:
+        data (dict): The payload. e.g. {"self": {...}, "users": [...], ...}
+
+    Returns:
+        A shallow copy of the payload, with its 'users', 'channels',
+        'groups', 'ims' and 'bots' lists stored in EntityTables.
+    """
+    compacted = dict(data)
+    for key in SNAPSHOT_KEYS:
+        records = data.get(key)
+        if isinstance(records, list):
+            compacted[key] = EntityTable(records)
+    return compacted
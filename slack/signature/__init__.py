@@ -0,0 +1 @@
+from slack.signature.verifier import SignatureVerifier  # noqa
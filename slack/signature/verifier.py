@@ -0,0 +1,177 @@
+"""A Python module for verifying requests sent from Slack."""
+
+# Standard Imports
+import hashlib
+import hmac
+import time
+from collections import deque
+from typing import Callable, Deque, Mapping, Optional, Set, Tuple, Union
+
+Body = Union[bytes, bytearray, memoryview, str]
+
+
+class SignatureVerifier:
+    """Verifies the X-Slack-Signature of requests sent from Slack.
+
+    Slack signs every HTTP request it sends to your app with your signing
+    secret. A SignatureVerifier is meant to be created once and reused for
+    every incoming request: the HMAC is keyed with the signing secret up
+    front, and request bodies are hashed as bytes without being decoded.
+
+    Besides checking the signature, requests are rejected when their
+    timestamp is further than `max_clock_skew` seconds away from the local
+    clock, and when their signature has already been seen in the same window.
+
+    https://api.slack.com/docs/verifying-requests-from-slack
+
+    Attributes:
+        max_clock_skew (int): The maximum age, in seconds, of a request
+            timestamp. Default is 300 (5 minutes), as recommended by Slack.
+        replay_cache_size (int): The maximum number of recently seen
+            signatures kept to detect replayed requests. Set this to 0 to
+            disable replay detection. Default is 10000.
+
+    Example:
+    ```python
+    import os
+    from slack.signature import SignatureVerifier
+
+    verifier = SignatureVerifier(os.environ["SLACK_SIGNING_SECRET"])
+
+    def handle(request):
+        if not verifier.is_valid_request(request.body, request.headers):
+            return 401
+    ```
+
+    Note:
+        Any attributes or methods prefixed with _underscores are
+        intended to be "private" internal use only. They may be changed or
+        removed at anytime.
+    """
+
+    def __init__(
+        self,
+        signing_secret: str,
+        *,
+        max_clock_skew: int = 60 * 5,
+        replay_cache_size: int = 10000,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_clock_skew = max_clock_skew
+        self.replay_cache_size = replay_cache_size
+        self._inner, self._outer = _prekeyed_sha256(str.encode(signing_secret))
+        self._clock = clock
+        # Recently seen signatures, and the same signatures in the order they
+        # were seen along with the time they can be forgotten.
+        self._seen_signatures: Set[str] = set()
+        self._signature_expiry: Deque[Tuple[float, str]] = deque()
+
+    def generate_signature(self, *, timestamp: Union[str, int], body: Body) -> str:
+        """Calculates the signature Slack sends for the given timestamp and body.
+
+        Args:
+            timestamp: from the 'X-Slack-Request-Timestamp' header
+            body: The raw body of the request.
+
+        Returns:
+            The signature. e.g. 'v0=a2114d57b48eac39b9ad189dd8316235a7b4a8d21a10bd27519666489c69b503'
+        """
+        if isinstance(body, str):
+            body = str.encode(body)
+        inner = self._inner.copy()
+        inner.update(b"v0:%s:" % str(timestamp).encode())
+        inner.update(body)
+        outer = self._outer.copy()
+        outer.update(inner.digest())
+        return "v0=" + outer.hexdigest()
+
+    def is_valid(
+        self, *, body: Body, timestamp: Optional[str], signature: Optional[str]
+    ) -> bool:
+        """Verifies a request from its raw body and signature headers.
+
+        Args:
+            body: The raw body of the request - no headers, just the body.
+            timestamp: from the 'X-Slack-Request-Timestamp' header
+            signature: from the 'X-Slack-Signature' header
+
+        Returns:
+            True if the signature matches, the request is recent enough
+            and the signature hasn't been seen before.
+        """
+        if timestamp is None or signature is None:
+            return False
+        try:
+            request_time = int(timestamp)
+        except ValueError:
+            return False
+        now = self._clock()
+        if abs(now - request_time) > self.max_clock_skew:
+            return False
+
+        calculated_signature = self.generate_signature(timestamp=timestamp, body=body)
+        if not hmac.compare_digest(calculated_signature, signature):
+            return False
+        if self.replay_cache_size > 0:
+            return self._remember(signature, now)
+        return True
+
+    def is_valid_request(self, body: Body, headers: Mapping[str, str]) -> bool:
+        """Verifies a request from its raw body and headers.
+
+        Args:
+            body: The raw body of the request.
+            headers: The request headers. e.g. aiohttp's `request.headers`
+
+        Returns:
+            True if the request was sent from Slack. See `is_valid`.
+        """
+        return self.is_valid(
+            body=body,
+            timestamp=_get_header(headers, "X-Slack-Request-Timestamp"),
+            signature=_get_header(headers, "X-Slack-Signature"),
+        )
+
+    def _remember(self, signature: str, now: float) -> bool:
+        """Records a valid signature, rejecting it if it was already seen.
+
+        Signatures are forgotten once their request could no longer pass the
+        timestamp check, or when the cache is full, oldest first.
+
+        Returns:
+            False if the signature is a replay.
+        """
+        seen = self._seen_signatures
+        expiry = self._signature_expiry
+        while expiry and (expiry[0][0] <= now or len(expiry) >= self.replay_cache_size):
+            seen.discard(expiry.popleft()[1])
+        if signature in seen:
+            return False
+        seen.add(signature)
+        # A request is valid for max_clock_skew seconds on either side of now.
+        expiry.append((now + 2 * self.max_clock_skew, signature))
+        return True
+
+
+def _prekeyed_sha256(key: bytes) -> Tuple["hashlib._Hash", "hashlib._Hash"]:
+    """Returns the inner and outer SHA-256 states of an HMAC keyed with `key`.
+
+    This is the HMAC construction from RFC 2104, as done by the hmac module.
+    Copying these states skips keying a new HMAC for every request, and is
+    cheaper than copying an `hmac.HMAC` object.
+    """
+    block_size = hashlib.sha256().block_size
+    if len(key) > block_size:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(block_size, b"\0")
+    inner = hashlib.sha256(bytes(byte ^ 0x36 for byte in key))
+    outer = hashlib.sha256(bytes(byte ^ 0x5C for byte in key))
+    return inner, outer
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Looks up a header whether or not the mapping is case insensitive."""
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
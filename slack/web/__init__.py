@@ -0,0 +1,24 @@
+from importlib import import_module
+
+_lazy_submodules = {
+    "api_methods",
+    "base_client",
+    "classes",
+    "client",
+    "client_pool",
+    "entity_cache",
+    "interceptors",
+    "payload_views",
+    "rate_limits",
+    "response_cache",
+    "slack_response",
+    "token_providers",
+    "transports",
+}
+
+
+def __getattr__(name):
+    """Imports the submodules when they're first accessed. e.g. slack.web.classes"""
+    if name in _lazy_submodules:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,1777 @@
+"""A declarative registry of the Slack Web API methods the WebClient supports.
+
+Every method the WebClient exposes is described once here by an `ApiMethod`
+spec. The WebClient generates its method wrappers from these specs, and any
+feature that needs to know how a method behaves (its HTTP verb, how the body
+is encoded, its rate limit tier or which key holds its paginated items)
+should look it up in `API_METHODS` rather than hard-coding it.
+"""
+
+# Standard Imports
+from inspect import Parameter, Signature
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+# How the arguments of a method are sent to Slack.
+JSON = "json"
+PARAMS = "params"
+DATA = "data"
+FILES = "files"
+
+# The kind of token a method requires. None means any token will do.
+USER_TOKEN = "user"
+
+# Slack's Web API rate limit tiers.
+# https://api.slack.com/docs/rate-limits#tiers
+TIER_SPECIAL = 0
+TIER_1 = 1
+TIER_2 = 2
+TIER_3 = 3
+TIER_4 = 4
+
+# The minimum number of requests per minute Slack allows for each tier.
+# Methods with special rate limits (e.g. chat.postMessage) are not listed.
+TIER_LIMITS = {TIER_1: 1, TIER_2: 20, TIER_3: 50, TIER_4: 100}
+
+
+class ApiMethod(NamedTuple):
+    """The specification of a single Slack Web API method.
+
+    Attributes:
+        name (str): The Slack API method name. e.g. 'chat.postMessage'
+        http_verb (str): The HTTP verb used to call the method. e.g. 'GET'
+        encoding (str): How the arguments are sent: JSON, PARAMS, DATA or FILES.
+        required (tuple): The keyword arguments that must be specified.
+        token_type (str): USER_TOKEN if the method can't be called with a bot
+            token, otherwise None.
+        rate_limit_tier (int): The Slack rate limit tier. e.g. TIER_3
+        pagination_key (str): The response key holding the items of a cursor
+            paginated method. e.g. 'members'
+        idempotent (bool): Whether the method only reads data, so that
+            identical calls may share a response. e.g. 'users.info'
+        doc (str): The docstring of the generated WebClient method.
+    """
+
+    name: str
+    http_verb: str = "POST"
+    encoding: str = JSON
+    required: Tuple[str, ...] = ()
+    token_type: Optional[str] = None
+    rate_limit_tier: int = TIER_3
+    pagination_key: Optional[str] = None
+    idempotent: bool = False
+    doc: Optional[str] = None
+
+    @property
+    def attr_name(self) -> str:
+        """The name of the WebClient method. e.g. 'chat_postMessage'"""
+        return self.name.replace(".", "_")
+
+
+_SELF_PARAMETER = Parameter("self", Parameter.POSITIONAL_OR_KEYWORD)
+_KWARGS_PARAMETER = Parameter("kwargs", Parameter.VAR_KEYWORD)
+
+
+def build_api_method(spec: ApiMethod) -> Callable:
+    """Generates a WebClient method from its specification.
+
+    The generated method accepts the required arguments, and any other
+    arguments the Slack API method supports, as keyword arguments. It returns
+    whatever `api_call` returns, i.e. a SlackResponse or a Future when the
+    client is run in async mode.
+
+    Args:
+        spec (ApiMethod): The specification of the method.
+
+    Returns:
+        The function to attach to the WebClient class.
+    """
+    attr_name = spec.attr_name
+    required = spec.required
+    validate_token = spec.token_type == USER_TOKEN
+    if spec.encoding == JSON:
+        encoding = "json"
+    elif spec.encoding in (PARAMS, DATA):
+        encoding = spec.encoding
+    else:
+        raise ValueError(f"The method '{spec.name}' requires a hand-written wrapper.")
+
+    def api_method(self, **kwargs):
+        missing = [arg for arg in required if arg not in kwargs]
+        if missing:
+            raise TypeError(
+                "{}() missing required keyword argument(s): {}".format(
+                    attr_name, ", ".join(f"'{arg}'" for arg in missing)
+                )
+            )
+        if validate_token:
+            self._validate_xoxp_token(attr_name)
+        return self.api_call(spec.name, http_verb=spec.http_verb, **{encoding: kwargs})
+
+    api_method.__name__ = attr_name
+    api_method.__qualname__ = f"WebClient.{attr_name}"
+    api_method.__doc__ = spec.doc
+    api_method.__signature__ = Signature(
+        [_SELF_PARAMETER]
+        + [Parameter(arg, Parameter.KEYWORD_ONLY) for arg in required]
+        + [_KWARGS_PARAMETER]
+    )
+    return api_method
+
+
+def install_api_methods(cls):
+    """Attaches a generated method for every registered API method to the class.
+
+    Methods the class defines itself are left untouched. This is how methods
+    that need custom argument handling (e.g. 'files_upload') are implemented.
+
+    Returns:
+        The class, so that this can be used as a class decorator.
+    """
+    for spec in API_METHODS.values():
+        if spec.attr_name not in cls.__dict__:
+            setattr(cls, spec.attr_name, build_api_method(spec))
+    return cls
+
+
+API_METHODS: Dict[str, ApiMethod] = {
+    spec.name: spec
+    for spec in (
+        ApiMethod(
+            "admin.apps.approve",
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+        ),
+        ApiMethod(
+            "admin.apps.requests.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            pagination_key="app_requests",
+            idempotent=True,
+            doc="""List app requests for a team/workspace.""",
+        ),
+        ApiMethod(
+            "admin.apps.restrict",
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Restrict an app for installation on a workspace.""",
+        ),
+        ApiMethod(
+            "admin.users.session.reset",
+            required=("user_id",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Wipes all valid sessions on all devices for a given user.
+
+            Args:
+                user_id (str): The ID of the user to wipe sessions for. e.g. 'W12345678'
+            """,
+        ),
+        ApiMethod(
+            "api.test",
+            rate_limit_tier=TIER_4,
+            doc="""Checks API calling code.""",
+        ),
+        ApiMethod(
+            "auth.revoke",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            doc="""Revokes a token.""",
+        ),
+        ApiMethod(
+            "auth.test",
+            rate_limit_tier=TIER_4,
+            doc="""Checks authentication & identity.""",
+        ),
+        ApiMethod(
+            "bots.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets information about a bot user.""",
+        ),
+        ApiMethod(
+            "channels.archive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Archives a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.create",
+            required=("name",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Creates a channel.
+
+            Args:
+                name (str): The name of the channel. e.g. 'mychannel'
+            """,
+        ),
+        ApiMethod(
+            "channels.history",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Fetches history of messages and events from a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets information about a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.invite",
+            required=("channel", "user"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Invites a user to a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                user (str): The user id. e.g. 'U1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.join",
+            required=("name",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Joins a channel, creating it if needed.
+
+            Args:
+                name (str): The channel name. e.g. '#general'
+            """,
+        ),
+        ApiMethod(
+            "channels.kick",
+            required=("channel", "user"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Removes a user from a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                user (str): The user id. e.g. 'U1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.leave",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Leaves a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "channels.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="channels",
+            idempotent=True,
+            doc="""Lists all channels in a Slack team.""",
+        ),
+        ApiMethod(
+            "channels.mark",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Sets the read cursor in a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                ts (str): Timestamp of the most recently seen message. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "channels.rename",
+            required=("channel", "name"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Renames a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                name (str): The new channel name. e.g. 'newchannel'
+            """,
+        ),
+        ApiMethod(
+            "channels.replies",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "thread_ts"),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve a thread of messages posted to a channel
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                thread_ts (str): The timestamp of an existing message with 0 or more replies.
+                    e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "channels.setPurpose",
+            required=("channel", "purpose"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the purpose for a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                purpose (str): The new purpose for the channel. e.g. 'My Purpose'
+            """,
+        ),
+        ApiMethod(
+            "channels.setTopic",
+            required=("channel", "topic"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the topic for a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                topic (str): The new topic for the channel. e.g. 'My Topic'
+            """,
+        ),
+        ApiMethod(
+            "channels.unarchive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Unarchives a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "chat.delete",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Deletes a message.
+
+            Args:
+                channel (str): Channel containing the message to be deleted. e.g. 'C1234567890'
+                ts (str): Timestamp of the message to be deleted. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "chat.deleteScheduledMessage",
+            required=("channel", "scheduled_message_id"),
+            rate_limit_tier=TIER_3,
+            doc="""Deletes a scheduled message.
+
+            Args:
+                channel (str): The channel the scheduled_message is posting to. e.g. 'C1234567890'
+                scheduled_message_id (str): scheduled_message_id returned from call to chat.scheduleMessage e.g. 'Q1234ABCD'
+            """,
+        ),
+        ApiMethod(
+            "chat.getPermalink",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "message_ts"),
+            rate_limit_tier=TIER_4,
+            idempotent=True,
+            doc="""Retrieve a permalink URL for a specific extant message
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                message_ts (str): The timestamp. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "chat.meMessage",
+            required=("channel", "text"),
+            rate_limit_tier=TIER_3,
+            doc="""Share a me message into a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                text (str): The message you'd like to share. e.g. 'Hello world'
+            """,
+        ),
+        ApiMethod(
+            "chat.postEphemeral",
+            required=("channel", "user"),
+            rate_limit_tier=TIER_4,
+            doc="""Sends an ephemeral message to a user in a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                user (str): The id of user who should see the message. e.g. 'U0BPQUNTA'
+                text (str): The message you'd like to share. e.g. 'Hello world'
+                    text is not required when presenting blocks.
+                blocks (list): A dictionary list of blocks.
+                    Blocks are required when not presenting text.
+                    e.g. [{"type": "section", "text": {"type": "plain_text", "text": "Hello world"}}]
+            """,
+        ),
+        ApiMethod(
+            "chat.postMessage",
+            required=("channel",),
+            rate_limit_tier=TIER_SPECIAL,
+            doc="""Sends a message to a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                text (str): The message you'd like to share. e.g. 'Hello world'
+                    text is not required when presenting blocks.
+                blocks (list): A dictionary list of blocks.
+                    Blocks are required when not presenting text.
+                    e.g. [{"type": "section", "text": {"type": "plain_text", "text": "Hello world"}}]
+            """,
+        ),
+        ApiMethod(
+            "chat.scheduleMessage",
+            required=("channel", "post_at", "text"),
+            rate_limit_tier=TIER_3,
+            doc="""Schedules a message.
+
+            Args:
+                channel (str): The channel the scheduled_message is posting to. e.g. 'C1234567890'
+                post_at (str): Unix EPOCH timestamp of time in future to send the message. e.g. '299876400'
+                text (str): The message you'd like to send. e.g. 'Hello world'
+            """,
+        ),
+        ApiMethod(
+            "chat.unfurl",
+            required=("channel", "ts", "unfurls"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Provide custom unfurl behavior for user-posted URLs.
+
+            Args:
+                channel (str): The Channel ID of the message. e.g. 'C1234567890'
+                ts (str): Timestamp of the message to add unfurl behavior to. e.g. '1234567890.123456'
+                unfurls (dict): a dict of the specific URLs you're offering an unfurl for.
+                    e.g. {"https://example.com/": {"text": "Every day is the test."}}
+            """,
+        ),
+        ApiMethod(
+            "chat.update",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Updates a message in a channel.
+
+            Args:
+                channel (str): The channel containing the message to be updated. e.g. 'C1234567890'
+                ts (str): Timestamp of the message to be updated. e.g. '1234567890.123456'
+                text (str): The message you'd like to share. e.g. 'Hello world'
+                    text is not required when presenting blocks.
+                blocks (list): A dictionary list of blocks.
+                    Blocks are required when not presenting text.
+                    e.g. [{"type": "section", "text": {"type": "plain_text", "text": "Hello world"}}]
+            """,
+        ),
+        ApiMethod(
+            "chat.scheduledMessages.list",
+            rate_limit_tier=TIER_3,
+            pagination_key="scheduled_messages",
+            doc="""Lists all scheduled messages.""",
+        ),
+        ApiMethod(
+            "conversations.archive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Archives a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.close",
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            doc="""Closes a direct message or multi-person direct message.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.create",
+            required=("name",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Initiates a public or private channel-based conversation
+
+            Args:
+                name (str): The name of the channel. e.g. 'mychannel'
+            """,
+        ),
+        ApiMethod(
+            "conversations.history",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            pagination_key="messages",
+            idempotent=True,
+            doc="""Fetches a conversation's history of messages and events.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve information about a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.invite",
+            required=("channel", "users"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Invites users to a channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                users (list): An list of user id's to invite. e.g. ['U2345678901', 'U3456789012']
+            """,
+        ),
+        ApiMethod(
+            "conversations.join",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Joins an existing conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.kick",
+            required=("channel", "user"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Removes a user from a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                user (str): The id of the user to kick. e.g. 'U2345678901'
+            """,
+        ),
+        ApiMethod(
+            "conversations.leave",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Leaves a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="channels",
+            idempotent=True,
+            doc="""Lists all channels in a Slack team.""",
+        ),
+        ApiMethod(
+            "conversations.members",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_4,
+            pagination_key="members",
+            idempotent=True,
+            doc="""Retrieve members of a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "conversations.open",
+            rate_limit_tier=TIER_3,
+            doc="""Opens or resumes a direct message or multi-person direct message.""",
+        ),
+        ApiMethod(
+            "conversations.rename",
+            required=("channel", "name"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Renames a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                name (str): The new channel name. e.g. 'newchannel'
+            """,
+        ),
+        ApiMethod(
+            "conversations.replies",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            pagination_key="messages",
+            idempotent=True,
+            doc="""Retrieve a thread of messages posted to a conversation
+
+            Args:
+                channel (str): Conversation ID to fetch thread from. e.g. 'C1234567890'
+                ts (str): Unique identifier of a thread's parent message. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "conversations.setPurpose",
+            required=("channel", "purpose"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the purpose for a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                purpose (str): The new purpose for the channel. e.g. 'My Purpose'
+            """,
+        ),
+        ApiMethod(
+            "conversations.setTopic",
+            required=("channel", "topic"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the topic for a conversation.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                topic (str): The new topic for the channel. e.g. 'My Topic'
+            """,
+        ),
+        ApiMethod(
+            "conversations.unarchive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Reverses conversation archival.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "dialog.open",
+            required=("dialog", "trigger_id"),
+            rate_limit_tier=TIER_4,
+            doc="""Open a dialog with a user.
+
+            Args:
+                dialog (dict): A dictionary of dialog arguments.
+                    {
+                        "callback_id": "46eh782b0",
+                        "title": "Request something",
+                        "submit_label": "Request",
+                        "state": "Max",
+                        "elements": [
+                            {
+                                "type": "text",
+                                "label": "Origin",
+                                "name": "loc_origin"
+                            },
+                            {
+                                "type": "text",
+                                "label": "Destination",
+                                "name": "loc_destination"
+                            }
+                        ]
+                    }
+                trigger_id (str): The trigger id of a recent message interaction.
+                    e.g. '12345.98765.abcd2358fdea'
+            """,
+        ),
+        ApiMethod(
+            "dnd.endDnd",
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Ends the current user's Do Not Disturb session immediately.""",
+        ),
+        ApiMethod(
+            "dnd.endSnooze",
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Ends the current user's snooze mode immediately.""",
+        ),
+        ApiMethod(
+            "dnd.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieves a user's current Do Not Disturb status.""",
+        ),
+        ApiMethod(
+            "dnd.setSnooze",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("num_minutes",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Turns on Do Not Disturb mode for the current user, or changes its duration.
+
+            Args:
+                num_minutes (int): The snooze duration. e.g. 60
+            """,
+        ),
+        ApiMethod(
+            "dnd.teamInfo",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Retrieves the Do Not Disturb status for users on a team.""",
+        ),
+        ApiMethod(
+            "emoji.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Lists custom emoji for a team.""",
+        ),
+        ApiMethod(
+            "files.comments.delete",
+            required=("file", "id"),
+            rate_limit_tier=TIER_2,
+            doc="""Deletes an existing comment on a file.
+
+            Args:
+                file (str): The file id. e.g. 'F1234467890'
+                id (str): The file comment id. e.g. 'Fc1234567890'
+            """,
+        ),
+        ApiMethod(
+            "files.delete",
+            required=("file",),
+            rate_limit_tier=TIER_3,
+            doc="""Deletes a file.
+
+            Args:
+                file (str): The file id. e.g. 'F1234467890'
+            """,
+        ),
+        ApiMethod(
+            "files.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("file",),
+            rate_limit_tier=TIER_4,
+            idempotent=True,
+            doc="""Gets information about a team file.
+
+            Args:
+                file (str): The file id. e.g. 'F1234467890'
+            """,
+        ),
+        ApiMethod(
+            "files.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Lists & filters team files.""",
+        ),
+        ApiMethod(
+            "files.remote.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Retrieve information about a remote file added to Slack.""",
+        ),
+        ApiMethod(
+            "files.remote.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="files",
+            idempotent=True,
+            doc="""Retrieve information about a remote file added to Slack.""",
+        ),
+        ApiMethod(
+            "files.remote.add",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("external_id", "external_url", "title"),
+            rate_limit_tier=TIER_2,
+            doc="""Adds a file from a remote service.
+
+            Args:
+                external_id (str): Creator defined GUID for the file. e.g. '123456'
+                external_url (str): URL of the remote file. e.g. 'http://example.com/my_cloud_service_file/abc123'
+                title (str): Title of the file being shared. e.g. 'Danger, High Voltage!'
+            """,
+        ),
+        ApiMethod(
+            "files.remote.update",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            doc="""Updates an existing remote file.""",
+        ),
+        ApiMethod(
+            "files.remote.remove",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            doc="""Remove a remote file.""",
+        ),
+        ApiMethod(
+            "files.remote.share",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channels",),
+            rate_limit_tier=TIER_2,
+            doc="""Share a remote file into a channel.
+
+            Args:
+                channels (list): Comma-separated list of channel IDs where the file will be shared.
+                    e.g. ['C1234567890', 'C2345678901']
+            """,
+        ),
+        ApiMethod(
+            "files.revokePublicURL",
+            required=("file",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Revokes public/external sharing access for a file
+
+            Args:
+                file (str): The file id. e.g. 'F1234467890'
+            """,
+        ),
+        ApiMethod(
+            "files.sharedPublicURL",
+            required=("file",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Enables a file for public/external sharing.
+
+            Args:
+                file (str): The file id. e.g. 'F1234467890'
+            """,
+        ),
+        ApiMethod(
+            "files.upload",
+            encoding=FILES,
+            rate_limit_tier=TIER_2,
+        ),
+        ApiMethod(
+            "groups.archive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Archives a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.create",
+            required=("name",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Creates a private channel.
+
+            Args:
+                name (str): The name of the private group. e.g. 'mychannel'
+            """,
+        ),
+        ApiMethod(
+            "groups.createChild",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Clones and archives a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.history",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Fetches history of messages and events from a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets information about a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.invite",
+            required=("channel", "user"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Invites a user to a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+                user (str): The user id. e.g. 'U1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.kick",
+            required=("channel", "user"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Removes a user from a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+                user (str): The user id. e.g. 'U1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.leave",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Leaves a private channel.
+
+            Args:
+                channel (str): The group id. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="groups",
+            idempotent=True,
+            doc="""Lists private channels that the calling user has access to.""",
+        ),
+        ApiMethod(
+            "groups.mark",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Sets the read cursor in a private channel.
+
+            Args:
+                channel (str): Private channel to set reading cursor in. e.g. 'C1234567890'
+                ts (str): Timestamp of the most recently seen message. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "groups.open",
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            doc="""Opens a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "groups.rename",
+            required=("channel", "name"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Renames a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                name (str): The new channel name. e.g. 'newchannel'
+            """,
+        ),
+        ApiMethod(
+            "groups.replies",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "thread_ts"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve a thread of messages posted to a private channel
+
+            Args:
+                channel (str): The channel id. e.g. 'C1234567890'
+                thread_ts (str): The timestamp of an existing message with 0 or more replies.
+                    e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "groups.setPurpose",
+            required=("channel", "purpose"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the purpose for a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'G1234567890'
+                purpose (str): The new purpose for the channel. e.g. 'My Purpose'
+            """,
+        ),
+        ApiMethod(
+            "groups.setTopic",
+            required=("channel", "topic"),
+            rate_limit_tier=TIER_2,
+            doc="""Sets the topic for a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'G1234567890'
+                topic (str): The new topic for the channel. e.g. 'My Topic'
+            """,
+        ),
+        ApiMethod(
+            "groups.unarchive",
+            required=("channel",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Unarchives a private channel.
+
+            Args:
+                channel (str): The channel id. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "im.close",
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            doc="""Close a direct message channel.
+
+            Args:
+                channel (str): Direct message channel to close. e.g. 'D1234567890'
+            """,
+        ),
+        ApiMethod(
+            "im.history",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Fetches history of messages and events from direct message channel.
+
+            Args:
+                channel (str): Direct message channel to fetch history from. e.g. 'D1234567890'
+            """,
+        ),
+        ApiMethod(
+            "im.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="ims",
+            idempotent=True,
+            doc="""Lists direct message channels for the calling user.""",
+        ),
+        ApiMethod(
+            "im.mark",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Sets the read cursor in a direct message channel.
+
+            Args:
+                channel (str): Direct message channel to set reading cursor in. e.g. 'D1234567890'
+                ts (str): Timestamp of the most recently seen message. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "im.open",
+            required=("user",),
+            rate_limit_tier=TIER_3,
+            doc="""Opens a direct message channel.
+
+            Args:
+                user (str): The user id to open a DM with. e.g. 'W1234567890'
+            """,
+        ),
+        ApiMethod(
+            "im.replies",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "thread_ts"),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve a thread of messages posted to a direct message conversation
+
+            Args:
+                channel (str): Direct message channel to fetch thread from. e.g. 'C1234567890'
+                thread_ts (str): The timestamp of an existing message with 0 or more replies.
+                    e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "migration.exchange",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("users",),
+            rate_limit_tier=TIER_2,
+            doc="""For Enterprise Grid workspaces, map local user IDs to global user IDs
+
+            Args:
+                users (list): A list of user ids, up to 400 per request.
+                    e.g. ['W1234567890', 'U2345678901', 'U3456789012']
+            """,
+        ),
+        ApiMethod(
+            "mpim.close",
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            doc="""Closes a multiparty direct message channel.
+
+            Args:
+                channel (str): Multiparty Direct message channel to close. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "mpim.history",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Fetches history of messages and events from a multiparty direct message.
+
+            Args:
+                channel (str): Multiparty direct message to fetch history for. e.g. 'G1234567890'
+            """,
+        ),
+        ApiMethod(
+            "mpim.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="groups",
+            idempotent=True,
+            doc="""Lists multiparty direct message channels for the calling user.""",
+        ),
+        ApiMethod(
+            "mpim.mark",
+            required=("channel", "ts"),
+            rate_limit_tier=TIER_3,
+            doc="""Sets the read cursor in a multiparty direct message channel.
+
+            Args:
+                channel (str): Multiparty direct message channel to set reading cursor in.
+                    e.g. 'G1234567890'
+                ts (str): Timestamp of the most recently seen message.
+                    e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "mpim.open",
+            required=("users",),
+            rate_limit_tier=TIER_3,
+            doc="""This method opens a multiparty direct message.
+
+            Args:
+                users (list): A lists of user ids. The ordering of the users
+                    is preserved whenever a MPIM group is returned.
+                    e.g. ['W1234567890', 'U2345678901', 'U3456789012']
+            """,
+        ),
+        ApiMethod(
+            "mpim.replies",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel", "thread_ts"),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve a thread of messages posted to a direct message conversation from a
+            multiparty direct message.
+
+            Args:
+                channel (str): Multiparty direct message channel to fetch thread from.
+                    e.g. 'G1234567890'
+                thread_ts (str): Unique identifier of a thread's parent message.
+                    e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "oauth.access",
+            encoding=DATA,
+            required=("client_id", "client_secret", "code"),
+            rate_limit_tier=TIER_4,
+        ),
+        ApiMethod(
+            "pins.add",
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            doc="""Pins an item to a channel.
+
+            Args:
+                channel (str): Channel to pin the item in. e.g. 'C1234567890'
+                file (str): File id to pin. e.g. 'F1234567890'
+                file_comment (str): File comment to pin. e.g. 'Fc1234567890'
+                timestamp (str): Timestamp of message to pin. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "pins.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Lists items pinned to a channel.
+
+            Args:
+                channel (str): Channel to get pinned items for. e.g. 'C1234567890'
+            """,
+        ),
+        ApiMethod(
+            "pins.remove",
+            required=("channel",),
+            rate_limit_tier=TIER_2,
+            doc="""Un-pins an item from a channel.
+
+            Args:
+                channel (str): Channel to pin the item in. e.g. 'C1234567890'
+                file (str): File id to pin. e.g. 'F1234567890'
+                file_comment (str): File comment to pin. e.g. 'Fc1234567890'
+                timestamp (str): Timestamp of message to pin. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "reactions.add",
+            required=("name",),
+            rate_limit_tier=TIER_3,
+            doc="""Adds a reaction to an item.
+
+            Args:
+                name (str): Reaction (emoji) name. e.g. 'thumbsup'
+                channel (str): Channel where the message to add reaction to was posted.
+                    e.g. 'C1234567890'
+                timestamp (str): Timestamp of the message to add reaction to. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "reactions.get",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets reactions for an item.""",
+        ),
+        ApiMethod(
+            "reactions.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="items",
+            idempotent=True,
+            doc="""Lists reactions made by a user.""",
+        ),
+        ApiMethod(
+            "reactions.remove",
+            required=("name",),
+            rate_limit_tier=TIER_2,
+            doc="""Removes a reaction from an item.
+
+            Args:
+                name (str): Reaction (emoji) name. e.g. 'thumbsup'
+            """,
+        ),
+        ApiMethod(
+            "reminders.add",
+            required=("text", "time"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Creates a reminder.
+
+            Args:
+                text (str): The content of the reminder. e.g. 'eat a banana'
+                time (str): When this reminder should happen:
+                    the Unix timestamp (up to five years from now e.g. '1602288000'),
+                    the number of seconds until the reminder (if within 24 hours),
+                    or a natural language description (Ex. 'in 15 minutes' or 'every Thursday')
+            """,
+        ),
+        ApiMethod(
+            "reminders.complete",
+            required=("reminder",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Marks a reminder as complete.
+
+            Args:
+                reminder (str): The ID of the reminder to be marked as complete.
+                    e.g. 'Rm12345678'
+            """,
+        ),
+        ApiMethod(
+            "reminders.delete",
+            required=("reminder",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Deletes a reminder.
+
+            Args:
+                reminder (str): The ID of the reminder. e.g. 'Rm12345678'
+            """,
+        ),
+        ApiMethod(
+            "reminders.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("reminder",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Gets information about a reminder.
+
+            Args:
+                reminder (str): The ID of the reminder. e.g. 'Rm12345678'
+            """,
+        ),
+        ApiMethod(
+            "reminders.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Lists all reminders created by or for a given user.""",
+        ),
+        ApiMethod(
+            "rtm.connect",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_1,
+            doc="""Starts a Real Time Messaging session.""",
+        ),
+        ApiMethod(
+            "rtm.start",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_1,
+            doc="""Starts a Real Time Messaging session.""",
+        ),
+        ApiMethod(
+            "search.all",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("query",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Searches for messages and files matching a query.
+
+            Args:
+                query (str): Search query. May contains booleans, etc.
+                    e.g. 'pickleface'
+            """,
+        ),
+        ApiMethod(
+            "search.files",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("query",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Searches for files matching a query.
+
+            Args:
+                query (str): Search query. May contains booleans, etc.
+                    e.g. 'pickleface'
+            """,
+        ),
+        ApiMethod(
+            "search.messages",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("query",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Searches for messages matching a query.
+
+            Args:
+                query (str): Search query. May contains booleans, etc.
+                    e.g. 'pickleface'
+            """,
+        ),
+        ApiMethod(
+            "stars.add",
+            rate_limit_tier=TIER_2,
+            doc="""Adds a star to an item.
+
+            Args:
+                channel (str): Channel to add star to, or channel where the message to add
+                    star to was posted (used with timestamp). e.g. 'C1234567890'
+                file (str): File to add star to. e.g. 'F1234567890'
+                file_comment (str): File comment to add star to. e.g. 'Fc1234567890'
+                timestamp (str): Timestamp of the message to add star to. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "stars.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            pagination_key="items",
+            idempotent=True,
+            doc="""Lists stars for a user.""",
+        ),
+        ApiMethod(
+            "stars.remove",
+            rate_limit_tier=TIER_2,
+            doc="""Removes a star from an item.
+
+            Args:
+                channel (str): Channel to remove star from, or channel where
+                    the message to remove star from was posted (used with timestamp). e.g. 'C1234567890'
+                file (str): File to remove star from. e.g. 'F1234567890'
+                file_comment (str): File comment to remove star from. e.g. 'Fc1234567890'
+                timestamp (str): Timestamp of the message to remove star from. e.g. '1234567890.123456'
+            """,
+        ),
+        ApiMethod(
+            "team.accessLogs",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Gets the access logs for the current team.""",
+        ),
+        ApiMethod(
+            "team.billableInfo",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Gets billable users information for the current team.""",
+        ),
+        ApiMethod(
+            "team.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets information about the current team.""",
+        ),
+        ApiMethod(
+            "team.integrationLogs",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""Gets the integration logs for the current team.""",
+        ),
+        ApiMethod(
+            "team.profile.get",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Retrieve a team's profile.""",
+        ),
+        ApiMethod(
+            "usergroups.create",
+            required=("name",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Create a User Group
+
+            Args:
+                name (str): A name for the User Group. Must be unique among User Groups.
+                    e.g. 'My Test Team'
+            """,
+        ),
+        ApiMethod(
+            "usergroups.disable",
+            required=("usergroup",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Disable an existing User Group
+
+            Args:
+                usergroup (str): The encoded ID of the User Group to disable.
+                    e.g. 'S0604QSJC'
+            """,
+        ),
+        ApiMethod(
+            "usergroups.enable",
+            required=("usergroup",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Enable a User Group
+
+            Args:
+                usergroup (str): The encoded ID of the User Group to enable.
+                    e.g. 'S0604QSJC'
+            """,
+        ),
+        ApiMethod(
+            "usergroups.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""List all User Groups for a team""",
+        ),
+        ApiMethod(
+            "usergroups.update",
+            required=("usergroup",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Update an existing User Group
+
+            Args:
+                usergroup (str): The encoded ID of the User Group to update.
+                    e.g. 'S0604QSJC'
+            """,
+        ),
+        ApiMethod(
+            "usergroups.users.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("usergroup",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            idempotent=True,
+            doc="""List all users in a User Group
+
+            Args:
+                usergroup (str): The encoded ID of the User Group to update.
+                    e.g. 'S0604QSJC'
+            """,
+        ),
+        ApiMethod(
+            "usergroups.users.update",
+            required=("usergroup", "users"),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Update the list of users for a User Group
+
+            Args:
+                usergroup (str): The encoded ID of the User Group to update.
+                    e.g. 'S0604QSJC'
+                users (list): A list user IDs that represent the entire list of
+                    users for the User Group. e.g. ['U060R4BJ4', 'U060RNRCZ']
+            """,
+        ),
+        ApiMethod(
+            "users.conversations",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_3,
+            pagination_key="channels",
+            idempotent=True,
+            doc="""List conversations the calling user may access.""",
+        ),
+        ApiMethod(
+            "users.deletePhoto",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+            doc="""Delete the user profile photo""",
+        ),
+        ApiMethod(
+            "users.getPresence",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("user",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Gets user presence information.
+
+            Args:
+                user (str): User to get presence info on. Defaults to the authed user.
+                    e.g. 'W1234567890'
+            """,
+        ),
+        ApiMethod(
+            "users.identity",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_4,
+            idempotent=True,
+            doc="""Get a user's identity.""",
+        ),
+        ApiMethod(
+            "users.info",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("user",),
+            rate_limit_tier=TIER_4,
+            idempotent=True,
+            doc="""Gets information about a user.
+
+            Args:
+                user (str): User to get info on.
+                    e.g. 'W1234567890'
+            """,
+        ),
+        ApiMethod(
+            "users.list",
+            http_verb="GET",
+            encoding=PARAMS,
+            rate_limit_tier=TIER_2,
+            pagination_key="members",
+            idempotent=True,
+            doc="""Lists all users in a Slack team.""",
+        ),
+        ApiMethod(
+            "users.lookupByEmail",
+            http_verb="GET",
+            encoding=PARAMS,
+            required=("email",),
+            rate_limit_tier=TIER_3,
+            idempotent=True,
+            doc="""Find a user with an email address.
+
+            Args:
+                email (str): An email address belonging to a user in the workspace.
+                    e.g. 'spengler@ghostbusters.example.com'
+            """,
+        ),
+        ApiMethod(
+            "users.setPhoto",
+            encoding=FILES,
+            required=("image",),
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_2,
+        ),
+        ApiMethod(
+            "users.setPresence",
+            required=("presence",),
+            rate_limit_tier=TIER_2,
+            doc="""Manually sets user presence.
+
+            Args:
+                presence (str): Either 'auto' or 'away'.
+            """,
+        ),
+        ApiMethod(
+            "users.profile.get",
+            http_verb="GET",
+            encoding=PARAMS,
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_4,
+            idempotent=True,
+            doc="""Retrieves a user's profile information.""",
+        ),
+        ApiMethod(
+            "users.profile.set",
+            token_type=USER_TOKEN,
+            rate_limit_tier=TIER_3,
+            doc="""Set the profile information for a user.""",
+        ),
+        ApiMethod(
+            "views.open",
+            required=("trigger_id", "view"),
+            rate_limit_tier=TIER_4,
+            doc="""Open a view for a user.
+
+            Open a modal with a user by exchanging a trigger_id received
+            from another interaction.
+
+            See the modals (https://api.slack.com/block-kit/surfaces/modals)
+            documentation to learn how to obtain triggers from interactive components.
+
+            Args:
+                trigger_id (str): Exchange a trigger to post to the user.
+                    e.g. '12345.98765.abcd2358fdea'
+                view (dict): The view payload.
+            """,
+        ),
+        ApiMethod(
+            "views.push",
+            required=("trigger_id", "view"),
+            rate_limit_tier=TIER_4,
+            doc="""Push a view onto the stack of a root view.
+
+            Push a new view onto the existing view stack by passing a view
+            payload and a valid trigger_id generated from an interaction
+            within the existing modal.
+
+            Read the modals documentation (https://api.slack.com/block-kit/surfaces/modals)
+            to learn more about the lifecycle and intricacies of views.
+
+            Args:
+                trigger_id (str): Exchange a trigger to post to the user.
+                    e.g. '12345.98765.abcd2358fdea'
+                view (dict): The view payload.
+            """,
+        ),
+        ApiMethod(
+            "views.publish",
+            required=("user_id", "view"),
+            rate_limit_tier=TIER_4,
+            doc="""Publish a static view for a User.
+
+            Create or update the view that comprises an
+            app's Home tab (https://api.slack.com/surfaces/tabs)
+            for a specific user.
+
+            Args:
+                user_id (str): id of the user you want publish a view to.
+                    e.g. 'U0BPQUNTA'
+                view (dict): The view payload.
+            """,
+        ),
+        ApiMethod(
+            "views.update",
+            required=("view",),
+            rate_limit_tier=TIER_4,
+        ),
+    )
+}
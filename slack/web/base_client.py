@@ -6,17 +6,25 @@ import platform
 import sys
 import logging
 import asyncio
-from typing import Optional, Union
-import inspect
+import copy
+from typing import Optional, Sequence, Union
 import hashlib
 import hmac
+import json
+import time
 
 # ThirdParty Imports
 import aiohttp
 from aiohttp import FormData, BasicAuth
+from multidict import CIMultiDict, CIMultiDictProxy
 
 # Internal Imports
+from slack.instrumentation import Instrumentation, RequestMetrics
+from slack.web.api_methods import API_METHODS
+from slack.web.interceptors import ApiRequest, Interceptor, run_interceptors
 from slack.web.slack_response import SlackResponse
+from slack.web.token_providers import TokenInterceptor, TokenProvider
+from slack.web.transports import AiohttpTransport, Transport
 import slack.version as ver
 import slack.errors as err
 
@@ -35,6 +43,14 @@ class BaseClient:
         run_async=False,
         session=None,
         headers: Optional[dict] = None,
+        entity_cache=None,
+        coalesce_requests=False,
+        response_cache=None,
+        retain_req_args=False,
+        transport: Optional[Transport] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        interceptors: Optional[Sequence[Interceptor]] = None,
+        token_provider: Optional[TokenProvider] = None,
     ):
         self.token = token
         self.base_url = base_url
@@ -42,10 +58,30 @@ class BaseClient:
         self.ssl = ssl
         self.proxy = proxy
         self.run_async = run_async
-        self.session = session
         self.headers = headers or {}
+        self.entity_cache = entity_cache
+        self.coalesce_requests = coalesce_requests
+        self.coalesced_calls = 0
+        self._in_flight_requests = {}
+        self.response_cache = response_cache
+        self.retain_req_args = retain_req_args
         self._logger = logging.getLogger(__name__)
         self._event_loop = loop
+        if transport is None:
+            transport = AiohttpTransport(session=session, timeout=timeout)
+        self.transport = transport
+        self.instrumentation = instrumentation
+        self.interceptors = list(interceptors or [])
+        self.token_provider = token_provider
+        if token_provider is not None:
+            # The outermost, so that requests it retries pass through the
+            # other interceptors again (e.g. a RateLimiter).
+            self.interceptors.insert(0, TokenInterceptor(token_provider))
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """The session of the transport, if it has one."""
+        return getattr(self.transport, "session", None)
 
     def _get_event_loop(self):
         """Retrieves the event loop or creates a new one."""
@@ -143,6 +179,9 @@ class BaseClient:
             raise err.SlackRequestError(msg)
 
         api_url = self._get_url(api_method)
+        read_key = self._get_read_key(
+            api_method, http_verb, files, data, params, json, headers, auth
+        )
 
         if auth:
             auth = BasicAuth(auth["client_id"], auth["client_secret"])
@@ -161,25 +200,135 @@ class BaseClient:
         if self._event_loop is None:
             self._event_loop = self._get_event_loop()
 
-        future = asyncio.ensure_future(
-            self._send(http_verb=http_verb, api_url=api_url, req_args=req_args),
-            loop=self._event_loop,
-        )
+        cache = self.response_cache
+        cache_key = None
+        if read_key is not None and cache is not None and api_method in cache.ttls:
+            cache_key = cache.get_key(*read_key)
+            cached = cache.get(api_method, cache_key)
+            if cached is not None:
+                response = SlackResponse(
+                    client=self,
+                    http_verb=http_verb,
+                    api_url=api_url,
+                    req_args=req_args,
+                    data=cached.decode(),
+                    headers=CIMultiDictProxy(CIMultiDict(cached.headers)),
+                    status_code=cached.status_code,
+                    cached=True,
+                    retain_req_args=self.retain_req_args,
+                )
+                if not self.run_async:
+                    return response
+                future = self._event_loop.create_future()
+                future.set_result(response)
+                return future
+
+        def send():
+            if cache_key is None:
+                return self._send(
+                    http_verb=http_verb, api_url=api_url, req_args=req_args
+                )
+            return self._send_and_cache(
+                api_method,
+                cache_key,
+                http_verb=http_verb,
+                api_url=api_url,
+                req_args=req_args,
+            )
+
+        if read_key is None or not self.coalesce_requests:
+            future = asyncio.ensure_future(send(), loop=self._event_loop)
+        else:
+            request = self._in_flight_requests.get(read_key)
+            if request is None:
+                request = asyncio.ensure_future(send(), loop=self._event_loop)
+                self._in_flight_requests[read_key] = request
+                request.add_done_callback(
+                    lambda _: self._in_flight_requests.pop(read_key, None)
+                )
+            else:
+                self.coalesced_calls += 1
+            future = asyncio.ensure_future(
+                self._share_response(request), loop=self._event_loop
+            )
 
         if self.run_async:
             return future
 
         return self._event_loop.run_until_complete(future)
 
-    def _validate_xoxp_token(self):
+    def _get_read_key(
+        self, api_method, http_verb, files, data, params, json, headers, auth
+    ):
+        """Identifies the calls that only read data.
+
+        Only calls of idempotent GET methods, with nothing but URL parameters,
+        may share a request with identical calls or be answered from the
+        response cache.
+
+        Returns:
+            A hashable key, or None if the call must be sent on its own.
+                e.g. ('users.info', 'xoxb-1234', (('user', 'W1234567890'),))
+        """
+        if http_verb != "GET":
+            return None
+        if files or data or json is not None or headers or auth:
+            return None
+        spec = API_METHODS.get(api_method)
+        if spec is None or not spec.idempotent:
+            return None
+        params = tuple(
+            sorted((key, str(value)) for key, value in (params or {}).items())
+        )
+        return (api_method, self.token, params)
+
+    async def _send_and_cache(self, api_method, cache_key, **kwargs):
+        """Sends the request and caches the response if it's successful."""
+        response = await self._send(**kwargs)
+        self.response_cache.set(
+            api_method,
+            cache_key,
+            response.data,
+            response.headers,
+            response.status_code,
+        )
+        return response
+
+    async def _share_response(self, request: asyncio.Future) -> SlackResponse:
+        """Waits for a shared request and gives the caller a response of its own.
+
+        Each caller gets its own SlackResponse and copy of the data, so that
+        paginating or changing one doesn't affect the others. Cancelling the
+        call doesn't cancel the shared request.
+        """
+        response = await asyncio.shield(request)
+        req_args = response.req_args
+        if req_args is not None:
+            req_args = dict(req_args)
+            req_args["params"] = dict(req_args.get("params") or {})
+        return SlackResponse(
+            client=self,
+            http_verb=response.http_verb,
+            api_url=response.api_url,
+            req_args=req_args,
+            data=copy.deepcopy(response._initial_data),
+            headers=response.headers,
+            status_code=response.status_code,
+            retain_req_args=req_args is not None,
+        )
+
+    def _validate_xoxp_token(self, method_name: str):
         """Ensures that an xoxp token is used when the specified method is called.
 
+        Args:
+            method_name (str): The name of the client method being called.
+                e.g. 'channels_create'
+
         Raises:
             BotUserAccessError: If the API method is called with a Bot User OAuth Access Token.
         """
 
-        if self.token.startswith("xoxb"):
-            method_name = inspect.stack()[1][3]
+        if self.token and self.token.startswith("xoxb"):
             msg = "The method '{}' cannot be called with a Bot Token.".format(
                 method_name
             )
@@ -198,7 +347,7 @@ class BaseClient:
         return urljoin(self.base_url, api_method)
 
     async def _send(self, http_verb, api_url, req_args):
-        """Sends the request out for transmission.
+        """Sends the request out for transmission, through the interceptors.
 
         Args:
             http_verb (str): The HTTP verb. e.g. 'GET' or 'POST'.
@@ -214,62 +363,130 @@ class BaseClient:
         Returns:
             The response parsed into a SlackResponse object.
         """
+        interceptors = self.interceptors
+        if not interceptors:
+            return await self._send_request(http_verb, api_url, req_args)
+        request = ApiRequest(
+            api_method=api_url.rsplit("/", 1)[-1],
+            http_verb=http_verb,
+            api_url=api_url,
+            req_args=req_args,
+        )
+        return await run_interceptors(
+            interceptors,
+            request,
+            lambda request: self._send_request(
+                request.http_verb, request.api_url, request.req_args
+            ),
+        )
+
+    async def _send_request(self, http_verb, api_url, req_args):
+        """Sends the request, after the interceptors, and validates the response."""
         open_files = []
-        files = req_args.pop("files", None)
-        if files is not None:
+        files = req_args.get("files")
+        if files is None:
+            req_args.pop("files", None)
+        else:
+            # The files are added to a copy of the data, leaving the request
+            # as it was, e.g. to be retried.
+            data = dict(req_args["data"] or {})
+            req_args = {**req_args, "data": data}
+            del req_args["files"]
             for k, v in files.items():
                 if isinstance(v, str):
                     f = open(v.encode("ascii", "ignore"), "rb")
                     open_files.append(f)
-                    req_args["data"].update({k: f})
+                    data.update({k: f})
                 else:
-                    req_args["data"].update({k: v})
+                    data.update({k: v})
 
-        res = await self._request(
-            http_verb=http_verb, api_url=api_url, req_args=req_args
-        )
-
-        for f in open_files:
-            f.close()
+        try:
+            res = await self._request(
+                http_verb=http_verb, api_url=api_url, req_args=req_args
+            )
+        finally:
+            for f in open_files:
+                f.close()
 
         data = {
             "client": self,
             "http_verb": http_verb,
             "api_url": api_url,
             "req_args": req_args,
+            "retain_req_args": self.retain_req_args,
         }
         return SlackResponse(**{**data, **res}).validate()
 
     async def _request(self, *, http_verb, api_url, req_args):
-        """Submit the HTTP request with the running session or a new session.
+        """Submit the HTTP request through the client's transport.
+
+        The request is reported to the client's instrumentation, if any.
+
         Returns:
             A dictionary of the response data.
         """
-        session = None
-        use_running_session = self.session and not self.session.closed
-        if use_running_session:
-            session = self.session
-        else:
-            session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                auth=req_args.pop("auth", None),
+        instrumentation = self.instrumentation
+        if instrumentation is not None:
+            method = api_url.rsplit("/", 1)[-1]
+            context = instrumentation.request_started(method)
+            start = time.perf_counter()
+        try:
+            res = await self.transport.send(
+                http_verb=http_verb, api_url=api_url, req_args=req_args
             )
-
-        response = None
-        async with session.request(http_verb, api_url, **req_args) as res:
-            data = {}
-            try:
-                data = await res.json()
-            except aiohttp.ContentTypeError:
-                self._logger.debug(
-                    f"No response data returned from the following API call: {api_url}."
+        except Exception as exception:
+            if instrumentation is not None:
+                metrics = RequestMetrics(
+                    method=method,
+                    http_verb=http_verb,
+                    status_code=0,
+                    duration=time.perf_counter() - start,
+                    bytes_sent=None,
+                    bytes_received=0,
+                    connection_reused=None,
+                    error=type(exception).__name__,
                 )
-            response = {"data": data, "headers": res.headers, "status_code": res.status}
+                instrumentation.request_ended(metrics, context)
+            raise
+        if instrumentation is None:
+            return self._decode(api_url, res)
 
-        if not use_running_session:
-            await session.close()
+        duration = time.perf_counter() - start
+        error = None
+        try:
+            response = self._decode(api_url, res)
+        except Exception as exception:
+            error = type(exception).__name__
+            raise
+        else:
+            data = response["data"]
+            if data.get("ok") is False:
+                error = data.get("error")
+        finally:
+            metrics = RequestMetrics(
+                method=method,
+                http_verb=http_verb,
+                status_code=res.status_code,
+                duration=duration,
+                bytes_sent=res.bytes_sent,
+                bytes_received=len(res.body),
+                connection_reused=res.connection_reused,
+                error=error,
+                bytes_transferred=res.bytes_transferred,
+            )
+            instrumentation.request_ended(metrics, context)
         return response
 
+    def _decode(self, api_url, res):
+        data = {}
+        if "json" in res.headers.get("Content-Type", "") and res.body.strip():
+            data = json.loads(res.body)
+        else:
+            self._logger.debug(
+                f"No response data returned from the following API call: {api_url}."
+            )
+        return {"data": data, "headers": res.headers, "status_code": res.status_code}
+
     @staticmethod
     def _get_user_agent():
         """Construct the user-agent header with the package info,
@@ -313,6 +530,11 @@ class BaseClient:
 
         Returns:
             True if signatures matches
+
+        Note:
+            This doesn't check the age of the timestamp or detect replayed
+            requests. Apps verifying many requests should reuse a
+            `slack.signature.SignatureVerifier` instead.
         """
         format_req = str.encode(f"v0:{timestamp}:{data}")
         encoded_secret = str.encode(signing_secret)
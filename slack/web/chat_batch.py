@@ -0,0 +1,151 @@
+"""A Python module for posting many messages within Slack's rate limits."""
+
+# Standard Imports
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Union
+
+# Internal Imports
+from slack.web.rate_limits import TokenBucket
+from slack.web.slack_response import SlackResponse
+import slack.errors as err
+
+# The message arguments worth serializing once when they're shared.
+_SHARED_KEYS = ("blocks", "attachments")
+
+
+def _encode(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _as_json(items):
+    """Converts Block Kit objects to dicts, leaving everything else as is."""
+    return [item.to_dict() if hasattr(item, "to_dict") else item for item in items]
+
+
+class _MessageEncoder:
+    """Encodes chat.postMessage bodies, serializing shared blocks once.
+
+    Messages sent to many channels usually share the same list of blocks.
+    Each distinct list (by identity) is serialized once and spliced into
+    the bodies of every message using it.
+    """
+
+    def __init__(self):
+        self._encoded = {}
+
+    def encode(self, message: dict) -> bytes:
+        rest = {}
+        shared = []
+        for key, value in message.items():
+            if key in _SHARED_KEYS and isinstance(value, (list, tuple)):
+                encoded = self._encoded.get(id(value))
+                if encoded is None:
+                    # The value is kept too, so that its id isn't reused.
+                    encoded = self._encoded[id(value)] = (
+                        _encode(_as_json(value)),
+                        value,
+                    )
+                shared.append(f',"{key}":{encoded[0]}')
+            else:
+                rest[key] = value
+        # 'channel' is always in rest, so the object is never empty.
+        body = _encode(rest)[:-1] + "".join(shared) + "}"
+        return body.encode("utf-8")
+
+
+async def post_many(
+    client,
+    messages: Sequence[dict],
+    *,
+    per_channel_interval: float = 1.0,
+    max_concurrency: int = 10,
+    max_per_minute: int = 300,
+    max_retries: int = 3,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Union[SlackResponse, Exception]]:
+    """Posts messages, in order within each channel and in parallel across channels.
+
+    See `WebClient.chat_post_many`.
+    """
+    for message in messages:
+        if "channel" not in message:
+            raise TypeError("chat_post_many() requires a 'channel' in every message.")
+
+    api_url = client._get_url("chat.postMessage")
+    headers = client._get_headers(
+        has_json=True, has_files=False, request_specific_headers={}
+    )
+    encoder = _MessageEncoder()
+    bodies = [encoder.encode(message) for message in messages]
+
+    by_channel = OrderedDict()
+    for index, message in enumerate(messages):
+        by_channel.setdefault(message["channel"], []).append(index)
+
+    results: List[Union[SlackResponse, Exception, None]] = [None] * len(messages)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # The workspace's messages: bursts of up to max_concurrency, then
+    # max_per_minute. Rate limited responses pause every channel until
+    # Slack's Retry-After.
+    bucket = TokenBucket(
+        max_concurrency, max_concurrency * 60 / max_per_minute, time.monotonic()
+    )
+    done = 0
+
+    async def post(index):
+        for attempt in range(max_retries + 1):
+            delay = bucket.reserve(time.monotonic())
+            if delay > 0:
+                await asyncio.sleep(delay)
+            req_args = {
+                "headers": headers,
+                "data": bodies[index],
+                "params": None,
+                "json": None,
+                "ssl": client.ssl,
+                "proxy": client.proxy,
+                "auth": None,
+            }
+            async with semaphore:
+                try:
+                    return await client._send(
+                        http_verb="POST", api_url=api_url, req_args=req_args
+                    )
+                except err.SlackApiError as exception:
+                    response = exception.response
+                    if response.status_code != 429 or attempt == max_retries:
+                        raise
+                    retry_after = float(response.headers.get("Retry-After", 1))
+                    bucket.paused_until = max(
+                        bucket.paused_until, time.monotonic() + retry_after
+                    )
+                    if client.instrumentation is not None:
+                        client.instrumentation.retry_scheduled(
+                            "chat.postMessage",
+                            attempt + 1,
+                            bucket.paused_until - time.monotonic(),
+                        )
+
+    async def post_channel(indexes):
+        nonlocal done
+        last_sent = None
+        for index in indexes:
+            if last_sent is not None:
+                delay = last_sent + per_channel_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                results[index] = await post(index)
+            except Exception as exception:
+                # A failed message doesn't stop the others.
+                results[index] = exception
+            last_sent = time.monotonic()
+            done += 1
+            if on_progress is not None:
+                on_progress(done, len(messages))
+
+    await asyncio.gather(*(post_channel(indexes) for indexes in by_channel.values()))
+    return results
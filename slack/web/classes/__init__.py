@@ -1,42 +1,157 @@
-import json
 from abc import ABCMeta
+from collections.abc import MutableSequence
 from functools import wraps
-from typing import Callable, Iterable
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple, Union
 
 from ...errors import SlackObjectFormationError
 
+# The names of the validators of each class, found once per class.
+_validator_names: Dict[type, Tuple[str, ...]] = {}
+
 
 class BaseObject:
+    # Subclasses list their fields in __slots__: there are often thousands
+    # of these objects in a modal or a long list of options, and slotted
+    # instances are smaller and faster to build than instances with a
+    # __dict__. Subclasses without __slots__ keep working as before.
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_names: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name not in fields and name not in ("__dict__", "__weakref__"):
+                    fields.append(name)
+        cls._fields = tuple(fields)
+        cls._field_names = frozenset(fields)
+
     def __str__(self):
         return f"<slack.{self.__class__.__name__}>"
 
+    def get_non_null_fields(self) -> dict:
+        """
+        Construct a dictionary out of the non-null fields of this object, in the
+        order they're declared, followed by any attributes set outside __slots__
+        """
+        fields = {}
+        for name in self._fields:
+            value = getattr(self, name, None)
+            if value is not None:
+                fields[name] = value
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            for name, value in instance_dict.items():
+                if value is not None:
+                    fields[name] = value
+        return fields
+
+
+def _to_json(value):
+    """
+    Convert a tree of objects, dicts and lists into plain dicts and lists,
+    leaving out null values
+    """
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {
+            key: _to_json(item) for key, item in value.items() if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, JsonObjectList):
+        # Items that were never parsed are still the JSON they were received as
+        return [
+            item if isinstance(item, dict) else _to_json(item) for item in value._items
+        ]
+    if isinstance(value, BaseObject):
+        fields = value.get_non_null_fields()
+    elif hasattr(value, "__dict__"):
+        fields = {key: item for key, item in vars(value).items() if item is not None}
+    else:
+        raise TypeError(
+            f"Object of type {type(value).__name__} is not JSON serializable"
+        )
+    return {key: _to_json(item) for key, item in fields.items()}
+
 
 class JsonObject(BaseObject, metaclass=ABCMeta):
+    __slots__ = ()
+    # The class parsing each field holding nested objects, e.g.
+    # {"text": TextObject}. Merged with the fields of the parent classes.
+    _object_fields: Dict[str, type] = {}
 
-    def validate_json(self) -> None:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        object_fields = {}
+        for klass in reversed(cls.__mro__):
+            object_fields.update(klass.__dict__.get("_object_fields", {}))
+        cls._object_fields = object_fields
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Union["JsonObject", dict]:
         """
-        Raises:
-          SlackObjectFormationError if the object was not valid
+        Build an object out of its JSON, e.g. a block of a message fetched from
+        Slack, without calling __init__ or validating it. Nested lists of objects
+        are parsed lazily, when their items are first accessed.
+
+        Returns the JSON unchanged if the class has no field for some of its keys,
+        so that nothing is lost when it's sent back to Slack
+        """
+        return cls._from_fields(data)
+
+    @classmethod
+    def _from_fields(cls, data: dict) -> Union["JsonObject", dict]:
+        if not cls._field_names.issuperset(data):
+            return data
+        obj = cls.__new__(cls)
+        object_fields = cls._object_fields
+        for name in cls._fields:
+            value = data.get(name)
+            field_class = object_fields.get(name)
+            if field_class is not None:
+                if isinstance(value, dict):
+                    value = field_class.from_dict(value)
+                elif isinstance(value, list):
+                    value = field_class.from_list(value)
+            setattr(obj, name, value)
+        return obj
+
+    @classmethod
+    def from_list(cls, items: List[dict]) -> "JsonObjectList":
+        """
+        Wrap a list of JSON objects, e.g. the blocks of a message, in a list
+        parsing each item with from_dict when it's first accessed
         """
-        for attribute in (func for func in dir(self) if not func.startswith("__")):
-            method = getattr(self, attribute)
-            if callable(method) and hasattr(method, "validator"):
-                method()
+        return JsonObjectList(items, cls.from_dict)
 
-    @staticmethod
-    def __get_non_null_attributes(dict_: dict) -> dict:
+    def validate_json(self) -> None:
         """
-        Construct a dictionary out of non-null keys (from attributes property)
-        present on this object
+        Raises:
+          SlackObjectFormationError if the object was not valid
         """
-        return {key: value for key, value in dict_.items() if value is not None}
+        cls = type(self)
+        names = _validator_names.get(cls)
+        if names is None:
+            names = _validator_names[cls] = tuple(
+                attribute
+                for attribute in dir(cls)
+                if not attribute.startswith("__")
+                and callable(getattr(cls, attribute))
+                and hasattr(getattr(cls, attribute), "validator")
+            )
+        for name in names:
+            getattr(self, name)()
 
     def to_dict(self, *args) -> dict:
         self.validate_json()
-        _json = json.dumps(self, default=lambda o: o.__dict__)
-        _dict = json.loads(_json, object_hook=self.__get_non_null_attributes)
-
-        return _dict
+        return _to_json(self)
 
     def __repr__(self):
         _json = self.to_dict()
@@ -46,6 +161,53 @@ class JsonObject(BaseObject, metaclass=ABCMeta):
             return self.__str__()
 
 
+class JsonObjectList(MutableSequence):
+    """
+    A list of JSON objects (e.g. the blocks of a message) that parses each
+    item when it's first accessed, so that patching one block of a large
+    message doesn't parse all the others. Items that were never accessed are
+    serialized back as they were received.
+    """
+
+    __slots__ = ("_items", "_parse")
+
+    def __init__(self, items: Iterable[dict], parse: Callable[[dict], object]):
+        self._items = list(items)
+        self._parse = parse
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if isinstance(item, dict):
+            parsed = self._parse(item)
+            if parsed is not item:
+                self._items[index] = item = parsed
+        return item
+
+    def __setitem__(self, index, value):
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def insert(self, index, value):
+        self._items.insert(index, value)
+
+    def __repr__(self):
+        return f"<slack.JsonObjectList: {len(self._items)} items>"
+
+    def to_list(self) -> list:
+        """
+        Convert the items back to JSON, without validating them, e.g. to send
+        the patched blocks of a message with chat_update
+        """
+        return _to_json(self)
+
+
 class JsonValidator:
     def __init__(self, message: str):
         """
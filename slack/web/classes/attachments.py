@@ -9,6 +9,8 @@ SeededColors = {"danger", "good", "warning"}
 
 
 class AttachmentField(JsonObject):
+    __slots__ = ("title", "value", "short")
+
     attributes = {"short", "title", "value"}
 
     def __init__(
@@ -24,6 +26,26 @@ class AttachmentField(JsonObject):
 
 
 class Attachment(JsonObject):
+    __slots__ = (
+        "text",
+        "title",
+        "fallback",
+        "pretext",
+        "title_link",
+        "color",
+        "author_name",
+        "author_link",
+        "author_icon",
+        "image_url",
+        "thumb_url",
+        "footer",
+        "footer_icon",
+        "ts",
+        "fields",
+        "mrkdwn_in",
+    )
+    _object_fields = {"fields": AttachmentField}
+
     attributes = {
         "author_icon",
         "author_link",
@@ -145,6 +167,15 @@ class Attachment(JsonObject):
         self.fields = fields or []
         self.mrkdwn_in = markdown_in or []
 
+    @property
+    def markdown_in(self) -> List[str]:
+        """The mrkdwn_in field, named like the constructor argument"""
+        return self.mrkdwn_in
+
+    @markdown_in.setter
+    def markdown_in(self, value: List[str]):
+        self.mrkdwn_in = value
+
     @JsonValidator(f"footer attribute cannot exceed {footer_max_length} characters")
     def footer_length(self):
         return self.footer is None or len(self.footer) <= self.footer_max_length
@@ -191,6 +222,9 @@ class Attachment(JsonObject):
 
 
 class BlockAttachment(Attachment):
+    __slots__ = ("blocks",)
+    _object_fields = {"blocks": Block}
+
     attributes = {"color"}
     blocks: List[Block]
 
@@ -223,6 +257,8 @@ class BlockAttachment(Attachment):
 
 
 class InteractiveAttachment(Attachment):
+    __slots__ = ("callback_id", "actions")
+
     @property
     def attributes(self) -> Set[str]:
         return super().attributes.union({"callback_id"})
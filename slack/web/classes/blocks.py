@@ -21,6 +21,8 @@ class Block(JsonObject):
     File
     """
 
+    __slots__ = ("type", "block_id", "color")
+
     attributes = {"block_id"}
 
     block_id_max_length = 255
@@ -30,6 +32,17 @@ class Block(JsonObject):
         self.block_id = block_id
         self.color = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> Union["Block", dict]:
+        """
+        Parse the JSON of a block, e.g. one of the blocks of a message fetched
+        from Slack, into the Block subclass for its type
+        """
+        block_class = BlockTypes.get(data.get("type"))
+        if block_class is None:
+            return data
+        return block_class._from_fields(data)
+
     @JsonValidator(f"block_id cannot exceed {block_id_max_length} characters")
     def block_id_length(self):
         return self.block_id is None or len(self.block_id) <= self.block_id_max_length
@@ -41,6 +54,13 @@ class Block(JsonObject):
 
 
 class SectionBlock(Block):
+    __slots__ = ("text", "fields", "accessory")
+    _object_fields = {
+        "text": TextObject,
+        "fields": TextObject,
+        "accessory": BlockElement,
+    }
+
     fields_max_length = 10
 
     def __init__(
@@ -106,6 +126,8 @@ class SectionBlock(Block):
 
 
 class DividerBlock(Block):
+    __slots__ = ()
+
     def __init__(self, *, block_id: Optional[str] = None):
         """A content divider, like an <hr>, to split up different blocks inside of a message.
 
@@ -124,6 +146,8 @@ class DividerBlock(Block):
 
 
 class ImageBlock(Block):
+    __slots__ = ("image_url", "alt_text", "title")
+
     @property
     def attributes(self) -> Set[str]:
         return super().attributes.union({"alt_text", "image_url"})
@@ -181,6 +205,9 @@ class ImageBlock(Block):
 
 
 class ActionsBlock(Block):
+    __slots__ = ("elements",)
+    _object_fields = {"elements": BlockElement}
+
     elements_max_length = 5
 
     def __init__(
@@ -210,6 +237,9 @@ class ActionsBlock(Block):
 
 
 class ContextBlock(Block):
+    __slots__ = ("elements",)
+    _object_fields = {"elements": BlockElement}
+
     elements_max_length = 10
 
     def __init__(
@@ -242,6 +272,9 @@ class ContextBlock(Block):
 
 
 class InputBlock(Block):
+    __slots__ = ("label", "element", "hint", "optional")
+    _object_fields = {"label": TextObject, "element": BlockElement}
+
     attributes = {"label", "hint", "optional"}
     label_max_length = 2000
     hint_max_length = 2000
@@ -290,6 +323,8 @@ class InputBlock(Block):
 
 
 class FileBlock(Block):
+    __slots__ = ("external_id", "source")
+
     @property
     def attributes(self) -> Set[str]:
         return super().attributes.union({"external_id", "source"})
@@ -308,3 +343,15 @@ class FileBlock(Block):
         super().__init__(_type="file", block_id=block_id)
         self.external_id = external_id
         self.source = source
+
+
+# The Block subclass for each block "type".
+BlockTypes = {
+    "section": SectionBlock,
+    "divider": DividerBlock,
+    "image": ImageBlock,
+    "actions": ActionsBlock,
+    "context": ContextBlock,
+    "input": InputBlock,
+    "file": FileBlock,
+}
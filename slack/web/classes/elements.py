@@ -6,7 +6,14 @@ from abc import ABCMeta
 from typing import List, Optional, Union
 
 from . import EnumValidator, JsonObject, JsonValidator
-from .objects import ButtonStyles, ConfirmObject, Option, OptionGroup, PlainTextObject
+from .objects import (
+    ButtonStyles,
+    ConfirmObject,
+    Option,
+    OptionGroup,
+    PlainTextObject,
+    TextObject,
+)
 
 
 class BlockElement(JsonObject, metaclass=ABCMeta):
@@ -24,10 +31,24 @@ class BlockElement(JsonObject, metaclass=ABCMeta):
     https://api.slack.com/reference/block-kit/block-elements
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, *, type: str):
         # Note: "subtype" is actually the "type" parameter,
         # but was renamed due to name already being used in Python Builtins.
         self.type = type
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Union["BlockElement", TextObject, dict]:
+        """
+        Parse the JSON of an element into the BlockElement subclass for its type.
+        Context blocks mix elements and text objects, so text objects are
+        parsed too.
+        """
+        element_class = BlockElementTypes.get(data.get("type"))
+        if element_class is None:
+            return TextObject.from_dict(data)
+        return element_class._from_fields(data)
     #
     # def to_dict(self) -> dict:
     #     json = super().to_dict()
@@ -36,6 +57,8 @@ class BlockElement(JsonObject, metaclass=ABCMeta):
 
 
 class InteractiveElement(BlockElement):
+    __slots__ = ("action_id",)
+
     action_id_max_length = 255
 
     def __init__(self, *,
@@ -52,6 +75,8 @@ class InteractiveElement(BlockElement):
 
 
 class ImageElement(BlockElement):
+    __slots__ = ("image_url", "alt_text")
+
     image_url_max_length = 3000
     alt_text_max_length = 2000
 
@@ -86,6 +111,9 @@ class ImageElement(BlockElement):
 
 
 class ButtonElement(InteractiveElement):
+    __slots__ = ("text", "url", "value", "style", "confirm")
+    _object_fields = {"text": TextObject, "confirm": ConfirmObject}
+
     text_max_length = 75
     url_max_length = 3000
     value_max_length = 2000
@@ -152,6 +180,8 @@ class ButtonElement(InteractiveElement):
 
 
 class LinkButtonElement(ButtonElement):
+    __slots__ = ()
+
     def __init__(self, *, text: PlainTextObject, url: str, style: Optional[str] = None):
         """
         A simple button that simply opens a given URL. You will still receive an
@@ -170,6 +200,9 @@ class LinkButtonElement(ButtonElement):
 
 
 class AbstractSelector(InteractiveElement, metaclass=ABCMeta):
+    __slots__ = ("placeholder", "confirm")
+    _object_fields = {"placeholder": TextObject, "confirm": ConfirmObject}
+
     placeholder_max_length = 150
 
     def __init__(
@@ -199,6 +232,13 @@ class AbstractSelector(InteractiveElement, metaclass=ABCMeta):
 
 
 class StaticSelectElement(AbstractSelector):
+    __slots__ = ("options", "option_groups", "initial_option")
+    _object_fields = {
+        "options": Option,
+        "option_groups": OptionGroup,
+        "initial_option": Option,
+    }
+
     options_max_length = 100
     option_groups_max_length = 100
 
@@ -275,6 +315,13 @@ class StaticSelectElement(AbstractSelector):
 
 
 class StaticMultiSelectElement(AbstractSelector):
+    __slots__ = ("options", "option_groups", "initial_options")
+    _object_fields = {
+        "options": Option,
+        "option_groups": OptionGroup,
+        "initial_options": Option,
+    }
+
     options_max_length = 100
     option_groups_max_length = 100
 
@@ -348,6 +395,9 @@ class StaticMultiSelectElement(AbstractSelector):
 
 
 class SelectElement(AbstractSelector):
+    __slots__ = ("options", "initial_option")
+    _object_fields = {"options": Option, "initial_option": Option}
+
     options_max_length = 100
 
     def __init__(
@@ -408,6 +458,9 @@ class SelectElement(AbstractSelector):
 
 class ExternalDataSelectElement(AbstractSelector):
 
+    __slots__ = ("initial_option", "min_query_length")
+    _object_fields = {"initial_option": Option}
+
     def __init__(
             self,
             *,
@@ -455,6 +508,9 @@ class ExternalDataSelectElement(AbstractSelector):
 
 
 class ExternalDataMultiSelectElement(AbstractSelector):
+    __slots__ = ("initial_options", "min_query_length")
+    _object_fields = {"initial_options": Option}
+
     def __init__(
             self,
             *,
@@ -502,6 +558,8 @@ class ExternalDataMultiSelectElement(AbstractSelector):
 
 
 class UserSelectElement(AbstractSelector):
+    __slots__ = ("initial_user",)
+
     def __init__(
             self,
             *,
@@ -535,6 +593,8 @@ class UserSelectElement(AbstractSelector):
 
 
 class UserMultiSelectElement(AbstractSelector):
+    __slots__ = ("initial_users",)
+
     def __init__(
             self,
             *,
@@ -569,6 +629,8 @@ class UserMultiSelectElement(AbstractSelector):
 
 
 class ConversationSelectElement(AbstractSelector):
+    __slots__ = ("initial_conversation",)
+
     def __init__(
             self,
             *,
@@ -602,6 +664,8 @@ class ConversationSelectElement(AbstractSelector):
 
 
 class ConversationMultiSelectElement(AbstractSelector):
+    __slots__ = ("initial_conversations",)
+
     def __init__(
             self,
             *,
@@ -636,6 +700,8 @@ class ConversationMultiSelectElement(AbstractSelector):
 
 
 class ChannelSelectElement(AbstractSelector):
+    __slots__ = ("initial_channel",)
+
     def __init__(
             self,
             *,
@@ -669,6 +735,8 @@ class ChannelSelectElement(AbstractSelector):
 
 
 class ChannelMultiSelectElement(AbstractSelector):
+    __slots__ = ("initial_channels",)
+
     def __init__(
             self,
             *,
@@ -703,6 +771,8 @@ class ChannelMultiSelectElement(AbstractSelector):
 
 
 class OverflowMenuOption(Option):
+    __slots__ = ("url",)
+
     def __init__(self, text: PlainTextObject, value: str, url: Optional[str] = None):
         """
         An extension of a standard option, but with an optional 'url' attribute,
@@ -733,6 +803,9 @@ class OverflowMenuOption(Option):
 
 
 class OverflowMenuElement(InteractiveElement):
+    __slots__ = ("options", "confirm")
+    _object_fields = {"options": OverflowMenuOption, "confirm": ConfirmObject}
+
     options_min_length = 2
     options_max_length = 5
 
@@ -784,6 +857,8 @@ class OverflowMenuElement(InteractiveElement):
 
 
 class DatePickerElement(AbstractSelector):
+    __slots__ = ("initial_date",)
+
     def __init__(
             self,
             *,
@@ -824,6 +899,16 @@ class DatePickerElement(AbstractSelector):
 
 
 class PlainTextElement(BlockElement):
+    __slots__ = (
+        "placeholder",
+        "action_id",
+        "initial_value",
+        "multiline",
+        "min_length",
+        "max_length",
+    )
+    _object_fields = {"placeholder": TextObject}
+
     min_length_max_value = 3000
 
     def __init__(self, *,
@@ -864,3 +949,23 @@ class PlainTextElement(BlockElement):
     )
     def max_value_length(self):
         return self.min_length is None or self.min_length <= self.min_length_max_value
+
+
+# The BlockElement subclass for each element "type".
+BlockElementTypes = {
+    "image": ImageElement,
+    "button": ButtonElement,
+    "static_select": StaticSelectElement,
+    "multi_static_select": StaticMultiSelectElement,
+    "external_select": ExternalDataSelectElement,
+    "multi_external_select": ExternalDataMultiSelectElement,
+    "users_select": UserSelectElement,
+    "multi_users_select": UserMultiSelectElement,
+    "conversations_select": ConversationSelectElement,
+    "multi_conversations_select": ConversationMultiSelectElement,
+    "channels_select": ChannelSelectElement,
+    "multi_channels_select": ChannelMultiSelectElement,
+    "overflow": OverflowMenuElement,
+    "datepicker": DatePickerElement,
+    "plain_text_input": PlainTextElement,
+}
@@ -1,5 +1,5 @@
 import json
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Optional
 
 from . import BaseObject
 
@@ -137,3 +137,34 @@ class SlashCommandInteractiveEvent(InteractiveEvent):
             return {"text": message, "response_type": "ephemeral"}
         else:
             return {"text": message, "response_type": "in_channel"}
+
+
+# The InteractiveEvent subclass for each interactive payload "type".
+InteractiveEventTypes = {
+    "block_actions": MessageInteractiveEvent,
+    "dialog_submission": DialogInteractiveEvent,
+}
+
+
+def parse_interactive_event(payload: dict) -> Optional[InteractiveEvent]:
+    """
+    Wraps an interactive payload or slash command sent to your app in the
+    matching InteractiveEvent class
+
+    Args:
+        payload: the raw payload dictionary
+
+    Returns:
+        The InteractiveEvent, or None if no class parses this kind of payload
+        (e.g. block actions taken in a modal, which have no message)
+    """
+    if "command" in payload:
+        event_class = SlashCommandInteractiveEvent
+    else:
+        event_class = InteractiveEventTypes.get(payload.get("type"))
+    if event_class is None:
+        return None
+    try:
+        return event_class(payload)
+    except KeyError:
+        return None
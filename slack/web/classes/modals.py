@@ -86,6 +86,30 @@ class ModalBuilder(JsonObject):
         # self.notify_on_close = False
         # self.external_id = None
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ModalBuilder":
+        """Build a ModalBuilder out of a view, e.g. the view of a view_submission
+        payload, so that it can be changed and sent back with views_update.
+
+        The blocks are parsed lazily, when they're first accessed. The fields
+        Slack adds to views (e.g. id, hash and state) are left out, since
+        views_update doesn't take them.
+
+        Args:
+          data: the JSON of the view
+        """
+        builder = cls()
+        modal = builder.modal
+        for name in vars(modal):
+            if name in data:
+                setattr(modal, name, data[name])
+        for name in ("title", "close", "submit"):
+            value = getattr(modal, name)
+            if isinstance(value, dict):
+                setattr(modal, name, TextObject.from_dict(value))
+        modal.blocks = Block.from_list(modal.blocks)
+        return builder
+
     def title(self, title: str) -> "ModalBuilder":
         """
         Specify a title for this modal
@@ -8,6 +8,8 @@ DynamicSelectElementTypes = {"channels", "conversations", "users"}
 
 
 class Link(BaseObject):
+    __slots__ = ("url", "text")
+
     def __init__(self, *, url: str, text: str):
         """
         Base class used to generate links in Slack's not-quite Markdown, not quite HTML
@@ -31,6 +33,8 @@ class Link(BaseObject):
 
 
 class DateLink(Link):
+    __slots__ = ()
+
     def __init__(
             self,
             *,
@@ -69,6 +73,8 @@ class DateLink(Link):
 
 
 class ObjectLink(Link):
+    __slots__ = ()
+
     prefix_mapping = {
         "C": "#",  # channel
         "G": "#",  # group message
@@ -95,6 +101,8 @@ class ObjectLink(Link):
 
 
 class ChannelLink(Link):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents an @channel link, which notifies everyone present in this channel.
@@ -105,6 +113,8 @@ class ChannelLink(Link):
 
 
 class HereLink(Link):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents an @here link, which notifies all online users of this channel.
@@ -115,6 +125,8 @@ class HereLink(Link):
 
 
 class EveryoneLink(Link):
+    __slots__ = ()
+
     def __init__(self):
         """
         Represents an @everyone link, which notifies all users of this workspace.
@@ -125,6 +137,8 @@ class EveryoneLink(Link):
 
 
 class TextObject(JsonObject):
+    __slots__ = ("text", "type")
+
     attributes = {"text", "type"}
 
     def __init__(self, *, text: str, type: str):
@@ -134,6 +148,16 @@ class TextObject(JsonObject):
         self.text = text
         self.type = type
 
+    @classmethod
+    def from_dict(cls, data: dict) -> Union["TextObject", dict]:
+        """
+        Parse the JSON of a text object into the TextObject subclass for its type
+        """
+        text_class = TextObjectTypes.get(data.get("type"))
+        if text_class is None:
+            return data
+        return text_class._from_fields(data)
+
     # def to_dict(self) -> dict:
     #     json = super().to_dict()
     #     json["type"] = self.type
@@ -141,6 +165,8 @@ class TextObject(JsonObject):
 
 
 class PlainTextObject(TextObject):
+    __slots__ = ("emoji",)
+
     @property
     def attributes(self) -> Set[str]:
         return super().attributes.union({"emoji"})
@@ -167,6 +193,8 @@ class PlainTextObject(TextObject):
 
 
 class MarkdownTextObject(TextObject):
+    __slots__ = ("verbatim",)
+
     @property
     def attributes(self) -> Set[str]:
         return super().attributes.union({"verbatim"})
@@ -206,7 +234,15 @@ class MarkdownTextObject(TextObject):
 
 
 class ConfirmObject(JsonObject):
+    __slots__ = ("title", "text", "confirm", "deny")
+
     attributes = {}  # no attributes because to_dict has unique implementations
+    _object_fields = {
+        "title": TextObject,
+        "text": TextObject,
+        "confirm": TextObject,
+        "deny": TextObject,
+    }
 
     title_max_length = 100
     text_max_length = 300
@@ -294,7 +330,10 @@ class Option(JsonObject):
     different required formats in different situations
     """
 
+    __slots__ = ("text", "value", "description")
+
     attributes = {}  # no attributes because to_dict has unique implementations
+    _object_fields = {"text": TextObject}
 
     label_max_length = 75
     value_max_length = 75
@@ -370,7 +409,10 @@ class OptionGroup(JsonObject):
     different required formats in different situations
     """
 
+    __slots__ = ("label", "options")
+
     attributes = {}  # no attributes because to_dict has unique implementations
+    _object_fields = {"options": Option}
 
     label_max_length = 75
     options_max_length = 100
@@ -421,3 +463,10 @@ class OptionGroup(JsonObject):
                 "label": PlainTextObject.direct_from_string(self.label),
                 "options": [option.to_dict() for option in self.options]
             }
+
+
+# The TextObject subclass for each text object "type".
+TextObjectTypes = {
+    "plain_text": PlainTextObject,
+    "mrkdwn": MarkdownTextObject,
+}
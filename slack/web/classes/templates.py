@@ -0,0 +1,183 @@
+"""Reusable Block Kit payloads, validated and serialized once.
+
+Bots often send the same blocks over and over, with only a few values
+changed. e.g. a welcome message mentioning the new user. Rebuilding the
+Block Kit objects and calling `to_dict` for every message validates and
+serializes the whole tree each time.
+
+A Template does that work once: the tree is built with Slots standing in for
+the values that change, and `render` fills them into the serialized tree.
+
+Example:
+```python
+from slack.web.classes.blocks import DividerBlock, SectionBlock
+from slack.web.classes.objects import MarkdownTextObject
+from slack.web.classes.templates import Slot, Template
+
+welcome = Template([
+    SectionBlock(text=MarkdownTextObject(text=f"Welcome <@{Slot('user')}>! :wave:")),
+    DividerBlock(),
+])
+client.chat_postMessage(channel=channel, blocks=welcome.render(user="U0123ABC"))
+```
+"""
+
+import re
+from typing import Any, Callable, Optional
+
+from . import JsonObject, JsonObjectList
+
+# Slots are strings wrapped in separator characters, which Slack's text
+# fields don't use, so that they survive validation and serialization.
+_SLOT_START = "\x1e"
+_SLOT_END = "\x1f"
+_SLOT_PATTERN = re.compile(f"{_SLOT_START}([^{_SLOT_START}{_SLOT_END}]+){_SLOT_END}")
+
+
+class Slot(str):
+    """A placeholder for a value that's filled in when a Template is rendered.
+
+    A Slot is a string, so it can be passed to Block Kit objects as is, or
+    embedded in a longer string. e.g. f"Hi <@{Slot('user')}>"
+
+    A Slot that makes up a whole value can be filled with any JSON value.
+    e.g. a list of elements. A Slot embedded in a string is filled with the
+    value converted to a string.
+
+    Attributes:
+        name (str): The name of the value filling the slot. e.g. 'user'
+    """
+
+    def __new__(cls, name: str):
+        if not name or _SLOT_START in name or _SLOT_END in name:
+            raise ValueError(f"Invalid slot name: {name!r}")
+        slot = super().__new__(cls, f"{_SLOT_START}{name}{_SLOT_END}")
+        slot.name = name
+        return slot
+
+
+def _to_json(node):
+    if isinstance(node, JsonObject):
+        return node.to_dict()
+    if isinstance(node, dict):
+        return {key: _to_json(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple, JsonObjectList)):
+        return [_to_json(value) for value in node]
+    return node
+
+
+def _fill(value):
+    if isinstance(value, JsonObject):
+        return value.to_dict()
+    return value
+
+
+class Template:
+    """A Block Kit payload with slots, validated and serialized once.
+
+    Rendering copies only the dicts and lists leading to slots; the parts of
+    the payload without slots are shared by every rendered payload, so they
+    must not be changed.
+
+    Values are filled in as is: rendering doesn't validate them again. e.g.
+    a value making a text longer than Slack allows is sent to Slack.
+
+    Args:
+        payload: Block Kit objects, dicts or lists of them, with Slots.
+            e.g. a list of blocks
+
+    Attributes:
+        slots (frozenset): The names of the slots.
+
+    Raises:
+        SlackObjectFormationError: A Block Kit object isn't valid.
+    """
+
+    def __init__(self, payload: Any):
+        self.slots = frozenset()
+        self._payload = _to_json(payload)
+        self._render = self._compile(self._payload)
+
+    def __repr__(self):
+        return f"<slack.Template: {sorted(self.slots)}>"
+
+    def render(self, **values) -> Any:
+        """Fills the slots in a copy of the payload.
+
+        Args:
+            **values: The values of the slots, by name. e.g. user='U0123ABC'
+
+        Returns:
+            The payload, as JSON-serializable dicts and lists.
+
+        Raises:
+            TypeError: A slot has no value, or a value has no slot.
+        """
+        if values.keys() != self.slots:
+            missing = self.slots.difference(values)
+            if missing:
+                raise TypeError(f"render() is missing values for {sorted(missing)}")
+            unexpected = set(values).difference(self.slots)
+            raise TypeError(
+                f"render() got values for unknown slots {sorted(unexpected)}"
+            )
+        if self._render is None:
+            return self._payload
+        return self._render(values)
+
+    def _compile(self, node) -> Optional[Callable[[dict], Any]]:
+        """Builds a function rendering the node, or None if it has no slots."""
+        if isinstance(node, str):
+            return self._compile_string(node)
+        if isinstance(node, dict):
+            renderers = []
+            for key, value in node.items():
+                render = self._compile(value)
+                if render is not None:
+                    renderers.append((key, render))
+            if not renderers:
+                return None
+
+            def render_dict(values):
+                rendered = node.copy()
+                for key, render in renderers:
+                    rendered[key] = render(values)
+                return rendered
+
+            return render_dict
+        if isinstance(node, list):
+            renderers = []
+            for index, value in enumerate(node):
+                render = self._compile(value)
+                if render is not None:
+                    renderers.append((index, render))
+            if not renderers:
+                return None
+
+            def render_list(values):
+                rendered = node.copy()
+                for index, render in renderers:
+                    rendered[index] = render(values)
+                return rendered
+
+            return render_list
+        return None
+
+    def _compile_string(self, text: str) -> Optional[Callable[[dict], Any]]:
+        # Alternates text and slot names. e.g. ['Hi <@', 'user', '>']
+        parts = _SLOT_PATTERN.split(text)
+        if len(parts) == 1:
+            return None
+        names = parts[1::2]
+        self.slots = self.slots.union(names)
+        if len(parts) == 3 and parts[0] == parts[2] == "":
+            name = names[0]
+            return lambda values: _fill(values[name])
+
+        def render_string(values):
+            rendered = parts.copy()
+            for index in range(1, len(parts), 2):
+                rendered[index] = str(values[parts[index]])
+            return "".join(rendered)
+
+        return render_string
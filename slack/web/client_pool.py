@@ -0,0 +1,249 @@
+"""A Python module for calling the Web API on behalf of many workspaces."""
+
+# Standard Imports
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+# Internal Imports
+from slack.web.client import WebClient
+from slack.web.rate_limits import RateLimiter
+from slack.web.transports import AiohttpTransport, Transport
+import slack.errors as err
+
+# A team id and an enterprise id, either of which may be None.
+Route = Tuple[Optional[str], Optional[str]]
+
+
+class _Entry:
+    __slots__ = ("client", "last_used", "routes")
+
+    def __init__(self, client: WebClient, last_used: float):
+        self.client = client
+        self.last_used = last_used
+        # The routes the token lookup resolved to this token.
+        self.routes = set()
+
+
+class WebClientPool:
+    """The WebClients of the workspaces an app is installed in.
+
+    `client(team_id=...)` returns the client holding the workspace's
+    token. Clients are created on first use, one per token, and evicted once
+    they've been idle for `idle_timeout` seconds or there are more than
+    `max_clients`, so that serving thousands of workspaces doesn't keep
+    thousands of clients around.
+
+    Every client sends its requests through the pool's transport: they share
+    one connection pool, however many workspaces there are. Each token has
+    its own RateLimiter (see `slack.web.rate_limits`), as Slack's rate limits
+    apply to each token. A token's RateLimiter outlives its client, so that
+    an evicted client's successor waits out the same pauses.
+
+    Tokens are either added upfront with `add_token`, or looked up when a
+    workspace is first called, with `token_lookup` (e.g. from a database).
+
+    Example:
+    ```python
+    import slack
+    from slack.web.client_pool import WebClientPool
+
+    pool = WebClientPool(token_lookup=installations.find_bot_token)
+    pool.client(team_id="T1234567890").chat_postMessage(
+        channel="C1234567890", text="Hello"
+    )
+    ```
+
+    Attributes:
+        transport (Transport): The transport of every client. Default is
+            an AiohttpTransport with a persistent session.
+        max_clients (int): The maximum number of clients kept. The least
+            recently used ones are evicted first. Default is 1000.
+        idle_timeout (int): The number of seconds an unused client is kept.
+            Default is 600.
+        rate_limits (bool): Whether each token's requests are kept within
+            Slack's rate limits. Default is True.
+        client_options (dict): The other arguments of the clients, e.g.
+            'base_url', 'run_async' or 'interceptors'.
+    """
+
+    def __init__(
+        self,
+        *,
+        token_lookup: Optional[
+            Callable[[Optional[str], Optional[str]], Optional[str]]
+        ] = None,
+        transport: Optional[Transport] = None,
+        max_clients: int = 1000,
+        idle_timeout: int = 600,
+        rate_limits: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        **client_options,
+    ):
+        self._owns_transport = transport is None
+        if transport is None:
+            transport = AiohttpTransport(
+                timeout=client_options.get("timeout", 30), persistent=True
+            )
+        self.transport = transport
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.rate_limits = rate_limits
+        self.client_options = client_options
+        self._token_lookup = token_lookup
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The tokens added with add_token, and those the lookup resolved.
+        self._tokens: Dict[Route, str] = {}
+        self._looked_up: Dict[Route, str] = {}
+        # Tokens mapped to their clients, least recently used first.
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Tokens mapped to their rate limiters, kept after eviction until
+        # they're idle.
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add_token(self, token: str, *, team_id: str = None, enterprise_id: str = None):
+        """Routes the calls for a workspace, or a whole enterprise, to a token.
+
+        Args:
+            token (str): The workspace's token. e.g. 'xoxb-1234'
+            team_id (str): The workspace. e.g. 'T1234567890'
+            enterprise_id (str): The enterprise. Without a team_id, the token
+                is used for every workspace of the enterprise, e.g. for an
+                org-wide installation. e.g. 'E1234567890'
+        """
+        if team_id is None and enterprise_id is None:
+            raise err.SlackRequestError("A team_id or an enterprise_id is required.")
+        with self._lock:
+            previous = self._tokens.get((team_id, enterprise_id))
+            self._tokens[(team_id, enterprise_id)] = token
+            if previous is not None and previous != token:
+                self._forget(previous)
+
+    def remove_token(self, *, team_id: str = None, enterprise_id: str = None):
+        """Forgets a workspace's token, e.g. once the app is uninstalled."""
+        route = (team_id, enterprise_id)
+        with self._lock:
+            token = self._tokens.pop(route, None) or self._looked_up.pop(route, None)
+            if token is not None:
+                self._forget(token)
+
+    def client(self, *, team_id: str = None, enterprise_id: str = None) -> WebClient:
+        """Returns the client of a workspace.
+
+        Args:
+            team_id (str): The workspace. e.g. 'T1234567890'
+            enterprise_id (str): The workspace's enterprise, if any.
+                e.g. 'E1234567890'
+
+        Raises:
+            SlackRequestError: There's no token for the workspace.
+        """
+        route = (team_id, enterprise_id)
+        with self._lock:
+            token = self._find_token(route)
+            if token is not None:
+                return self._checkout(token)
+
+        # The lookup may be slow (e.g. a database query): other workspaces'
+        # calls shouldn't wait for it.
+        if self._token_lookup is not None:
+            token = self._token_lookup(team_id, enterprise_id)
+        if token is None:
+            raise err.SlackRequestError(
+                f"There's no token for team '{team_id}'"
+                f" (enterprise '{enterprise_id}')."
+            )
+        with self._lock:
+            # Another call may have resolved the workspace in the meantime.
+            existing = self._find_token(route)
+            if existing is not None:
+                return self._checkout(existing)
+            return self._checkout(token, route)
+
+    async def close(self):
+        """Closes the connections of the pool's transport, if it opened them."""
+        with self._lock:
+            self._entries.clear()
+            self._looked_up.clear()
+            self._rate_limiters.clear()
+        if self._owns_transport:
+            await self.transport.close()
+
+    def _find_token(self, route: Route) -> Optional[str]:
+        team_id, enterprise_id = route
+        for key in ((team_id, enterprise_id), (team_id, None), (None, enterprise_id)):
+            if key != (None, None):
+                token = self._tokens.get(key) or self._looked_up.get(key)
+                if token is not None:
+                    return token
+        return None
+
+    def _checkout(self, token: str, route: Optional[Route] = None) -> WebClient:
+        """Returns the client of a token, creating it if needed.
+
+        Args:
+            token (str): The token of the client.
+            route (tuple): The route the token lookup resolved to the token.
+        """
+        now = self._clock()
+        entry = self._entries.get(token)
+        if entry is None:
+            entry = _Entry(self._create_client(token), now)
+            self._entries[token] = entry
+        else:
+            entry.last_used = now
+            self._entries.move_to_end(token)
+        if route is not None:
+            self._looked_up[route] = token
+            entry.routes.add(route)
+        self._evict(now)
+        return entry.client
+
+    def _create_client(self, token: str) -> WebClient:
+        options = dict(self.client_options)
+        interceptors = list(options.pop("interceptors", None) or [])
+        if self.rate_limits:
+            limiter = self._rate_limiters.get(token)
+            if limiter is None:
+                limiter = RateLimiter(clock=self._clock)
+                self._rate_limiters[token] = limiter
+            # The innermost, so that requests answered by the other
+            # interceptors (e.g. from a cache) aren't counted.
+            interceptors.append(limiter)
+        return WebClient(
+            token=token, transport=self.transport, interceptors=interceptors, **options
+        )
+
+    def _evict(self, now: float):
+        """Evicts the least recently used clients, while there are too many or
+        they've been idle for too long."""
+        evicted = False
+        while self._entries:
+            token, entry = next(iter(self._entries.items()))
+            too_many = len(self._entries) > self.max_clients
+            if not too_many and now - entry.last_used < self.idle_timeout:
+                break
+            self._discard(token)
+            evicted = True
+        if evicted:
+            # A new limiter would do as well as an idle one.
+            for token, limiter in list(self._rate_limiters.items()):
+                if token not in self._entries and limiter.is_idle():
+                    del self._rate_limiters[token]
+
+    def _forget(self, token: str):
+        """Discards a token that's no longer used, with its rate limiter."""
+        self._discard(token)
+        self._rate_limiters.pop(token, None)
+
+    def _discard(self, token: str):
+        entry = self._entries.pop(token, None)
+        if entry is not None:
+            for route in entry.routes:
+                if self._looked_up.get(route) == token:
+                    del self._looked_up[route]
@@ -0,0 +1,207 @@
+"""A Python module for caching the users, conversations and bots of a workspace."""
+
+# Standard Imports
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+USER = "user"
+CHANNEL = "channel"
+BOT = "bot"
+
+# RTM events carrying the complete, updated entity.
+# e.g. {"type": "user_change", "user": {"id": "U1", ...}}
+_UPDATING_EVENTS = {
+    "user_change": USER,
+    "team_join": USER,
+    "bot_added": BOT,
+    "bot_changed": BOT,
+}
+
+# RTM events making the cached conversation stale. Their 'channel' is either
+# the conversation id or a partial conversation. e.g. {"id": "C1", "name": "a"}
+_INVALIDATING_EVENTS = {
+    "channel_archive",
+    "channel_created",
+    "channel_deleted",
+    "channel_joined",
+    "channel_left",
+    "channel_rename",
+    "channel_unarchive",
+    "group_archive",
+    "group_close",
+    "group_deleted",
+    "group_joined",
+    "group_left",
+    "group_open",
+    "group_rename",
+    "group_unarchive",
+    "im_close",
+    "im_created",
+    "im_open",
+    "member_joined_channel",
+    "member_left_channel",
+}
+
+
+class EntityCache:
+    """An in-memory cache of the users, conversations and bots of a workspace.
+
+    A WebClient with an entity cache serves `users_info`, `conversations_info`
+    and `bots_info` from it, and only calls Slack when an entity is missing
+    or has expired. Concurrent async calls for the same missing entity share
+    a single request to Slack.
+
+    The same cache can be passed to an RTMClient, which seeds it from the
+    'rtm.start' payload and keeps it up to date as events such as
+    'user_change' or 'channel_rename' come in.
+
+    Entities are kept encoded as JSON, and every lookup decodes a copy of
+    its own, so callers may modify what they get without affecting the
+    cache or each other.
+
+    Attributes:
+        max_size (int): The maximum number of entities kept. The least
+            recently used entities are evicted first. Default is 10000.
+        ttl (int): The number of seconds an entity is kept. Default is 300.
+        hits (int): The number of lookups served from the cache.
+        misses (int): The number of lookups that needed a request to Slack.
+
+    Example:
+    ```python
+    import os
+    import slack
+    from slack.web.entity_cache import EntityCache
+
+    cache = EntityCache(max_size=50000, ttl=600)
+    client = slack.WebClient(token=os.environ['SLACK_API_TOKEN'], entity_cache=cache)
+    client.users_info(user="W1234567890")  # Calls Slack.
+    client.users_info(user="W1234567890")  # Served from the cache.
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 10000,
+        ttl: int = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (kind, id) mapped to (the time the entity expires, the entity
+        # encoded as JSON), least recently used first.
+        self._entities: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._pending = {}
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, kind: str, entity_id: str) -> Optional[dict]:
+        """Retrieves a cached entity.
+
+        Args:
+            kind (str): USER, CHANNEL or BOT.
+            entity_id (str): The id of the entity. e.g. 'W1234567890'
+
+        Returns:
+            A copy of the entity, or None if it isn't cached or has expired.
+        """
+        key = (kind, entity_id)
+        with self._lock:
+            cached = self._entities.get(key)
+            if cached is not None:
+                if cached[0] > self._clock():
+                    self._entities.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(cached[1])
+                del self._entities[key]
+            self.misses += 1
+            return None
+
+    def set(self, kind: str, entity_id: str, entity: dict):
+        """Caches an entity, evicting the least recently used ones if needed."""
+        key = (kind, entity_id)
+        encoded = json.dumps(entity, separators=(",", ":"))
+        with self._lock:
+            self._entities[key] = (self._clock() + self.ttl, encoded)
+            self._entities.move_to_end(key)
+            while len(self._entities) > self.max_size:
+                self._entities.popitem(last=False)
+
+    def invalidate(self, kind: str, entity_id: str):
+        """Removes an entity from the cache."""
+        with self._lock:
+            self._entities.pop((kind, entity_id), None)
+
+    def clear(self):
+        """Removes every entity from the cache."""
+        with self._lock:
+            self._entities.clear()
+
+    def seed(self, data: dict):
+        """Caches the entities of an 'rtm.start' payload.
+
+        Args:
+            data (dict): The payload. e.g. {"users": [...], "channels": [...]}
+        """
+        for kind, keys in (
+            (USER, ("users",)),
+            (CHANNEL, ("channels", "groups", "ims")),
+            (BOT, ("bots",)),
+        ):
+            for key in keys:
+                for entity in data.get(key) or ():
+                    self.set(kind, entity["id"], entity)
+
+    def handle_rtm_event(self, event: str, data: dict):
+        """Updates or invalidates the entities an RTM event changes.
+
+        Args:
+            event (str): The type of event. e.g. 'user_change'
+            data (dict): The data Slack sent. e.g. {"user": {"id": "U1", ...}}
+        """
+        kind = _UPDATING_EVENTS.get(event)
+        if kind is not None:
+            entity = data.get(kind)
+            if isinstance(entity, dict) and "id" in entity:
+                self.set(kind, entity["id"], entity)
+        elif event in _INVALIDATING_EVENTS:
+            channel = data.get(CHANNEL)
+            if isinstance(channel, dict):
+                channel = channel.get("id")
+            if channel is not None:
+                self.invalidate(CHANNEL, channel)
+
+    def single_flight(
+        self,
+        kind: str,
+        entity_id: str,
+        fetch: Callable[[], Awaitable],
+        loop: asyncio.AbstractEventLoop,
+    ) -> asyncio.Future:
+        """Runs `fetch` unless a fetch of the same entity is already running.
+
+        Args:
+            kind (str): USER, CHANNEL or BOT.
+            entity_id (str): The id of the entity. e.g. 'W1234567890'
+            fetch (callable): Returns a coroutine requesting the entity.
+            loop (AbstractEventLoop): The event loop to run the fetch on.
+
+        Returns:
+            A Future shared by every caller until the fetch completes.
+        """
+        key = (loop, kind, entity_id)
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch(), loop=loop)
+            self._pending[key] = future
+            future.add_done_callback(lambda _: self._pending.pop(key, None))
+        return future
@@ -0,0 +1,95 @@
+"""A Python module for the interceptors the WebClient's requests pass through.
+
+Interceptors add behaviour around every request (e.g. caching, metrics,
+compression or token rotation) without subclassing the client. Each one
+receives the request and the rest of the chain, `call_next`, and may:
+- modify the request before passing it on,
+- answer it without calling `call_next` at all,
+- observe or replace the response, or handle the errors, `call_next` gives.
+
+Interceptors run in the order they're given to the client, the first being
+the outermost. A client without interceptors (the default) sends its
+requests directly.
+
+Example:
+```python
+class RequestTimer(Interceptor):
+    async def intercept(self, request, call_next):
+        start = time.monotonic()
+        try:
+            return await call_next(request)
+        finally:
+            print(request.api_method, time.monotonic() - start)
+
+client = WebClient(token=slack_token, interceptors=[RequestTimer()])
+```
+"""
+
+# Standard Imports
+import functools
+from typing import Awaitable, Callable, NamedTuple, Sequence
+
+# Internal Imports
+from slack.web.slack_response import SlackResponse
+
+
+class ApiRequest(NamedTuple):
+    """A Web API request, on its way through the interceptors.
+
+    Interceptors modify a request with `request._replace(...)` (e.g.
+    `request._replace(api_url=other_url)`), or by changing its `req_args`.
+
+    Attributes:
+        api_method (str): The Web API method. e.g. 'chat.postMessage'
+        http_verb (str): The HTTP verb. e.g. 'POST'
+        api_url (str): The Slack API url.
+            e.g. 'https://www.slack.com/api/chat.postMessage'
+        req_args (dict): The request arguments. e.g. 'headers', 'params',
+            'data', 'json' and 'files'.
+    """
+
+    api_method: str
+    http_verb: str
+    api_url: str
+    req_args: dict
+
+
+CallNext = Callable[[ApiRequest], Awaitable[SlackResponse]]
+
+
+class Interceptor:
+    """A stage of the chain the client's requests pass through.
+
+    The default implementation passes requests on unchanged.
+    """
+
+    async def intercept(
+        self, request: ApiRequest, call_next: CallNext
+    ) -> SlackResponse:
+        """Handles a request.
+
+        Args:
+            request (ApiRequest): The request.
+            call_next: Sends a request through the rest of the chain, and
+                returns its response. It raises what sending it raises,
+                e.g. SlackApiError if the response isn't ok.
+
+        Returns:
+            (SlackResponse) The response to the request.
+        """
+        return await call_next(request)
+
+
+async def run_interceptors(
+    interceptors: Sequence[Interceptor], request: ApiRequest, send: CallNext
+) -> SlackResponse:
+    """Passes a request through interceptors, in order, and then to `send`."""
+
+    async def call(index, request):
+        if index == len(interceptors):
+            return await send(request)
+        return await interceptors[index].intercept(
+            request, functools.partial(call, index + 1)
+        )
+
+    return await call(0, request)
@@ -0,0 +1,147 @@
+"""Typed, read-only views of common Slack payloads.
+
+A view wraps the dict Slack sent without copying it and reads each field
+when it's accessed. This gives handlers attribute access and type hints for
+the fields they use, without building intermediate objects for the rest.
+
+Example:
+```python
+from slack.web.payload_views import MessageView
+
+@RTMClient.run_on(event="message")
+def on_message(**payload):
+    message = MessageView(payload["data"])
+    if message.is_thread_reply:
+        ...
+```
+"""
+
+# Standard Imports
+from typing import Any, Callable, Optional
+
+
+class _Field:
+    """A view attribute reading a (nested) key of the viewed dict.
+
+    Args:
+        path (str): The keys leading to the value. e.g. 'profile', 'email'
+        convert (callable): Applied to the value when it isn't None.
+        default: Returned when the value is missing.
+    """
+
+    __slots__ = ("path", "convert", "default")
+
+    def __init__(
+        self, *path: str, convert: Optional[Callable] = None, default: Any = None
+    ):
+        self.path = path
+        self.convert = convert
+        self.default = default
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        value = view._data
+        for key in self.path:
+            if not isinstance(value, dict):
+                return self.default
+            value = value.get(key)
+        if value is None:
+            return self.default
+        if self.convert is not None:
+            return self.convert(value)
+        return value
+
+
+class PayloadView:
+    """The base of the payload views.
+
+    Attributes:
+        data (dict): The viewed payload.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    @property
+    def data(self) -> dict:
+        return self._data
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._data.get('id')}>"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._data == other._data
+
+
+class MessageView(PayloadView):
+    """A view of a message. e.g. the 'message' of a chat.postMessage response"""
+
+    __slots__ = ()
+
+    type: str = _Field("type")
+    subtype: Optional[str] = _Field("subtype")
+    text: str = _Field("text", default="")
+    user: Optional[str] = _Field("user")
+    bot_id: Optional[str] = _Field("bot_id")
+    channel: Optional[str] = _Field("channel")
+    ts: Optional[str] = _Field("ts")
+    thread_ts: Optional[str] = _Field("thread_ts")
+    timestamp: Optional[float] = _Field("ts", convert=float)
+    blocks: list = _Field("blocks", default=())
+    attachments: list = _Field("attachments", default=())
+
+    def __repr__(self):
+        return f"<MessageView {self._data.get('ts')}>"
+
+    @property
+    def is_thread_reply(self) -> bool:
+        thread_ts = self.thread_ts
+        return thread_ts is not None and thread_ts != self.ts
+
+
+class ChannelView(PayloadView):
+    """A view of a conversation. e.g. the 'channel' of a conversations.info response"""
+
+    __slots__ = ()
+
+    id: str = _Field("id")
+    name: Optional[str] = _Field("name")
+    created: Optional[int] = _Field("created", convert=int)
+    creator: Optional[str] = _Field("creator")
+    is_channel: bool = _Field("is_channel", default=False)
+    is_group: bool = _Field("is_group", default=False)
+    is_im: bool = _Field("is_im", default=False)
+    is_private: bool = _Field("is_private", default=False)
+    is_archived: bool = _Field("is_archived", default=False)
+    is_member: bool = _Field("is_member", default=False)
+    members: list = _Field("members", default=())
+    num_members: Optional[int] = _Field("num_members", convert=int)
+    topic: Optional[str] = _Field("topic", "value")
+    purpose: Optional[str] = _Field("purpose", "value")
+
+
+class UserView(PayloadView):
+    """A view of a user. e.g. the 'user' of a users.info response"""
+
+    __slots__ = ()
+
+    id: str = _Field("id")
+    team_id: Optional[str] = _Field("team_id")
+    name: Optional[str] = _Field("name")
+    real_name: Optional[str] = _Field("real_name")
+    deleted: bool = _Field("deleted", default=False)
+    is_admin: bool = _Field("is_admin", default=False)
+    is_owner: bool = _Field("is_owner", default=False)
+    is_bot: bool = _Field("is_bot", default=False)
+    tz: Optional[str] = _Field("tz")
+    tz_offset: Optional[int] = _Field("tz_offset", convert=int)
+    display_name: Optional[str] = _Field("profile", "display_name")
+    email: Optional[str] = _Field("profile", "email")
+    status_text: Optional[str] = _Field("profile", "status_text")
+    status_emoji: Optional[str] = _Field("profile", "status_emoji")
+    image_72: Optional[str] = _Field("profile", "image_72")
@@ -0,0 +1,114 @@
+"""A Python module for keeping a client's requests within Slack's rate limits."""
+
+# Standard Imports
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+# Internal Imports
+from slack.web.api_methods import API_METHODS, TIER_LIMITS
+from slack.web.interceptors import ApiRequest, CallNext, Interceptor
+from slack.web.slack_response import SlackResponse
+import slack.errors as err
+
+
+class TokenBucket:
+    """A token bucket, holding up to `limit` requests, refilled at the pace
+    of `limit` requests per `period` seconds."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "paused_until")
+
+    def __init__(self, limit: int, period: float, now: float):
+        self.rate = limit / period
+        self.capacity = limit
+        self.tokens = float(limit)
+        self.updated = now
+        self.paused_until = 0.0
+
+    def reserve(self, now: float) -> float:
+        """Takes a token, and returns the number of seconds to wait for it."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        # Requests queue up behind each other once the bucket is empty.
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+
+class RateLimiter(Interceptor):
+    """Delays requests so that each method stays within its rate limit.
+
+    Slack applies its limits to each method: every method has a bucket
+    allowing bursts of up to the limit of its tier (see
+    `slack.web.api_methods`), refilled at the limit's pace. Requests that
+    find the bucket empty wait for their turn. A rate limited response (429)
+    pauses the method until its 'Retry-After'. Methods with special rate
+    limits (e.g. chat.postMessage) and unknown methods aren't delayed.
+
+    Slack's limits also apply to each workspace: a RateLimiter should only
+    be used by the clients of a single token.
+
+    Example:
+    ```python
+    client = WebClient(token=slack_token, interceptors=[RateLimiter()])
+    ```
+
+    Attributes:
+        period (float): The number of seconds the tiers' limits are for.
+            Default is 60.
+        delayed (int): The number of requests that had to wait.
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: Optional[Dict[int, int]] = None,
+        period: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits = TIER_LIMITS if limits is None else limits
+        self.period = period
+        self.delayed = 0
+        self._clock = clock
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, api_method: str) -> Optional[TokenBucket]:
+        bucket = self._buckets.get(api_method)
+        if bucket is None:
+            spec = API_METHODS.get(api_method)
+            if spec is None or spec.rate_limit_tier not in self.limits:
+                return None
+            limit = self.limits[spec.rate_limit_tier]
+            bucket = TokenBucket(limit, self.period, self._clock())
+            self._buckets[api_method] = bucket
+        return bucket
+
+    def is_idle(self) -> bool:
+        """Whether the limiter is back to the state of a new one: every bucket
+        has refilled and no method is paused."""
+        now = self._clock()
+        return all(
+            bucket.tokens + (now - bucket.updated) * bucket.rate >= bucket.capacity
+            and bucket.paused_until <= now
+            for bucket in self._buckets.values()
+        )
+
+    async def intercept(
+        self, request: ApiRequest, call_next: CallNext
+    ) -> SlackResponse:
+        bucket = self._bucket(request.api_method)
+        if bucket is None:
+            return await call_next(request)
+        wait = bucket.reserve(self._clock())
+        if wait > 0:
+            self.delayed += 1
+            await asyncio.sleep(wait)
+        try:
+            return await call_next(request)
+        except err.SlackApiError as e:
+            if e.response.status_code == 429:
+                retry_after = float(e.response.headers.get("Retry-After", 1))
+                bucket.paused_until = max(
+                    bucket.paused_until, self._clock() + retry_after
+                )
+            raise
@@ -0,0 +1,280 @@
+"""A Python module for caching the responses of read-only Web API methods."""
+
+# Standard Imports
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+# Internal Imports
+from slack.web.api_methods import API_METHODS
+
+# Methods returning large payloads that rarely change, in seconds.
+DEFAULT_TTLS = {
+    "emoji.list": 60 * 60,
+    "team.info": 60 * 60,
+    "team.profile.get": 60 * 60,
+    "usergroups.list": 60 * 10,
+}
+
+
+class CachedResponse(NamedTuple):
+    """A response as it's stored in a ResponseStore.
+
+    Attributes:
+        body (bytes): The response data, encoded as JSON.
+        headers (tuple): The response headers as (name, value) pairs.
+        status_code (int): The HTTP status code. e.g. 200
+        expires_at (float): The time after which the response is stale.
+    """
+
+    body: bytes
+    headers: Tuple[Tuple[str, str], ...]
+    status_code: int
+    expires_at: float
+
+    def decode(self) -> dict:
+        """Decodes a new copy of the response data."""
+        return json.loads(self.body)
+
+
+class ResponseStore:
+    """The interface of the stores holding cached responses."""
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Retrieves a cached response, or None if there's none."""
+        raise NotImplementedError
+
+    def set(self, key: str, response: CachedResponse):
+        """Stores a response, replacing any response cached for the key."""
+        raise NotImplementedError
+
+    def discard(self, key: str):
+        """Removes the response cached for the key, if any."""
+        raise NotImplementedError
+
+
+class MemoryResponseStore(ResponseStore):
+    """Keeps responses in memory, up to a total size.
+
+    Attributes:
+        max_bytes (int): The maximum total size of the cached response
+            bodies. The least recently used responses are evicted first.
+            Default is 32 MiB.
+        size (int): The current total size of the cached response bodies.
+    """
+
+    def __init__(self, *, max_bytes: int = 32 * 2**20):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._lock = threading.Lock()
+        self._responses: "OrderedDict[str, CachedResponse]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._responses)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._responses.get(key)
+            if response is not None:
+                self._responses.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse):
+        if len(response.body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._responses.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous.body)
+            self._responses[key] = response
+            self.size += len(response.body)
+            while self.size > self.max_bytes:
+                _, evicted = self._responses.popitem(last=False)
+                self.size -= len(evicted.body)
+
+    def discard(self, key: str):
+        with self._lock:
+            response = self._responses.pop(key, None)
+            if response is not None:
+                self.size -= len(response.body)
+
+
+class SQLiteResponseStore(ResponseStore):
+    """Keeps responses in a SQLite database, so that they survive restarts.
+
+    Attributes:
+        path (str): The path of the database file. e.g. '/tmp/slack_responses.db'
+        purge_interval (int): The number of seconds between the purges of
+            the expired responses, which are run as responses are stored.
+            Default is 60.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        purge_interval: int = 60,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.purge_interval = purge_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS slack_responses (key TEXT PRIMARY KEY, "
+            "body BLOB NOT NULL, headers TEXT NOT NULL, status_code INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS slack_responses_expires_at "
+            "ON slack_responses (expires_at)"
+        )
+        self._next_purge = 0.0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT body, headers, status_code, expires_at "
+                "FROM slack_responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, headers, status_code, expires_at = row
+        headers = tuple(tuple(header) for header in json.loads(headers))
+        return CachedResponse(bytes(body), headers, status_code, expires_at)
+
+    def set(self, key: str, response: CachedResponse):
+        now = self._clock()
+        with self._lock:
+            if now >= self._next_purge:
+                self._connection.execute(
+                    "DELETE FROM slack_responses WHERE expires_at <= ?", (now,)
+                )
+                self._next_purge = now + self.purge_interval
+            self._connection.execute(
+                "INSERT OR REPLACE INTO slack_responses "
+                "(key, body, headers, status_code, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.body,
+                    json.dumps(response.headers),
+                    response.status_code,
+                    response.expires_at,
+                ),
+            )
+
+    def discard(self, key: str):
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM slack_responses WHERE key = ?", (key,)
+            )
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+
+class ResponseCache:
+    """Caches the responses of read-only Web API methods for a while.
+
+    A WebClient with a response cache answers calls of the cached methods
+    from it until the response expires. Cached responses are SlackResponses
+    like any other, with their `cached` attribute set to True. Only
+    successful responses are cached.
+
+    Slack's Web API doesn't send validators (e.g. ETag), so responses can't
+    be revalidated: they're used until their TTL runs out.
+
+    Attributes:
+        ttls (dict): The number of seconds the responses of each method are
+            cached. e.g. {"emoji.list": 3600}
+            Default is DEFAULT_TTLS.
+        store (ResponseStore): Where the responses are kept.
+            Default is a MemoryResponseStore.
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls sent to Slack.
+
+    Example:
+    ```python
+    import os
+    import slack
+    from slack.web.response_cache import ResponseCache, SQLiteResponseStore
+
+    cache = ResponseCache(
+        ttls={"emoji.list": 3600, "team.info": 600},
+        store=SQLiteResponseStore("/tmp/slack_responses.db"),
+    )
+    client = slack.WebClient(token=os.environ['SLACK_API_TOKEN'], response_cache=cache)
+    client.emoji_list()  # Calls Slack.
+    assert client.emoji_list().cached
+    ```
+
+    Raises:
+        ValueError: A TTL is set for a method that isn't idempotent.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttls: Optional[Dict[str, float]] = None,
+        store: Optional[ResponseStore] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        for api_method in self.ttls:
+            spec = API_METHODS.get(api_method)
+            if spec is None or not spec.idempotent:
+                raise ValueError(f"The '{api_method}' method can't be cached.")
+        self.store = store if store is not None else MemoryResponseStore()
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+
+    @staticmethod
+    def get_key(api_method: str, token: Optional[str], params: tuple) -> str:
+        """Builds the key a call's response is stored under.
+
+        The token is hashed, so that it isn't written to disk.
+        """
+        call = json.dumps([api_method, token, params])
+        return hashlib.sha256(call.encode("utf-8")).hexdigest()
+
+    def get(self, api_method: str, key: str) -> Optional[CachedResponse]:
+        """Retrieves the fresh response of a call of a cached method.
+
+        Returns:
+            The response, or None if the method isn't cached or the
+            response is missing or has expired.
+        """
+        if api_method not in self.ttls:
+            return None
+        response = self.store.get(key)
+        if response is not None:
+            if response.expires_at > self._clock():
+                self.hits += 1
+                return response
+            self.store.discard(key)
+        self.misses += 1
+        return None
+
+    def set(self, api_method: str, key: str, data: dict, headers, status_code: int):
+        """Caches a response of a cached method."""
+        ttl = self.ttls.get(api_method)
+        if ttl is None:
+            return
+        response = CachedResponse(
+            body=json.dumps(data, separators=(",", ":")).encode("utf-8"),
+            headers=tuple((str(name), str(value)) for name, value in headers.items()),
+            status_code=status_code,
+            expires_at=self._clock() + ttl,
+        )
+        self.store.set(key, response)
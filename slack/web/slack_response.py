@@ -3,10 +3,21 @@
 # Standard Imports
 import logging
 import asyncio
+import reprlib
 
 # Internal Imports
+from slack.web.payload_views import ChannelView, MessageView, UserView
 import slack.errors as e
 
+_logger = logging.getLogger(__name__)
+
+# Bounds what's logged of the response data, which can be huge.
+_data_repr = reprlib.Repr()
+_data_repr.maxlevel = 3
+_data_repr.maxdict = 10
+_data_repr.maxlist = 10
+_data_repr.maxstring = 200
+
 
 class SlackResponse(object):
     """An iterable container of response data.
@@ -14,10 +25,21 @@ class SlackResponse(object):
     Attributes:
         data (dict): The json-encoded content of the response. Along
             with the headers and status code information.
+        req_args (dict): The arguments of the request. They're only kept
+            when they're needed to fetch the next page of results, or when
+            `retain_req_args` is True. Otherwise None.
+        cached (bool): Whether the response was served from a cache
+            rather than by Slack.
+
+        message (MessageView): A typed view of the 'message' in the data.
+        channel (ChannelView): A typed view of the 'channel' in the data.
+        user (UserView): A typed view of the 'user' in the data.
 
     Methods:
         validate: Check if the response from Slack was successful.
         get: Retrieves any key from the response data.
+        get_path: Retrieves a nested value from the response data.
+        keys, values, items: Like the methods of the response data.
         next: Retrieves the next portion of results,
             if 'next_cursor' is present.
 
@@ -48,11 +70,29 @@ class SlackResponse(object):
         makes subsequent API requests until your code hits
         'break' or there are no more results to be found.
 
+        The response can be read like the (read-only) dict of its data, with
+        `in`, `len`, `keys`, `values` and `items`. It isn't a Mapping
+        though: iterating over it fetches the pages of results, and missing
+        keys are None rather than raising a KeyError.
+
         Any attributes or methods prefixed with _underscores are
         intended to be "private" internal use only. They may be changed or
         removed at anytime.
     """
 
+    __slots__ = (
+        "http_verb",
+        "api_url",
+        "req_args",
+        "data",
+        "headers",
+        "status_code",
+        "cached",
+        "_initial_data",
+        "_client",
+        "_iteration",
+    )
+
     def __init__(
         self,
         *,
@@ -63,16 +103,23 @@ class SlackResponse(object):
         data: dict,
         headers: dict,
         status_code: int,
+        cached: bool = False,
+        retain_req_args: bool = False,
     ):
         self.http_verb = http_verb
         self.api_url = api_url
-        self.req_args = req_args
+        # The request arguments include the token and the whole body.
+        if retain_req_args or self._next_cursor_is_present(data):
+            self.req_args = req_args
+        else:
+            self.req_args = None
         self.data = data
         self.headers = headers
         self.status_code = status_code
+        self.cached = cached
         self._initial_data = data
         self._client = client
-        self._logger = logging.getLogger(__name__)
+        self._iteration = 0
 
     def __str__(self):
         """Return the Response data if object is converted to a string."""
@@ -91,6 +138,24 @@ class SlackResponse(object):
         """
         return self.data.get(key, None)
 
+    def __contains__(self, key):
+        return key in self.data
+
+    def __len__(self):
+        return len(self.data)
+
+    def keys(self):
+        """A view of the keys of the response data."""
+        return self.data.keys()
+
+    def values(self):
+        """A view of the values of the response data."""
+        return self.data.values()
+
+    def items(self):
+        """A view of the (key, value) pairs of the response data."""
+        return self.data.items()
+
     def __iter__(self):
         """Enables the ability to iterate over the response.
         It's required for the iterator protocol.
@@ -159,6 +224,41 @@ class SlackResponse(object):
         """
         return self.data.get(key, default)
 
+    def get_path(self, *keys, default=None):
+        """Retrieves a nested value from the response data.
+
+        e.g. response.get_path("message", "blocks", 0, "type")
+
+        Returns:
+            The value, or the specified default if any key along the path
+            is missing.
+        """
+        value = self.data
+        for key in keys:
+            try:
+                value = value[key]
+            except (KeyError, IndexError, TypeError):
+                return default
+        return value
+
+    @property
+    def message(self):
+        """A typed view of the 'message' in the data, or None."""
+        message = self.data.get("message")
+        return MessageView(message) if isinstance(message, dict) else None
+
+    @property
+    def channel(self):
+        """A typed view of the 'channel' in the data, or None."""
+        channel = self.data.get("channel")
+        return ChannelView(channel) if isinstance(channel, dict) else None
+
+    @property
+    def user(self):
+        """A typed view of the 'user' in the data, or None."""
+        user = self.data.get("user")
+        return UserView(user) if isinstance(user, dict) else None
+
     def validate(self):
         """Check if the response from Slack was successful.
 
@@ -170,7 +270,10 @@ class SlackResponse(object):
             SlackApiError: The request to the Slack API failed.
         """
         if self.status_code == 200 and self.data.get("ok", False):
-            self._logger.debug("Received the following response: %s", self.data)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Received the following response: %s", _data_repr.repr(self.data)
+                )
             return self
         msg = "The request to the Slack API failed."
         raise e.SlackApiError(message=msg, response=self)
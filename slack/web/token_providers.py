@@ -0,0 +1,236 @@
+"""A Python module for giving the WebClient tokens that expire or rotate.
+
+A client with a `token_provider` asks it for a token before each request,
+instead of holding a single `token`. When Slack rejects a token (e.g.
+'token_expired'), the request is sent once more with a fresh one.
+
+RefreshingTokenProvider refreshes its token in the background shortly
+before it expires, so that requests don't wait for the refresh, and
+concurrent requests needing a new token share a single refresh.
+OAuthTokenRotator refreshes with Slack's token rotation.
+
+Example:
+```python
+provider = OAuthTokenRotator(
+    client_id=client_id,
+    client_secret=client_secret,
+    refresh_token=installation.refresh_token,
+)
+client = WebClient(token_provider=provider)
+```
+"""
+
+# Standard Imports
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, NamedTuple, Optional
+
+# Internal Imports
+from slack.web.interceptors import ApiRequest, CallNext, Interceptor
+from slack.web.slack_response import SlackResponse
+import slack.errors as err
+
+# The errors of requests whose token is no longer valid.
+AUTH_ERRORS = {"invalid_auth", "not_authed", "token_expired", "token_revoked"}
+
+
+class AccessToken(NamedTuple):
+    """A token, and when it expires.
+
+    Attributes:
+        token (str): The token. e.g. 'xoxe.xoxb-1234'
+        expires_at (float): The time (as returned by `time.time()`) the
+            token expires at, or None if it doesn't expire.
+    """
+
+    token: str
+    expires_at: Optional[float] = None
+
+
+class TokenProvider:
+    """The interface of the providers giving a client its tokens."""
+
+    async def get_token(self) -> str:
+        """Returns the token of the next request."""
+        raise NotImplementedError
+
+    async def replace_token(self, rejected: str) -> str:
+        """Returns a token to replace one that Slack rejected.
+
+        Args:
+            rejected (str): The rejected token.
+        """
+        return await self.get_token()
+
+
+class RefreshingTokenProvider(TokenProvider):
+    """Provides tokens that `refresh` renews before they expire.
+
+    A token due to expire within `refresh_ahead` seconds is refreshed in
+    the background while it's still being used. Requests only wait for a
+    refresh when there's no token yet, when it has expired, or when Slack
+    rejected it. However many requests are waiting, there's a single refresh
+    at a time.
+
+    Attributes:
+        refresh_ahead (float): How many seconds before a token expires it's
+            refreshed. Default is 300.
+        refreshes (int): The number of refreshes that succeeded.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[], Awaitable[AccessToken]],
+        *,
+        token: Optional[AccessToken] = None,
+        refresh_ahead: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.refresh_ahead = refresh_ahead
+        self.refreshes = 0
+        self._refresh = refresh
+        self._token = token
+        self._clock = clock
+        self._refreshing: Optional[asyncio.Future] = None
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def token(self) -> Optional[AccessToken]:
+        """The current token."""
+        return self._token
+
+    async def get_token(self) -> str:
+        token = self._token
+        if token is None:
+            return await self._refreshed()
+        if token.expires_at is not None:
+            remaining = token.expires_at - self._clock()
+            if remaining <= 0:
+                return await self._refreshed()
+            if remaining <= self.refresh_ahead:
+                self._start_refresh()
+        return token.token
+
+    async def replace_token(self, rejected: str) -> str:
+        if self._token is not None and self._token.token != rejected:
+            # Another request already replaced it.
+            return self._token.token
+        return await self._refreshed()
+
+    def _start_refresh(self) -> asyncio.Future:
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._run_refresh())
+            # Background refreshes have no one awaiting them: their
+            # failures are logged, and retried by the next request.
+            self._refreshing.add_done_callback(
+                lambda future: future.cancelled() or future.exception()
+            )
+        return self._refreshing
+
+    async def _run_refresh(self) -> str:
+        try:
+            self._token = await self._refresh()
+            self.refreshes += 1
+            return self._token.token
+        except Exception:
+            self._logger.exception("The token couldn't be refreshed.")
+            raise
+        finally:
+            self._refreshing = None
+
+    async def _refreshed(self) -> str:
+        # Cancelling a waiting request doesn't cancel the shared refresh.
+        return await asyncio.shield(self._start_refresh())
+
+
+class OAuthTokenRotator(RefreshingTokenProvider):
+    """Refreshes tokens with Slack's token rotation ('oauth.v2.access').
+
+    Each refresh also rotates the refresh token: `on_rotate` is called with
+    the new AccessToken and refresh token, e.g. to save them.
+
+    Attributes:
+        refresh_token (str): The current refresh token.
+        client_id (str): The app's client id.
+        client_secret (str): The app's client secret.
+
+    Note:
+        The refreshes are requested by `client`, an async WebClient
+        (`run_async=True`), or by one of the provider's own.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        refresh_token: str,
+        token: Optional[AccessToken] = None,
+        refresh_ahead: float = 300,
+        on_rotate: Optional[Callable[[AccessToken, str], None]] = None,
+        client=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(
+            self._rotate, token=token, refresh_ahead=refresh_ahead, clock=clock
+        )
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_token = refresh_token
+        self._on_rotate = on_rotate
+        self._client = client
+
+    async def _rotate(self) -> AccessToken:
+        client = self._client
+        if client is None:
+            from slack.web.client import WebClient
+
+            client = self._client = WebClient(run_async=True)
+        response = await client.api_call(
+            "oauth.v2.access",
+            data={"grant_type": "refresh_token", "refresh_token": self.refresh_token},
+            auth={"client_id": self.client_id, "client_secret": self.client_secret},
+        )
+        token = AccessToken(
+            response["access_token"], self._clock() + response["expires_in"]
+        )
+        self.refresh_token = response["refresh_token"]
+        if self._on_rotate is not None:
+            self._on_rotate(token, self.refresh_token)
+        return token
+
+
+class TokenInterceptor(Interceptor):
+    """Sends each request with the provider's token, and retries it once with
+    a fresh token if Slack rejects the first.
+
+    Requests uploading file objects aren't retried, since the first attempt
+    has read them. Files given by their path are opened again.
+    """
+
+    def __init__(self, provider: TokenProvider):
+        self.provider = provider
+
+    async def intercept(
+        self, request: ApiRequest, call_next: CallNext
+    ) -> SlackResponse:
+        token = await self.provider.get_token()
+        try:
+            return await call_next(self._with_token(request, token))
+        except err.SlackApiError as e:
+            if e.response.get("error") not in AUTH_ERRORS:
+                raise
+            rejection = e
+        token = await self.provider.replace_token(token)
+        files = request.req_args.get("files") or {}
+        if any(not isinstance(file, str) for file in files.values()):
+            # The first attempt has read them: the following requests get
+            # the fresh token, but this one can't be sent again.
+            raise rejection
+        return await call_next(self._with_token(request, token))
+
+    @staticmethod
+    def _with_token(request: ApiRequest, token: str) -> ApiRequest:
+        headers = {**request.req_args["headers"], "Authorization": f"Bearer {token}"}
+        return request._replace(req_args={**request.req_args, "headers": headers})
@@ -0,0 +1,354 @@
+"""A Python module for the transports sending the WebClient's HTTP requests."""
+
+# Standard Imports
+import asyncio
+import json
+from ssl import SSLContext
+from typing import Callable, Mapping, NamedTuple, Optional, Union
+
+# ThirdParty Imports
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+
+class TransportResponse(NamedTuple):
+    """An HTTP response, as a transport received it.
+
+    Attributes:
+        status_code (int): The HTTP status code. e.g. 200
+        headers (CIMultiDictProxy): The response headers.
+        body (bytes): The response body, not decoded.
+        connection_reused (bool): Whether the request was sent over a
+            connection a previous request used, or None if it's unknown.
+        bytes_transferred (int): The size of the body as it was received,
+            compressed or not, or None if it's unknown.
+        bytes_sent (int): The size of the request body as it was encoded,
+            or None if it's unknown.
+    """
+
+    status_code: int
+    headers: CIMultiDictProxy
+    body: bytes
+    connection_reused: Optional[bool] = None
+    bytes_transferred: Optional[int] = None
+    bytes_sent: Optional[int] = None
+
+
+def _get_body_size(request_headers: Mapping, req_args: dict) -> Optional[int]:
+    """The size of the body a request was sent with, as its Content-Length
+    tells, or None if it's unknown (e.g. a chunked body)."""
+    content_length = request_headers.get("Content-Length")
+    if content_length is not None:
+        return int(content_length)
+    if not req_args.get("data") and req_args.get("json") is None:
+        return 0
+    return None
+
+
+class Transport:
+    """The interface of the transports sending the client's HTTP requests.
+
+    A transport only moves bytes: the client builds the request arguments
+    and decodes the response body.
+    """
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        """Sends a request and receives its response.
+
+        Args:
+            http_verb (str): The HTTP verb. e.g. 'GET' or 'POST'.
+            api_url (str): The Slack API url.
+                e.g. 'https://www.slack.com/api/chat.postMessage'
+            req_args (dict): The request arguments, as accepted by
+                `aiohttp.ClientSession.request`. e.g. 'headers', 'params',
+                'data', 'json', 'auth', 'ssl' and 'proxy'.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """Releases the connections held by the transport, if any."""
+
+
+def _decoded_headers(headers: CIMultiDictProxy) -> CIMultiDictProxy:
+    """The headers of a response whose body was decompressed, without the
+    Content-Encoding and Content-Length of the compressed body."""
+    if headers.get("Content-Encoding", "identity").lower() == "identity":
+        return headers
+    decoded = CIMultiDict(headers)
+    decoded.popall("Content-Encoding")
+    decoded.popall("Content-Length", None)
+    return CIMultiDictProxy(decoded)
+
+
+async def _on_connection_created(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx["connection_reused"] = False
+
+
+async def _on_connection_reused(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx["connection_reused"] = True
+
+
+class AiohttpTransport(Transport):
+    """Sends requests with aiohttp. It's the WebClient's default transport.
+
+    Attributes:
+        session (ClientSession): The session requests are sent with. When
+            it's None or closed, each request uses a session of its own.
+        timeout (int): The maximum number of seconds to wait for a
+            response, when requests use a session of their own.
+        persistent (bool): When true and there's no session, the first
+            request opens one that the following requests share, until the
+            transport is closed. Default is False.
+
+    Note:
+        Compressed responses are decompressed by aiohttp. Their size as
+        received is only known when Slack sends a Content-Length. Whether
+        requests reuse a connection is only known for the sessions the
+        transport opens.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: int = 30,
+        persistent: bool = False,
+    ):
+        self.session = session
+        self.timeout = timeout
+        self.persistent = persistent
+        self._owns_session = False
+        # Reports whether the requests of the transport's sessions reuse a
+        # connection, in their `trace_request_ctx`.
+        self._trace_config = aiohttp.TraceConfig()
+        self._trace_config.on_connection_create_end.append(_on_connection_created)
+        self._trace_config.on_connection_reuseconn.append(_on_connection_reused)
+        self._trace_config.freeze()
+
+    def _open_session(self, **kwargs) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[self._trace_config],
+            **kwargs,
+        )
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        if self.persistent and (self.session is None or self.session.closed):
+            # Opened on the running loop, which sessions are bound to.
+            self.session = self._open_session()
+            self._owns_session = True
+        use_running_session = self.session and not self.session.closed
+        if use_running_session:
+            session = self.session
+        else:
+            session = self._open_session(auth=req_args.pop("auth", None))
+        trace = None
+        if not use_running_session or self._owns_session:
+            trace = {"connection_reused": None}
+            req_args = {**req_args, "trace_request_ctx": trace}
+
+        try:
+            async with session.request(http_verb, api_url, **req_args) as res:
+                body = await res.read()
+                headers = res.headers
+                transferred = len(body)
+                if getattr(session, "auto_decompress", True):
+                    decoded = _decoded_headers(headers)
+                    if decoded is not headers:
+                        # Chunked responses have no Content-Length, so count
+                        # the bytes read where aiohttp does.
+                        transferred = getattr(
+                            res.content, "total_raw_bytes", res.content_length
+                        )
+                        headers = decoded
+                return TransportResponse(
+                    res.status,
+                    headers,
+                    body,
+                    trace["connection_reused"] if trace is not None else None,
+                    transferred,
+                    _get_body_size(res.request_info.headers, req_args),
+                )
+        finally:
+            if not use_running_session:
+                await session.close()
+
+    async def close(self):
+        """Closes the session the transport opened, if it's persistent."""
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+
+
+class HTTP2Transport(Transport):
+    """Multiplexes concurrent requests over a few HTTP/2 connections.
+
+    Thousands of concurrent calls share `connections` connections, instead
+    of needing a connection each as with HTTP/1.1. Each request goes to
+    the connection with the fewest requests in flight.
+
+    It requires httpx with HTTP/2 support, installed by the 'http2' extra:
+    `pip install slackclient[http2]`
+
+    Example:
+    ```python
+    transport = HTTP2Transport()
+    client = WebClient(token="xoxb-1", run_async=True, transport=transport)
+    await asyncio.gather(*(client.users_info(user=user) for user in users))
+    await transport.close()
+    ```
+
+    Note:
+        The transport's connections have their own SSL and proxy settings:
+        give them to the transport rather than to the WebClient. Files and
+        form data are sent from dicts, and bodies that are already encoded
+        from bytes or str; aiohttp's FormData isn't supported.
+        Servers that don't negotiate HTTP/2 are spoken HTTP/1.1 to, unless
+        `http1` is False: HTTP/2 is then used without negotiation, e.g. with
+        local test servers that don't use TLS.
+
+    Attributes:
+        clients (list): The httpx.AsyncClients requests are sent with, each
+            holding a single connection.
+        timeout (int): The maximum number of seconds to wait for a response.
+    """
+
+    def __init__(
+        self,
+        *,
+        connections: int = 4,
+        timeout: int = 30,
+        ssl: Optional[SSLContext] = None,
+        proxy: Optional[str] = None,
+        http1: bool = True,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "HTTP2Transport requires httpx with HTTP/2 support. "
+                "Install it with: pip install slackclient[http2]"
+            ) from e
+        self.timeout = timeout
+        # httpx doesn't open another connection when one has reached the
+        # server's limit of concurrent streams, so each client holds one.
+        self.clients = [
+            httpx.AsyncClient(
+                http1=http1,
+                http2=True,
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=1),
+                verify=ssl if ssl is not None else True,
+                proxy=proxy,
+            )
+            for _ in range(connections)
+        ]
+        self._in_flight = [0] * connections
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        data, files, content = req_args.get("data"), None, None
+        if isinstance(data, aiohttp.FormData):
+            raise TypeError("HTTP2Transport can't send aiohttp FormData.")
+        if isinstance(data, Mapping):
+            files = {k: v for k, v in data.items() if hasattr(v, "read")}
+            data = {k: v for k, v in data.items() if k not in files}
+        elif data is not None:
+            # An encoded body, e.g. the JSON of `chat_post_many`.
+            content, data = data, None
+        auth = req_args.get("auth")
+        if auth is not None:
+            auth = (auth.login, auth.password)
+
+        index = self._in_flight.index(min(self._in_flight))
+        self._in_flight[index] += 1
+        try:
+            res = await self.clients[index].request(
+                http_verb,
+                api_url,
+                headers=req_args.get("headers"),
+                params=req_args.get("params"),
+                json=req_args.get("json"),
+                content=content,
+                data=data or None,
+                files=files or None,
+                auth=auth,
+            )
+        finally:
+            self._in_flight[index] -= 1
+        # httpx decompresses the body.
+        headers = _decoded_headers(
+            CIMultiDictProxy(CIMultiDict(res.headers.multi_items()))
+        )
+        return TransportResponse(
+            res.status_code,
+            headers,
+            res.content,
+            bytes_transferred=res.num_bytes_downloaded,
+            bytes_sent=_get_body_size(res.request.headers, req_args),
+        )
+
+    async def close(self):
+        for client in self.clients:
+            await client.aclose()
+
+
+Handler = Callable[[str, str, dict], Union[dict, TransportResponse]]
+
+
+class InMemoryTransport(Transport):
+    """Answers requests in-process, without any network.
+
+    It lets tests and benchmarks exercise the whole client except the
+    network, e.g. to measure the client's own overhead.
+
+    Example:
+    ```python
+    def handler(http_verb, api_url, req_args):
+        return {"ok": True, "channel": req_args["json"]["channel"], "ts": "1.0"}
+
+    client = WebClient(token="xoxb-1", transport=InMemoryTransport(handler))
+    client.chat_postMessage(channel="C1234567890", text="Hello")
+    ```
+
+    Attributes:
+        handler (callable): Called with the HTTP verb, the url and the
+            request arguments of every request. It returns the response
+            data, which is encoded as JSON, or a TransportResponse. It may
+            be a coroutine function. Default answers {"ok": true}.
+        requests_sent (int): The number of requests answered.
+    """
+
+    def __init__(self, handler: Optional[Handler] = None):
+        self.handler = handler
+        self.requests_sent = 0
+
+    async def send(
+        self, *, http_verb: str, api_url: str, req_args: dict
+    ) -> TransportResponse:
+        self.requests_sent += 1
+        if self.handler is None:
+            response = {"ok": True}
+        else:
+            response = self.handler(http_verb, api_url, req_args)
+            if asyncio.iscoroutine(response):
+                response = await response
+        if isinstance(response, TransportResponse):
+            return response
+        return make_response(response)
+
+
+def make_response(
+    data: dict, *, status_code: int = 200, headers: Optional[Mapping] = None
+) -> TransportResponse:
+    """Builds the TransportResponse of some response data, encoded as JSON."""
+    response_headers = CIMultiDict({"Content-Type": "application/json; charset=utf-8"})
+    response_headers.update(headers or {})
+    body = json.dumps(data).encode("utf-8")
+    return TransportResponse(status_code, CIMultiDictProxy(response_headers), body)
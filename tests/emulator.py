@@ -0,0 +1,624 @@
+"""A local emulator of the Slack Web and RTM APIs, for tests and benchmarks.
+
+The emulator serves every method of `slack.web.api_methods.API_METHODS` from
+a synthetic workspace whose users and channels are shaped like those of
+`tests/data/rtm.start.json`. It paginates with cursors, enforces Slack's rate
+limit tiers with 429s and Retry-After, can delay its responses, and serves an
+RTM websocket that can be flooded with events, or replay recorded ones.
+
+Example:
+```python
+loop = asyncio.get_event_loop()
+emulator = SlackEmulator(Workspace(users=5000), latency=0.05, jitter=0.02)
+base_url = loop.run_until_complete(emulator.start())
+client = slack.WebClient(token="xoxb-1", base_url=base_url)
+members = [user for page in client.users_list(limit=200) for user in page["members"]]
+loop.run_until_complete(emulator.stop())
+```
+
+Usage:
+    python -m tests.emulator [--port 8765] [--users 1000] [--channels 100]
+        [--latency 0.0] [--jitter 0.0] [--rate-limit-window 60] [--event-rate 0]
+"""
+
+# Standard Imports
+import argparse
+import asyncio
+import base64
+import collections
+import hashlib
+import json
+import os
+import random
+import time
+from typing import Dict, List, Optional
+
+# ThirdParty Imports
+import aiohttp
+from aiohttp import web, WSCloseCode
+
+# Internal Imports
+from slack.recording import read_records
+from slack.web.api_methods import API_METHODS, TIER_LIMITS, TIER_SPECIAL, USER_TOKEN
+
+RTM_START_PATH = os.path.join(os.path.dirname(__file__), "data", "rtm.start.json")
+
+_WORDS = (
+    "deploy release build pipeline review merge branch incident on-call "
+    "dashboard latency error budget rollback canary config migration ticket "
+    "standup retro roadmap customer feedback design spec launch metrics"
+).split()
+
+
+def _encode(value) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class Workspace:
+    """A synthetic Slack workspace.
+
+    Users and channels are copies of those of `tests/data/rtm.start.json`,
+    each with their own ids, names, emails and avatars, so that payloads
+    have realistic sizes. Channel histories are generated when they're first
+    read, from a seeded random generator, so workspaces are reproducible.
+
+    Attributes:
+        team (dict): The team. e.g. {"id": "T03CX4S34", "name": ...}
+        self (dict): The user the tokens belong to.
+        users (list): The users, ids 'U00000000' onwards.
+        channels (list): The public channels, ids 'C00000000' onwards.
+        bots (list): The bots.
+        emoji (dict): Custom emoji names mapped to their URL.
+    """
+
+    def __init__(
+        self,
+        *,
+        users: int = 1000,
+        channels: int = 100,
+        members_per_channel: int = 100,
+        messages_per_channel: int = 200,
+        emoji: int = 200,
+        seed: int = 0,
+    ):
+        with open(RTM_START_PATH) as rtm_start:
+            template = json.load(rtm_start)
+        self.messages_per_channel = messages_per_channel
+        self._random = random.Random(seed)
+        self.team = template["team"]
+        self.self = template["self"]
+        self.bots = template["bots"]
+
+        user, channel = template["users"][0], template["channels"][0]
+        avatar_hash = "4f1bd7fd71e645fa19620504b4c0e3ba"
+
+        def make_user(n):
+            user_hash = hashlib.md5(str(n).encode()).hexdigest()
+            profile = {
+                key: value.replace(avatar_hash, user_hash)
+                for key, value in user["profile"].items()
+            }
+            profile["email"] = f"user{n}@example.com"
+            return {**user, "id": f"U{n:08d}", "name": f"user{n}", "profile": profile}
+
+        self.users = [make_user(n) for n in range(users)]
+        user_ids = [user["id"] for user in self.users]
+        self.channels = []
+        for n in range(channels):
+            start = (n * members_per_channel) % max(users, 1)
+            members = (user_ids[start:] + user_ids[:start])[:members_per_channel]
+            self.channels.append(
+                {
+                    **channel,
+                    "id": f"C{n:08d}",
+                    "name": f"channel{n}",
+                    "is_general": n == 0,
+                    "creator": user_ids[0] if user_ids else "",
+                    "members": members,
+                    "num_members": len(members),
+                }
+            )
+        self.emoji = {
+            f"emoji{n}": f"https://emoji.slack-edge.com/{self.team['id']}/emoji{n}/"
+            f"{hashlib.md5(str(n).encode()).hexdigest()[:16]}.png"
+            for n in range(emoji)
+        }
+        self._users_by_id = {user["id"]: user for user in self.users}
+        self._channels_by_id = {channel["id"]: channel for channel in self.channels}
+        self._histories: Dict[str, List[dict]] = {}
+        self._last_ts = time.time()
+
+    def user(self, user_id: str) -> Optional[dict]:
+        return self._users_by_id.get(user_id)
+
+    def channel(self, channel_id: str) -> Optional[dict]:
+        return self._channels_by_id.get(channel_id)
+
+    def next_ts(self) -> str:
+        """Returns a message timestamp later than every previous one."""
+        self._last_ts = max(time.time(), self._last_ts + 0.000001)
+        return f"{self._last_ts:.6f}"
+
+    def history(self, channel_id: str) -> List[dict]:
+        """The messages of a channel, newest first."""
+        history = self._histories.get(channel_id)
+        if history is None:
+            members = self._channels_by_id[channel_id]["members"]
+            history = self._histories[channel_id] = [
+                self.make_message(channel_id, self._random.choice(members), ts=ts)
+                for ts in (
+                    f"{self._last_ts - n:.6f}"
+                    for n in range(1, self.messages_per_channel + 1)
+                )
+            ]
+        return history
+
+    def make_message(self, channel_id: str, user_id: str, ts: str, text: str = None):
+        """Builds a message like those of conversations.history."""
+        if text is None:
+            text = " ".join(self._random.choices(_WORDS, k=self._random.randint(8, 40)))
+        return {
+            "type": "message",
+            "user": user_id,
+            "text": text,
+            "ts": ts,
+            "team": self.team["id"],
+            "blocks": [
+                {
+                    "type": "rich_text",
+                    "block_id": hashlib.md5(ts.encode()).hexdigest()[:5],
+                    "elements": [
+                        {
+                            "type": "rich_text_section",
+                            "elements": [{"type": "text", "text": text}],
+                        }
+                    ],
+                }
+            ],
+        }
+
+    def rtm_start(self) -> dict:
+        """The payload of rtm.start, without its url."""
+        return {
+            "ok": True,
+            "self": self.self,
+            "team": self.team,
+            "latest_event_ts": self.next_ts(),
+            "channels": self.channels,
+            "groups": [],
+            "ims": [],
+            "users": self.users,
+            "bots": self.bots,
+            "cache_version": "v16-giraffe",
+        }
+
+
+class SlackEmulator:
+    """An aiohttp application serving a Workspace like Slack would.
+
+    Every method of API_METHODS is served at '/api/<method>': methods with
+    realistic payloads (e.g. 'users.list', 'conversations.history',
+    'chat.postMessage') answer from the workspace, paginated methods with
+    no data answer with empty pages, and the other methods answer
+    {"ok": true}. The RTM websocket is served at '/rtm'.
+
+    Attributes:
+        workspace (Workspace): The workspace served.
+        latency (float): The number of seconds every response is delayed by.
+        jitter (float): The maximum random variation of the latency, in seconds.
+        rate_limit_window (float): The number of seconds over which the rate
+            limit tiers are enforced. Slack's is 60; tests can shrink it to
+            rate limit sooner. chat.postMessage accepts a message per channel
+            every `rate_limit_window / 60` seconds.
+        rate_limits (bool): Whether rate limits are enforced. Default is True.
+        page_size (int): The number of items in a page when no 'limit' is given.
+        event_rate (float): The number of message events sent each second to
+            every RTM connection. Default is 0, i.e. only flood() sends events.
+        calls (Counter): The number of calls of each method.
+        rate_limited (int): The number of calls answered with a 429.
+        events_sent (int): The number of RTM events sent.
+    """
+
+    def __init__(
+        self,
+        workspace: Optional[Workspace] = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_window: float = 60.0,
+        rate_limits: bool = True,
+        page_size: int = 100,
+        event_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        self.workspace = workspace if workspace is not None else Workspace()
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_window = rate_limit_window
+        self.rate_limits = rate_limits
+        self.page_size = page_size
+        self.event_rate = event_rate
+        self.calls = collections.Counter()
+        self.rate_limited = 0
+        self.events_sent = 0
+        self.base_url = None
+        self._random = random.Random(seed)
+        self._requests = collections.defaultdict(collections.deque)
+        self._encoded: Dict[int, bytes] = {}
+        self._sockets = set()
+        self._runner = None
+        self._handlers = {
+            "api.test": self._api_test,
+            "auth.test": self._auth_test,
+            "bots.info": self._bots_info,
+            "chat.postMessage": self._chat_post_message,
+            "chat.update": self._chat_update,
+            "conversations.history": self._conversations_history,
+            "conversations.info": self._conversations_info,
+            "conversations.list": self._conversations_list,
+            "conversations.members": self._conversations_members,
+            "emoji.list": self._emoji_list,
+            "rtm.connect": self._rtm_connect,
+            "rtm.start": self._rtm_start,
+            "team.info": self._team_info,
+            "users.info": self._users_info,
+            "users.list": self._users_list,
+        }
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/api/{method}", self._api)
+        app.router.add_get("/rtm", self._rtm)
+        app.on_shutdown.append(self._close_sockets)
+        return app
+
+    async def start(self, host: str = "localhost", port: int = 0) -> str:
+        """Serves the emulator on a local port (by default, any free port).
+
+        Returns:
+            The base_url to give the WebClient. e.g. 'http://localhost:8765/api/'
+        """
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}/api/"
+        return self.base_url
+
+    async def stop(self):
+        """Closes the RTM connections and stops serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def flood(self, count: int, event: Optional[dict] = None) -> int:
+        """Sends events to every RTM connection, as fast as they're accepted.
+
+        Args:
+            count (int): The number of events sent to each connection.
+            event (dict): The event to send. Default is a message event from
+                a random member of a random channel.
+
+        Returns:
+            The number of events sent.
+        """
+        sent = 0
+        for websocket in list(self._sockets):
+            for _ in range(count):
+                if websocket.closed:
+                    break
+                await websocket.send_str(json.dumps(event or self._message_event()))
+                sent += 1
+        self.events_sent += sent
+        return sent
+
+    async def replay(self, path: str, speed: float = 1.0) -> int:
+        """Sends the frames of a recording to every RTM connection.
+
+        Args:
+            path (str): A recording of a `slack.recording.FrameRecorder`.
+            speed (float): How much faster than recorded the frames are sent.
+                Default is 1, i.e. with the recorded timing. 0 sends the
+                frames as fast as they're accepted.
+
+        Returns:
+            The number of frames sent.
+        """
+        sent = 0
+        start = time.monotonic()
+        for record in read_records(path):
+            if json.loads(record["frame"]).get("type") == "hello":
+                continue
+            if speed:
+                delay = record["t"] / speed - (time.monotonic() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            for websocket in list(self._sockets):
+                if not websocket.closed:
+                    await websocket.send_str(record["frame"])
+                    sent += 1
+        self.events_sent += sent
+        return sent
+
+    # Web API
+
+    async def _api(self, request: web.Request) -> web.Response:
+        name = request.match_info["method"]
+        args = dict(request.query)
+        if request.method == "POST" and request.body_exists:
+            if request.content_type == "application/json":
+                args.update(await request.json())
+            else:
+                args.update(await request.post())
+
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        spec = API_METHODS.get(name)
+        if spec is None:
+            return web.json_response({"ok": False, "error": "unknown_method"})
+        token = args.pop("token", None)
+        authorization = request.headers.get("Authorization", "")
+        scheme, _, credentials = authorization.partition(" ")
+        if scheme == "Bearer":
+            token = credentials
+        elif scheme == "Basic":
+            token = authorization
+        if not token:
+            return web.json_response({"ok": False, "error": "not_authed"})
+        if spec.token_type == USER_TOKEN and token.startswith("xoxb"):
+            return web.json_response({"ok": False, "error": "not_allowed_token_type"})
+
+        self.calls[name] += 1
+        if self.rate_limits:
+            retry_after = self._check_rate_limit(spec, token, args)
+            if retry_after is not None:
+                self.rate_limited += 1
+                return web.json_response(
+                    {"ok": False, "error": "ratelimited"},
+                    status=429,
+                    headers={"Retry-After": f"{retry_after:.3g}"},
+                )
+
+        handler = self._handlers.get(name)
+        if handler is not None:
+            response = handler(request, args)
+        elif spec.pagination_key is not None:
+            response = self._page(spec.pagination_key, [], args)
+        else:
+            response = {"ok": True}
+        if isinstance(response, dict):
+            response = web.json_response(response)
+        return response
+
+    def _check_rate_limit(self, spec, token: str, args: dict) -> Optional[float]:
+        """Records a call, returning how long to wait if it's over the limit."""
+        if spec.rate_limit_tier == TIER_SPECIAL:
+            # e.g. chat.postMessage: a message per second in each channel.
+            key = (token, spec.name, args.get("channel"))
+            limit, window = 1, self.rate_limit_window / 60
+        else:
+            key = (token, spec.name)
+            limit, window = TIER_LIMITS[spec.rate_limit_tier], self.rate_limit_window
+        now = time.monotonic()
+        calls = self._requests[key]
+        while calls and calls[0] <= now - window:
+            calls.popleft()
+        if len(calls) >= limit:
+            return calls[0] + window - now
+        calls.append(now)
+        return None
+
+    def _page(self, key: str, items: list, args: dict) -> web.Response:
+        """Answers with a page of the items, like Slack's cursor pagination.
+
+        Items are encoded once and reused by every page including them.
+        """
+        try:
+            limit = max(1, min(int(args.get("limit") or self.page_size), 1000))
+            cursor = args.get("cursor")
+            offset = 0
+            if cursor:
+                prefix, _, value = base64.b64decode(cursor).decode().partition(":")
+                if prefix != "offset":
+                    raise ValueError(cursor)
+                offset = int(value)
+        except ValueError:
+            return web.json_response({"ok": False, "error": "invalid_cursor"})
+
+        encoded = []
+        end = offset + limit
+        for item in items[offset:end]:
+            body = self._encoded.get(id(item))
+            if body is None:
+                body = self._encoded[id(item)] = _encode(item)
+            encoded.append(body)
+        next_offset = offset + limit
+        next_cursor = ""
+        if next_offset < len(items):
+            next_cursor = base64.b64encode(f"offset:{next_offset}".encode()).decode()
+        body = b'{"ok":true,"%s":[%s],"has_more":%s,"response_metadata":%s}' % (
+            key.encode(),
+            b",".join(encoded),
+            b"true" if next_cursor else b"false",
+            _encode({"next_cursor": next_cursor}),
+        )
+        return web.Response(body=body, content_type="application/json")
+
+    def _api_test(self, request, args):
+        return {"ok": True, "args": {key: str(value) for key, value in args.items()}}
+
+    def _auth_test(self, request, args):
+        team, user = self.workspace.team, self.workspace.self
+        return {
+            "ok": True,
+            "url": f"https://{team['domain']}.slack.com/",
+            "team": team["name"],
+            "user": user["name"],
+            "team_id": team["id"],
+            "user_id": user["id"],
+        }
+
+    def _bots_info(self, request, args):
+        for bot in self.workspace.bots:
+            if bot["id"] == args.get("bot"):
+                return {"ok": True, "bot": bot}
+        return {"ok": False, "error": "bot_not_found"}
+
+    def _chat_post_message(self, request, args):
+        channel = args.get("channel")
+        if self.workspace.channel(channel) is None:
+            return {"ok": False, "error": "channel_not_found"}
+        message = self.workspace.make_message(
+            channel,
+            self.workspace.self["id"],
+            ts=self.workspace.next_ts(),
+            text=args.get("text", ""),
+        )
+        for key in ("blocks", "attachments", "thread_ts"):
+            if key in args:
+                message[key] = args[key]
+        self.workspace.history(channel).insert(0, message)
+        return {"ok": True, "channel": channel, "ts": message["ts"], "message": message}
+
+    def _chat_update(self, request, args):
+        channel = args.get("channel")
+        if self.workspace.channel(channel) is None:
+            return {"ok": False, "error": "channel_not_found"}
+        for message in self.workspace.history(channel):
+            if message["ts"] == args.get("ts"):
+                self._encoded.pop(id(message), None)
+                for key in ("text", "blocks", "attachments"):
+                    if key in args:
+                        message[key] = args[key]
+                return {"ok": True, "channel": channel, "ts": message["ts"]}
+        return {"ok": False, "error": "message_not_found"}
+
+    def _conversations_history(self, request, args):
+        channel = args.get("channel")
+        if self.workspace.channel(channel) is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return self._page("messages", self.workspace.history(channel), args)
+
+    def _conversations_info(self, request, args):
+        channel = self.workspace.channel(args.get("channel"))
+        if channel is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return {"ok": True, "channel": channel}
+
+    def _conversations_list(self, request, args):
+        return self._page("channels", self.workspace.channels, args)
+
+    def _conversations_members(self, request, args):
+        channel = self.workspace.channel(args.get("channel"))
+        if channel is None:
+            return {"ok": False, "error": "channel_not_found"}
+        return self._page("members", channel["members"], args)
+
+    def _emoji_list(self, request, args):
+        return {"ok": True, "emoji": self.workspace.emoji}
+
+    def _rtm_connect(self, request, args):
+        return {
+            "ok": True,
+            "url": self._rtm_url(request),
+            "team": self.workspace.team,
+            "self": self.workspace.self,
+        }
+
+    def _rtm_start(self, request, args):
+        return {**self.workspace.rtm_start(), "url": self._rtm_url(request)}
+
+    def _team_info(self, request, args):
+        return {"ok": True, "team": self.workspace.team}
+
+    def _users_info(self, request, args):
+        user = self.workspace.user(args.get("user"))
+        if user is None:
+            return {"ok": False, "error": "user_not_found"}
+        return {"ok": True, "user": user}
+
+    def _users_list(self, request, args):
+        return self._page("members", self.workspace.users, args)
+
+    # RTM API
+
+    @staticmethod
+    def _rtm_url(request: web.Request) -> str:
+        return str(request.url.with_scheme("ws").with_path("/rtm").with_query(None))
+
+    def _message_event(self) -> dict:
+        workspace = self.workspace
+        channel = self._random.choice(workspace.channels)
+        user = self._random.choice(channel["members"])
+        message = workspace.make_message(channel["id"], user, ts=workspace.next_ts())
+        return {**message, "channel": channel["id"], "event_ts": message["ts"]}
+
+    async def _rtm(self, request: web.Request) -> web.WebSocketResponse:
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self._sockets.add(websocket)
+        await websocket.send_json({"type": "hello"})
+        stream = None
+        if self.event_rate > 0:
+            stream = asyncio.ensure_future(self._stream_events(websocket))
+        try:
+            async for message in websocket:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                payload = message.json()
+                if payload.get("type") == "ping":
+                    reply = {"type": "pong", "reply_to": payload.get("id")}
+                else:
+                    reply = {"ok": True, "reply_to": payload.get("id")}
+                    if payload.get("type") == "message":
+                        reply.update(
+                            ts=self.workspace.next_ts(), text=payload.get("text", "")
+                        )
+                await websocket.send_json(reply)
+        finally:
+            self._sockets.discard(websocket)
+            if stream is not None:
+                stream.cancel()
+        return websocket
+
+    async def _stream_events(self, websocket: web.WebSocketResponse):
+        interval = 1 / self.event_rate
+        while not websocket.closed:
+            await websocket.send_str(json.dumps(self._message_event()))
+            self.events_sent += 1
+            await asyncio.sleep(interval)
+
+    async def _close_sockets(self, app):
+        for websocket in list(self._sockets):
+            await websocket.close(code=WSCloseCode.GOING_AWAY, message=b"Shutdown")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--channels", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit-window", type=float, default=60.0)
+    parser.add_argument("--no-rate-limits", action="store_true")
+    parser.add_argument("--event-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    emulator = SlackEmulator(
+        Workspace(users=args.users, channels=args.channels),
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_window=args.rate_limit_window,
+        rate_limits=not args.no_rate_limits,
+        event_rate=args.event_rate,
+    )
+    print(f"Serving the Slack emulator at http://{args.host}:{args.port}/api/")
+    web.run_app(emulator.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
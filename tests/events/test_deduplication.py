@@ -0,0 +1,110 @@
+# Standard Imports
+import os
+import tempfile
+import unittest
+
+# Internal Imports
+from slack.events import (
+    EventDeduplicator,
+    MemoryDeduplicationStore,
+    SQLiteDeduplicationStore,
+)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestMemoryDeduplicationStore(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.store = MemoryDeduplicationStore(max_size=2, ttl=60, clock=self.clock)
+
+    def test_add_reports_new_event_ids(self):
+        self.assertTrue(self.store.add("Ev1"))
+        self.assertFalse(self.store.add("Ev1"))
+
+    def test_event_ids_expire(self):
+        self.store.add("Ev1")
+        self.clock.now += 61
+        self.assertTrue(self.store.add("Ev1"))
+
+    def test_least_recently_seen_event_ids_are_evicted(self):
+        self.store.add("Ev1")
+        self.store.add("Ev2")
+        self.store.add("Ev1")
+        self.store.add("Ev3")
+        self.assertEqual(len(self.store), 2)
+        self.assertFalse(self.store.add("Ev1"))
+        self.assertTrue(self.store.add("Ev2"))
+
+    def test_discard_forgets_event_ids(self):
+        self.store.add("Ev1")
+        self.store.discard("Ev1")
+        self.store.discard("Ev2")
+        self.assertTrue(self.store.add("Ev1"))
+
+
+class TestSQLiteDeduplicationStore(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "events.db")
+        self.clock = FakeClock()
+
+    def store(self):
+        store = SQLiteDeduplicationStore(self.path, ttl=60, clock=self.clock)
+        self.addCleanup(store.close)
+        return store
+
+    def test_event_ids_are_shared_between_stores(self):
+        first, second = self.store(), self.store()
+        self.assertTrue(first.add("Ev1"))
+        self.assertFalse(second.add("Ev1"))
+
+    def test_event_ids_expire(self):
+        store = self.store()
+        store.add("Ev1")
+        self.clock.now += 61
+        self.assertTrue(store.add("Ev1"))
+        self.assertFalse(store.add("Ev1"))
+
+    def test_discard_forgets_event_ids(self):
+        store = self.store()
+        store.add("Ev1")
+        store.discard("Ev1")
+        self.assertTrue(store.add("Ev1"))
+
+
+class TestEventDeduplicator(unittest.TestCase):
+    def setUp(self):
+        self.deduplicator = EventDeduplicator()
+
+    def test_is_duplicate_counts_deliveries(self):
+        envelope = {"type": "event_callback", "event_id": "Ev1"}
+        self.assertFalse(self.deduplicator.is_duplicate(envelope, {}))
+        self.assertTrue(
+            self.deduplicator.is_duplicate(envelope, {"X-Slack-Retry-Num": "1"})
+        )
+        self.assertEqual(self.deduplicator.misses, 1)
+        self.assertEqual(self.deduplicator.hits, 1)
+        self.assertEqual(self.deduplicator.retries, 1)
+
+    def test_payloads_without_event_ids_are_never_duplicates(self):
+        payload = {"type": "block_actions"}
+        self.assertFalse(self.deduplicator.is_duplicate(payload, {}))
+        self.assertFalse(self.deduplicator.is_duplicate(payload, {}))
+
+    def test_forgotten_events_are_handled_again(self):
+        envelope = {"event_id": "Ev1"}
+        self.deduplicator.is_duplicate(envelope, {})
+        self.deduplicator.forget(envelope)
+        self.assertFalse(self.deduplicator.is_duplicate(envelope, {}))
+
+    def test_empty_stores_are_used(self):
+        store = MemoryDeduplicationStore()
+        self.assertIs(EventDeduplicator(store).store, store)
@@ -0,0 +1,212 @@
+# Standard Imports
+import collections
+import json
+import time
+import unittest
+from urllib.parse import urlencode
+
+# ThirdParty Imports
+import asyncio
+from aiohttp.test_utils import TestClient, TestServer
+
+# Internal Imports
+from slack.events import EventsApiReceiver
+from slack.signature import SignatureVerifier
+from slack.web.classes.interactions import SlashCommandInteractiveEvent
+import slack.errors as e
+
+SIGNING_SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+
+
+class TestEventsApiReceiver(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.receiver = EventsApiReceiver(signing_secret=SIGNING_SECRET, token="xoxb-1")
+        self.signer = SignatureVerifier(SIGNING_SECRET)
+        self.client = TestClient(TestServer(self.receiver.app), loop=self.loop)
+        self.loop.run_until_complete(self.client.start_server())
+        self.received = asyncio.Queue()
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.client.close())
+        EventsApiReceiver._callbacks = collections.defaultdict(list)
+
+    def post(
+        self, body, content_type="application/json", signature=None, timestamp=None
+    ):
+        timestamp = timestamp or str(int(time.time()))
+        headers = {
+            "Content-Type": content_type,
+            "X-Slack-Request-Timestamp": timestamp,
+            "X-Slack-Signature": signature
+            or self.signer.generate_signature(timestamp=timestamp, body=body),
+        }
+        return self.loop.run_until_complete(
+            self.client.post("/slack/events", data=body, headers=headers)
+        )
+
+    def next_payload(self):
+        return self.loop.run_until_complete(
+            asyncio.wait_for(self.received.get(), timeout=1)
+        )
+
+    def test_url_verification_is_answered(self):
+        body = json.dumps({"type": "url_verification", "challenge": "3eZbrw1aBm2"})
+        response = self.post(body)
+        self.assertEqual(response.status, 200)
+        payload = self.loop.run_until_complete(response.json())
+        self.assertEqual(payload, {"challenge": "3eZbrw1aBm2"})
+
+    def test_requests_with_invalid_signatures_are_rejected(self):
+        body = json.dumps({"type": "url_verification", "challenge": "3eZbrw1aBm2"})
+        response = self.post(body, signature="v0=invalid")
+        self.assertEqual(response.status, 401)
+
+    def test_events_are_dispatched_to_callbacks(self):
+        @EventsApiReceiver.run_on(event="app_mention")
+        async def on_mention(**payload):
+            await self.received.put(payload)
+
+        event = {"type": "app_mention", "text": "<@U0LAN0Z89> hi", "channel": "C1"}
+        body = json.dumps(
+            {
+                "type": "event_callback",
+                "event_id": "Ev1",
+                "team_id": "T1",
+                "event": event,
+            }
+        )
+        response = self.post(body)
+        self.assertEqual(response.status, 200)
+
+        payload = self.next_payload()
+        self.assertEqual(payload["data"], event)
+        self.assertEqual(payload["envelope"]["event_id"], "Ev1")
+        self.assertIs(payload["receiver"], self.receiver)
+        self.assertTrue(payload["web_client"].run_async)
+
+    def test_sync_callbacks_run_outside_the_event_loop(self):
+        @EventsApiReceiver.run_on(event="app_mention")
+        def on_mention(**payload):
+            self.loop.call_soon_threadsafe(self.received.put_nowait, payload)
+
+        body = json.dumps({"type": "event_callback", "event": {"type": "app_mention"}})
+        self.post(body)
+
+        payload = self.next_payload()
+        self.assertEqual(payload["data"], {"type": "app_mention"})
+        self.assertFalse(payload["web_client"].run_async)
+
+    def test_interactive_payloads_are_dispatched_by_type(self):
+        @EventsApiReceiver.run_on(event="view_submission")
+        async def on_submission(**payload):
+            await self.received.put(payload)
+
+        interaction = {"type": "view_submission", "view": {"id": "V1"}}
+        body = urlencode({"payload": json.dumps(interaction)})
+        self.post(body, content_type="application/x-www-form-urlencoded")
+
+        payload = self.next_payload()
+        self.assertEqual(payload["data"], interaction)
+        self.assertIsNone(payload["interaction"])
+
+    def test_slash_commands_are_dispatched_by_command(self):
+        @EventsApiReceiver.run_on(event="/weather")
+        async def on_weather(**payload):
+            await self.received.put(payload)
+
+        command = {
+            "command": "/weather",
+            "text": "94070",
+            "response_url": "https://hooks.slack.com/commands/1234/5678",
+            "trigger_id": "13345224609.738474920.8088930838d88f008e0",
+            "user_id": "U2147483697",
+            "user_name": "Steve",
+            "channel_id": "C2147483705",
+            "channel_name": "test",
+            "team_id": "T0001",
+            "team_domain": "example",
+        }
+        self.post(urlencode(command), content_type="application/x-www-form-urlencoded")
+
+        payload = self.next_payload()
+        self.assertIsInstance(payload["interaction"], SlashCommandInteractiveEvent)
+        self.assertEqual(payload["interaction"].text, "94070")
+
+    def test_requests_are_rejected_when_the_queue_is_full(self):
+        # Stop the workers so that queued events stay in the queue.
+        self.loop.run_until_complete(self.receiver._stop_workers(None))
+        self.receiver._queue = asyncio.Queue(maxsize=1)
+        for event_id, status in (("Ev1", 200), ("Ev2", 503)):
+            body = json.dumps(
+                {
+                    "type": "event_callback",
+                    "event_id": event_id,
+                    "event": {"type": "app_mention"},
+                }
+            )
+            self.assertEqual(self.post(body).status, status)
+
+    def test_retries_are_acknowledged_but_not_dispatched(self):
+        @EventsApiReceiver.run_on(event="app_mention")
+        async def on_mention(**payload):
+            await self.received.put(payload)
+
+        envelope = {
+            "type": "event_callback",
+            "event_id": "Ev1",
+            "event": {"type": "app_mention"},
+        }
+        self.assertEqual(self.post(json.dumps(envelope)).status, 200)
+        self.next_payload()
+
+        # Slack retries with a new timestamp and signature.
+        timestamp = str(int(time.time()) - 1)
+        response = self.post(json.dumps(envelope), timestamp=timestamp)
+        self.assertEqual(response.status, 200)
+        self.loop.run_until_complete(self.receiver._queue.join())
+        self.assertTrue(self.received.empty())
+        self.assertEqual(self.receiver.deduplicator.hits, 1)
+
+    def test_events_dropped_when_the_queue_is_full_are_handled_on_retry(self):
+        self.loop.run_until_complete(self.receiver._stop_workers(None))
+        self.receiver._queue = asyncio.Queue(maxsize=1)
+        self.receiver._queue.put_nowait(("app_mention", {}))
+
+        body = json.dumps(
+            {
+                "type": "event_callback",
+                "event_id": "Ev1",
+                "event": {"type": "app_mention"},
+            }
+        )
+        self.assertEqual(self.post(body).status, 503)
+        self.receiver._queue.get_nowait()
+        timestamp = str(int(time.time()) - 1)
+        self.assertEqual(self.post(body, timestamp=timestamp).status, 200)
+
+    def test_malformed_bodies_are_rejected(self):
+        self.assertEqual(self.post("not json").status, 400)
+        self.assertEqual(self.post(json.dumps({"type": "event_callback"})).status, 400)
+        self.assertEqual(self.post("[]").status, 400)
+        self.assertEqual(self.post('"x"').status, 400)
+        form = urlencode({"payload": "[]"})
+        response = self.post(form, content_type="application/x-www-form-urlencoded")
+        self.assertEqual(response.status, 400)
+
+    def test_run_on_validates_callbacks(self):
+        with self.assertRaises(e.SlackClientError):
+
+            @EventsApiReceiver.run_on(event="app_mention")
+            def invalid_callback():
+                pass
+
+    def test_callbacks_are_not_shared_with_the_rtm_client(self):
+        from slack.rtm.client import RTMClient
+
+        @EventsApiReceiver.run_on(event="message")
+        def on_message(**payload):
+            pass
+
+        self.assertNotIn(on_message, RTMClient._callbacks["message"])
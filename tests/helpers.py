@@ -8,6 +8,15 @@ import asyncio
 from slack.web.slack_response import SlackResponse
 
 
+def as_coroutine(func):
+    """Wraps a regular callable so that calling it returns an awaitable."""
+
+    async def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def fake_req_args(headers=ANY, data=ANY, params=ANY, json=ANY):
     req_args = {
         "headers": headers,
@@ -56,7 +65,7 @@ def mock_rtm_response():
         "status_code": 200,
     }
     coro.return_value = SlackResponse(**data)
-    corofunc = Mock(name="mock_rtm_response", side_effect=asyncio.coroutine(coro))
+    corofunc = Mock(name="mock_rtm_response", side_effect=as_coroutine(coro))
     corofunc.coro = coro
     return corofunc
 
@@ -76,6 +85,6 @@ def mock_request():
     data = {"data": {"ok": True}, "headers": ANY, "status_code": 200}
     response_mock.return_value = data
 
-    send_request = Mock(name="Request", side_effect=asyncio.coroutine(response_mock))
+    send_request = Mock(name="Request", side_effect=as_coroutine(response_mock))
     send_request.response = response_mock
     return send_request
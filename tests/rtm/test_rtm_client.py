@@ -96,3 +96,20 @@ class TestRTMClient(unittest.TestCase):
 
         expected_error = "Unable to retreive RTM URL from Slack"
         self.assertIn(expected_error, str(context.exception))
+
+    @mock.patch("slack.WebClient._send", new_callable=mock_rtm_response)
+    def test_rtm_start_seeds_the_entity_cache(self, mock_rtm_response):
+        from slack.web.entity_cache import USER, EntityCache
+
+        users = [{"id": "U1", "name": "spengler"}]
+        mock_rtm_response.coro.return_value.data["users"] = users
+        cache = EntityCache()
+        client = slack.RTMClient(
+            token="xoxp-1234",
+            auto_reconnect=False,
+            connect_method="rtm.start",
+            entity_cache=cache,
+        )
+        asyncio.get_event_loop().run_until_complete(client._retreive_websocket_info())
+        self.assertEqual(cache.get(USER, "U1"), users[0])
+        self.assertIs(client._web_client.entity_cache, cache)
@@ -142,6 +142,26 @@ class TestRTMClientFunctional(unittest.TestCase):
             req_args=fake_send_req_args(),
         )
 
+    def test_open_event_receives_a_compact_snapshot_when_specified(
+        self, mock_rtm_response
+    ):
+        from slack.rtm.snapshot import EntityTable
+
+        users = [{"id": "U1", "name": "spengler"}]
+        mock_rtm_response.coro.return_value.data["users"] = users
+        received = []
+
+        @slack.RTMClient.run_on(event="open")
+        def stop_on_open(**payload):
+            received.append(payload["data"])
+            payload["rtm_client"].stop()
+
+        self.client.compact_snapshot = True
+        self.client.start()
+        self.assertIsInstance(received[0]["users"], EntityTable)
+        self.assertEqual(received[0]["users"].get("U1"), users[0])
+        self.assertEqual(received[0]["self"]["name"], "robotoverlord")
+
     def test_send_over_websocket_sends_expected_message(self, mock_rtm_response):
         @slack.RTMClient.run_on(event="open")
         def echo_message(**payload):
@@ -0,0 +1,53 @@
+# Standard Imports
+import json
+import os
+import unittest
+
+# Internal Imports
+from slack.rtm.snapshot import EntityTable, compact_snapshot
+
+RTM_START_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "rtm.start.json")
+
+
+class TestEntityTable(unittest.TestCase):
+    def setUp(self):
+        with open(RTM_START_PATH) as rtm_start:
+            self.data = json.load(rtm_start)
+        self.users = EntityTable(self.data["users"])
+
+    def test_records_are_decoded_on_access(self):
+        self.assertEqual(len(self.users), len(self.data["users"]))
+        self.assertEqual(list(self.users), self.data["users"])
+        self.assertEqual(self.users[-1], self.data["users"][-1])
+        self.assertEqual(self.users[:2], self.data["users"][:2])
+        with self.assertRaises(IndexError):
+            self.users[len(self.users)]
+
+    def test_records_are_found_by_id(self):
+        user = self.data["users"][1]
+        self.assertEqual(self.users.get(user["id"]), user)
+        self.assertEqual(self.users.index_of(user["id"]), 1)
+        self.assertEqual(self.users.name_of(user["id"]), user["name"])
+        self.assertIsNone(self.users.get("U0000000"))
+        with self.assertRaises(KeyError):
+            self.users.index_of("U0000000")
+
+    def test_records_without_names(self):
+        ims = EntityTable(self.data["ims"])
+        self.assertEqual(ims.names, [None])
+        self.assertEqual(ims[0], self.data["ims"][0])
+
+    def test_empty_tables(self):
+        self.assertEqual(list(EntityTable([])), [])
+
+
+class TestCompactSnapshot(unittest.TestCase):
+    def test_entity_lists_are_replaced(self):
+        with open(RTM_START_PATH) as rtm_start:
+            data = json.load(rtm_start)
+        compacted = compact_snapshot(data)
+        self.assertIsInstance(compacted["users"], EntityTable)
+        self.assertIsInstance(compacted["groups"], EntityTable)
+        self.assertEqual(compacted["self"], data["self"])
+        self.assertEqual(list(compacted["channels"]), data["channels"])
+        self.assertIsInstance(data["users"], list)
@@ -0,0 +1,152 @@
+# Standard Imports
+import hashlib
+import hmac
+import unittest
+
+# Internal Imports
+from slack.signature import SignatureVerifier
+from slack.web.base_client import BaseClient
+
+
+class TestSignatureVerifier(unittest.TestCase):
+    def setUp(self):
+        # https://api.slack.com/docs/verifying-requests-from-slack
+        self.signing_secret = "8f742231b10e8888abcd99yyyzzz85a5"
+        self.body = (
+            "token=xyzz0WbapA4vBCDEFasx0q6G&team_id=T1DC2JH3J&team_domain=testteamnow&channel_id=G8PSS9T3V"
+            "&channel_name=foobar&user_id=U2CERLKJA&user_name=roadrunner&command=%2Fwebhook-collect&text="
+            "&response_url=https%3A%2F%2Fhooks.slack.com%2Fcommands%2FT1DC2JH3J%2F397700885554%2F96rGlfmibIGlgcZRskXaIFfN"
+            "&trigger_id=398738663015.47445629121.803a0bc887a14d10d2c447fce8b6703c"
+        )
+        self.timestamp = "1531420618"
+        self.valid_signature = (
+            "v0=a2114d57b48eac39b9ad189dd8316235a7b4a8d21a10bd27519666489c69b503"
+        )
+        self.now = 1531420618.0
+        self.verifier = SignatureVerifier(self.signing_secret, clock=lambda: self.now)
+
+    def test_generate_signature(self):
+        signature = self.verifier.generate_signature(
+            timestamp=self.timestamp, body=self.body
+        )
+        self.assertEqual(signature, self.valid_signature)
+
+    def test_generate_signature_matches_the_hmac_module(self):
+        for secret in ("short", "a" * 64, "a" * 65, "b" * 200):
+            verifier = SignatureVerifier(secret)
+            expected = hmac.new(
+                secret.encode(), b"v0:123:" + b"body", hashlib.sha256
+            ).hexdigest()
+            signature = verifier.generate_signature(timestamp="123", body=b"body")
+            self.assertEqual(signature, f"v0={expected}")
+
+    def test_is_valid_accepts_bytes_and_memoryview_bodies(self):
+        for body in (self.body.encode(), memoryview(self.body.encode())):
+            verifier = SignatureVerifier(self.signing_secret, clock=lambda: self.now)
+            self.assertTrue(
+                verifier.is_valid(
+                    body=body, timestamp=self.timestamp, signature=self.valid_signature
+                )
+            )
+
+    def test_is_valid_agrees_with_validate_slack_signature(self):
+        self.assertTrue(
+            BaseClient.validate_slack_signature(
+                signing_secret=self.signing_secret,
+                data=self.body,
+                timestamp=self.timestamp,
+                signature=self.valid_signature,
+            )
+        )
+        self.assertTrue(
+            self.verifier.is_valid(
+                body=self.body,
+                timestamp=self.timestamp,
+                signature=self.valid_signature,
+            )
+        )
+
+    def test_is_valid_rejects_invalid_signatures(self):
+        self.assertFalse(
+            self.verifier.is_valid(
+                body=self.body + "&extra=1",
+                timestamp=self.timestamp,
+                signature=self.valid_signature,
+            )
+        )
+        self.assertFalse(
+            self.verifier.is_valid(
+                body=self.body, timestamp=self.timestamp, signature=None
+            )
+        )
+        self.assertFalse(
+            self.verifier.is_valid(
+                body=self.body, timestamp="not-a-number", signature=self.valid_signature
+            )
+        )
+
+    def test_is_valid_rejects_stale_timestamps(self):
+        self.now += 60 * 5 + 1
+        self.assertFalse(
+            self.verifier.is_valid(
+                body=self.body,
+                timestamp=self.timestamp,
+                signature=self.valid_signature,
+            )
+        )
+
+    def test_is_valid_rejects_replayed_requests(self):
+        kwargs = dict(
+            body=self.body, timestamp=self.timestamp, signature=self.valid_signature
+        )
+        self.assertTrue(self.verifier.is_valid(**kwargs))
+        self.now += 60
+        self.assertFalse(self.verifier.is_valid(**kwargs))
+
+    def test_replay_detection_can_be_disabled(self):
+        verifier = SignatureVerifier(
+            self.signing_secret, replay_cache_size=0, clock=lambda: self.now
+        )
+        kwargs = dict(
+            body=self.body, timestamp=self.timestamp, signature=self.valid_signature
+        )
+        self.assertTrue(verifier.is_valid(**kwargs))
+        self.assertTrue(verifier.is_valid(**kwargs))
+
+    def test_replay_cache_is_bounded_and_expires(self):
+        verifier = SignatureVerifier(
+            "secret", replay_cache_size=2, clock=lambda: self.now
+        )
+        for n in range(3):
+            body = f"body-{n}"
+            signature = verifier.generate_signature(timestamp=self.timestamp, body=body)
+            self.assertTrue(
+                verifier.is_valid(
+                    body=body, timestamp=self.timestamp, signature=signature
+                )
+            )
+        self.assertEqual(len(verifier._seen_signatures), 2)
+
+        self.now += 60 * 10 + 1
+        verifier.is_valid(
+            body="body-3",
+            timestamp=str(int(self.now)),
+            signature=verifier.generate_signature(
+                timestamp=str(int(self.now)), body="body-3"
+            ),
+        )
+        self.assertEqual(len(verifier._seen_signatures), 1)
+
+    def test_is_valid_request_reads_the_headers(self):
+        headers = {
+            "X-Slack-Request-Timestamp": self.timestamp,
+            "X-Slack-Signature": self.valid_signature,
+        }
+        self.assertTrue(self.verifier.is_valid_request(self.body, headers))
+
+    def test_is_valid_request_reads_lower_case_headers(self):
+        headers = {
+            "x-slack-request-timestamp": self.timestamp,
+            "x-slack-signature": self.valid_signature,
+        }
+        self.assertTrue(self.verifier.is_valid_request(self.body, headers))
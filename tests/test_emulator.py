@@ -0,0 +1,115 @@
+# Standard Imports
+import collections
+import time
+import unittest
+
+# ThirdParty Imports
+import asyncio
+
+# Internal Imports
+import slack
+import slack.errors as err
+from tests.emulator import SlackEmulator, Workspace
+
+
+class TestSlackEmulator(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.emulator = SlackEmulator(
+            Workspace(users=250, channels=5, messages_per_channel=30),
+            rate_limit_window=0.5,
+        )
+        self.base_url = self.loop.run_until_complete(self.emulator.start())
+        self.client = slack.WebClient(
+            token="xoxb-1", base_url=self.base_url, loop=self.loop
+        )
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.emulator.stop())
+        slack.RTMClient._callbacks = collections.defaultdict(list)
+
+    def test_api_test(self):
+        response = self.client.api_test(foo="bar")
+        self.assertEqual(response["args"], {"foo": "bar"})
+
+    def test_not_authed(self):
+        client = slack.WebClient(token="", base_url=self.base_url, loop=self.loop)
+        with self.assertRaises(err.SlackApiError) as context:
+            client.auth_test()
+        self.assertEqual(context.exception.response["error"], "not_authed")
+
+    def test_users_list_is_paginated(self):
+        pages = [page["members"] for page in self.client.users_list(limit=100)]
+        self.assertEqual([len(page) for page in pages], [100, 100, 50])
+        users = [user["id"] for page in pages for user in page]
+        self.assertEqual(users, [user["id"] for user in self.emulator.workspace.users])
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(err.SlackApiError) as context:
+            self.client.users_list(cursor="bm9wZQ==")
+        self.assertEqual(context.exception.response["error"], "invalid_cursor")
+
+    def test_posted_messages_are_in_the_history(self):
+        channel = self.emulator.workspace.channels[1]["id"]
+        posted = self.client.chat_postMessage(channel=channel, text="Hi there!")
+        history = self.client.conversations_history(channel=channel, limit=5)
+        self.assertEqual(history["messages"][0]["ts"], posted["ts"])
+        self.assertEqual(history["messages"][0]["text"], "Hi there!")
+        self.assertTrue(history["has_more"])
+
+    def test_tier_rate_limits(self):
+        # users.info is a tier 4 method: 100 calls per window.
+        user = self.emulator.workspace.users[0]["id"]
+        for _ in range(100):
+            self.client.users_info(user=user)
+        with self.assertRaises(err.SlackApiError) as context:
+            self.client.users_info(user=user)
+        response = context.exception.response
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["error"], "ratelimited")
+        self.assertLessEqual(float(response.headers["Retry-After"]), 0.5)
+        self.assertEqual(self.emulator.rate_limited, 1)
+
+        time.sleep(float(response.headers["Retry-After"]))
+        self.assertTrue(self.client.users_info(user=user)["ok"])
+
+    def test_chat_post_message_is_rate_limited_per_channel(self):
+        first, second = [c["id"] for c in self.emulator.workspace.channels[:2]]
+        self.client.chat_postMessage(channel=first, text="1")
+        self.client.chat_postMessage(channel=second, text="1")
+        with self.assertRaises(err.SlackApiError) as context:
+            self.client.chat_postMessage(channel=first, text="2")
+        self.assertEqual(context.exception.response.status_code, 429)
+
+    def test_latency(self):
+        self.emulator.latency, self.emulator.jitter = 0.05, 0.01
+        start = time.perf_counter()
+        self.client.api_test()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.04)
+
+    def test_rtm_flood(self):
+        received = []
+
+        @slack.RTMClient.run_on(event="hello")
+        async def flood(**payload):
+            await self.emulator.flood(50)
+
+        @slack.RTMClient.run_on(event="message")
+        def count(**payload):
+            received.append(payload["data"])
+            if len(received) == 50:
+                payload["rtm_client"].stop()
+
+        rtm_client = slack.RTMClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            run_async=True,
+            auto_reconnect=False,
+        )
+        self.loop.run_until_complete(asyncio.wait_for(rtm_client.start(), 5))
+        self.assertEqual(len(received), 50)
+        self.assertEqual(self.emulator.events_sent, 50)
+        channels = {channel["id"] for channel in self.emulator.workspace.channels}
+        self.assertTrue(all(event["channel"] in channels for event in received))
@@ -0,0 +1,53 @@
+# Standard Imports
+import subprocess
+import sys
+import unittest
+
+# Internal Imports
+import slack
+
+
+def imported_modules(statement):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(' '.join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return set(result.stdout.decode().split())
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Lazy imports require Python 3.7")
+class TestLazyImports(unittest.TestCase):
+    def test_importing_slack_does_not_import_aiohttp(self):
+        modules = imported_modules("import slack")
+        self.assertNotIn("aiohttp", modules)
+        self.assertNotIn("slack.web.client", modules)
+
+    def test_importing_block_kit_classes_does_not_import_aiohttp(self):
+        modules = imported_modules("from slack.web.classes.blocks import SectionBlock")
+        self.assertNotIn("aiohttp", modules)
+
+    def test_importing_the_signature_verifier_does_not_import_aiohttp(self):
+        modules = imported_modules("from slack.signature import SignatureVerifier")
+        self.assertNotIn("aiohttp", modules)
+
+    def test_clients_are_imported_on_first_access(self):
+        from slack.web.client import WebClient
+        from slack.rtm.client import RTMClient
+
+        self.assertIs(slack.WebClient, WebClient)
+        self.assertIs(slack.RTMClient, RTMClient)
+        self.assertIn("WebClient", dir(slack))
+
+    def test_subpackages_are_imported_on_first_access(self):
+        modules = imported_modules("import slack; slack.web.classes.JsonObject")
+        self.assertIn("slack.web.classes", modules)
+        self.assertNotIn("aiohttp", modules)
+
+    def test_unknown_attributes_raise_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            slack.NotAClient
@@ -0,0 +1,437 @@
+# Standard Imports
+import collections
+import functools
+import json
+import unittest
+
+# ThirdParty Imports
+import asyncio
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.instrumentation import (
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    MethodTransfers,
+    PrometheusInstrumentation,
+    RequestMetrics,
+    TransferStats,
+)
+from slack.web.transports import (
+    AiohttpTransport,
+    InMemoryTransport,
+    TransportResponse,
+)
+from tests.emulator import SlackEmulator, Workspace
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+except ImportError:
+    MeterProvider = None
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.calls = []
+
+    def request_started(self, method):
+        self.calls.append(("request_started", method))
+        return method
+
+    def request_ended(self, metrics, context):
+        self.calls.append(("request_ended", metrics, context))
+
+    def retry_scheduled(self, method, attempt, wait):
+        self.calls.append(("retry_scheduled", method, attempt, wait))
+
+    def rtm_connected(self, attempt):
+        self.calls.append(("rtm_connected", attempt))
+
+    def rtm_event_dispatched(self, event, latency):
+        self.calls.append(("rtm_event_dispatched", event, latency))
+
+    def rtm_callback_ran(self, event, callback, duration):
+        self.calls.append(("rtm_callback_ran", event, callback, duration))
+
+    def named(self, hook):
+        return [call[1:] for call in self.calls if call[0] == hook]
+
+
+class TestWebClientInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.emulator = SlackEmulator(
+            Workspace(users=10, channels=2), rate_limit_window=60
+        )
+        self.base_url = self.loop.run_until_complete(self.emulator.start())
+        self.instrumentation = RecordingInstrumentation()
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.emulator.stop())
+
+    def test_requests_are_measured(self):
+        async def calls():
+            transport = AiohttpTransport(persistent=True)
+            client = slack.WebClient(
+                token="xoxb-1",
+                base_url=self.base_url,
+                run_async=True,
+                transport=transport,
+                instrumentation=self.instrumentation,
+            )
+            await client.api_test(foo="bar")
+            await client.chat_postMessage(channel="C00000000", text="Hi")
+            await transport.close()
+
+        self.loop.run_until_complete(calls())
+        self.assertEqual(
+            self.instrumentation.named("request_started"),
+            [("api.test",), ("chat.postMessage",)],
+        )
+        (api_test, context), (post, _) = self.instrumentation.named("request_ended")
+        self.assertEqual(context, "api.test")
+        self.assertEqual(api_test.method, "api.test")
+        self.assertEqual(api_test.http_verb, "POST")
+        self.assertEqual(api_test.status_code, 200)
+        self.assertEqual(api_test.bytes_sent, len(b'{"foo": "bar"}'))
+        self.assertGreater(api_test.bytes_received, 0)
+        self.assertGreater(api_test.duration, 0)
+        self.assertFalse(api_test.connection_reused)
+        self.assertIsNone(api_test.error)
+        self.assertEqual(
+            post.bytes_sent, len(b'{"channel": "C00000000", "text": "Hi"}')
+        )
+        self.assertTrue(post.connection_reused)
+
+    def test_failed_requests_are_measured(self):
+        client = slack.WebClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            instrumentation=self.instrumentation,
+        )
+        client.rtm_connect()
+        with self.assertRaises(err.SlackApiError):
+            client.rtm_connect()
+        _, (metrics, _) = self.instrumentation.named("request_ended")
+        self.assertEqual(metrics.status_code, 429)
+        self.assertEqual(metrics.error, "ratelimited")
+
+        client.base_url = "http://localhost:1/api/"
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            client.api_test()
+        metrics, _ = self.instrumentation.named("request_ended")[-1]
+        self.assertEqual(metrics.status_code, 0)
+        self.assertEqual(metrics.error, "ClientConnectorError")
+
+    def test_undecodable_responses_are_measured(self):
+        headers = CIMultiDictProxy(CIMultiDict({"Content-Type": "application/json"}))
+        transport = InMemoryTransport(
+            lambda *args: TransportResponse(502, headers, b"<html>Bad Gateway</html>")
+        )
+        client = slack.WebClient(
+            token="xoxb-1",
+            transport=transport,
+            instrumentation=self.instrumentation,
+        )
+        with self.assertRaises(json.JSONDecodeError):
+            client.api_test()
+        ((metrics, _),) = self.instrumentation.named("request_ended")
+        self.assertEqual(metrics.status_code, 502)
+        self.assertEqual(metrics.error, "JSONDecodeError")
+
+    def test_retries_are_reported(self):
+        self.emulator.rate_limit_window = 3  # a message every 0.05s per channel
+        client = slack.WebClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            instrumentation=self.instrumentation,
+        )
+        messages = [{"channel": "C00000000", "text": str(n)} for n in range(2)]
+        client.chat_post_many(messages, per_channel_interval=0)
+        (retry,) = self.instrumentation.named("retry_scheduled")
+        self.assertEqual(retry[:2], ("chat.postMessage", 1))
+        self.assertLessEqual(retry[2], 0.05)
+
+    def test_clients_without_instrumentation(self):
+        transport = InMemoryTransport()
+        client = slack.WebClient(token="xoxb-1", transport=transport)
+        self.assertIsNone(client.instrumentation)
+        self.assertTrue(client.api_test()["ok"])
+
+
+class TestRTMClientInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.emulator = SlackEmulator(Workspace(users=10, channels=2))
+        self.base_url = self.loop.run_until_complete(self.emulator.start())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.emulator.stop())
+        slack.RTMClient._callbacks = collections.defaultdict(list)
+
+    def test_events_and_callbacks_are_measured(self):
+        instrumentation = RecordingInstrumentation()
+        received = []
+
+        @slack.RTMClient.run_on(event="hello")
+        async def flood(**payload):
+            await self.emulator.flood(3)
+
+        @slack.RTMClient.run_on(event="message")
+        async def on_message(**payload):
+            received.append(payload["data"])
+            if len(received) == 3:
+                payload["rtm_client"].stop()
+
+        rtm_client = slack.RTMClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            run_async=True,
+            auto_reconnect=False,
+            instrumentation=instrumentation,
+        )
+        self.loop.run_until_complete(asyncio.wait_for(rtm_client.start(), 5))
+
+        self.assertEqual(instrumentation.named("rtm_connected"), [(1,)])
+        self.assertEqual(
+            [call[0] for call in instrumentation.named("request_ended")],
+            [instrumentation.named("request_ended")[0][0]],
+        )
+        self.assertEqual(
+            instrumentation.named("request_ended")[0][0].method, "rtm.connect"
+        )
+        dispatched = instrumentation.named("rtm_event_dispatched")
+        self.assertEqual(
+            [event for event, _ in dispatched],
+            ["hello", "message", "message", "message"],
+        )
+        self.assertTrue(all(latency >= 0 for _, latency in dispatched))
+        callbacks = instrumentation.named("rtm_callback_ran")
+        self.assertEqual(
+            [callback[:2] for callback in callbacks],
+            [("hello", "flood")] + [("message", "on_message")] * 3,
+        )
+
+    def test_callbacks_without_a_name(self):
+        instrumentation = RecordingInstrumentation()
+        received = []
+
+        def on_hello(received, **payload):
+            received.append(payload["data"])
+
+        callback = functools.partial(on_hello, received)
+        slack.RTMClient.on(event="hello", callback=callback)
+        rtm_client = slack.RTMClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            run_async=True,
+            instrumentation=instrumentation,
+        )
+        self.loop.run_until_complete(
+            rtm_client._dispatch_event("hello", {"type": "hello"})
+        )
+        self.assertEqual(received, [{"type": "hello"}])
+        callbacks = instrumentation.named("rtm_callback_ran")
+        self.assertEqual([c[:2] for c in callbacks], [("hello", repr(callback))])
+
+
+def request_metrics(**kwargs):
+    metrics = {
+        "method": "chat.postMessage",
+        "http_verb": "POST",
+        "status_code": 200,
+        "duration": 0.25,
+        "bytes_sent": 100,
+        "bytes_received": 1000,
+        "connection_reused": True,
+        "error": None,
+        "bytes_transferred": 100,
+    }
+    metrics.update(kwargs)
+    return RequestMetrics(**metrics)
+
+
+class TestTransferStats(unittest.TestCase):
+    def test_heaviest_methods(self):
+        stats = TransferStats()
+        stats.request_ended(request_metrics(), None)
+        stats.request_ended(request_metrics(), None)
+        for transferred in (5000, None):
+            stats.request_ended(
+                request_metrics(
+                    method="users.list",
+                    bytes_received=50000,
+                    bytes_transferred=transferred,
+                ),
+                None,
+            )
+        stats.request_ended(request_metrics(method="api.test", bytes_received=20), None)
+
+        self.assertEqual(
+            stats.heaviest(2),
+            [
+                MethodTransfers("users.list", 2, 100000, 55000),
+                MethodTransfers("chat.postMessage", 2, 2000, 200),
+            ],
+        )
+        self.assertEqual(stats.get("api.test").requests, 1)
+        self.assertIsNone(stats.get("users.info"))
+
+
+@unittest.skipIf(prometheus_client is None, "prometheus_client isn't installed")
+class TestPrometheusInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.registry = prometheus_client.CollectorRegistry()
+        self.instrumentation = PrometheusInstrumentation(registry=self.registry)
+
+    def value(self, name, **labels):
+        return self.registry.get_sample_value(name, labels)
+
+    def test_requests(self):
+        method = {"method": "chat.postMessage"}
+        context = self.instrumentation.request_started("chat.postMessage")
+        self.assertEqual(self.value("slack_api_requests_in_flight", **method), 1)
+        self.instrumentation.request_ended(request_metrics(), context)
+        self.instrumentation.request_ended(
+            request_metrics(status_code=429, error="ratelimited", duration=2),
+            self.instrumentation.request_started("chat.postMessage"),
+        )
+
+        self.assertEqual(self.value("slack_api_requests_in_flight", **method), 0)
+        self.assertEqual(
+            self.value("slack_api_requests_total", status="200", **method), 1
+        )
+        self.assertEqual(
+            self.value("slack_api_requests_total", status="429", **method), 1
+        )
+        self.assertEqual(
+            self.value("slack_api_request_duration_seconds_count", **method), 2
+        )
+        self.assertEqual(
+            self.value("slack_api_request_duration_seconds_sum", **method), 2.25
+        )
+        self.assertEqual(
+            self.value(
+                "slack_api_request_duration_seconds_bucket", le="0.25", **method
+            ),
+            1,
+        )
+        self.assertEqual(
+            self.value("slack_api_request_bytes_sent_total", **method), 200
+        )
+        self.assertEqual(
+            self.value("slack_api_response_bytes_received_total", **method), 2000
+        )
+        self.assertEqual(
+            self.value("slack_api_response_bytes_transferred_total", **method), 200
+        )
+        self.assertEqual(self.value("slack_api_connections_reused_total", **method), 2)
+
+    def test_retries(self):
+        self.instrumentation.retry_scheduled("chat.postMessage", 1, 1.5)
+        self.instrumentation.retry_scheduled("chat.postMessage", 2, 0.5)
+        method = {"method": "chat.postMessage"}
+        self.assertEqual(self.value("slack_api_retries_total", **method), 2)
+        self.assertEqual(
+            self.value("slack_api_rate_limit_wait_seconds_total", **method), 2
+        )
+
+    def test_rtm(self):
+        self.instrumentation.rtm_connected(1)
+        self.instrumentation.rtm_connected(2)
+        self.instrumentation.rtm_event_dispatched("message", 0.001)
+        self.instrumentation.rtm_callback_ran("message", "say_hello", 0.5)
+        self.assertEqual(self.value("slack_rtm_connections_total"), 2)
+        self.assertEqual(self.value("slack_rtm_events_total", event="message"), 1)
+        self.assertEqual(self.value("slack_rtm_dispatch_latency_seconds_count"), 1)
+        self.assertEqual(
+            self.value(
+                "slack_rtm_callback_duration_seconds_sum",
+                event="message",
+                callback="say_hello",
+            ),
+            0.5,
+        )
+
+
+@unittest.skipIf(MeterProvider is None, "opentelemetry-sdk isn't installed")
+class TestOpenTelemetryInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.reader = InMemoryMetricReader()
+        self.spans = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(self.spans))
+        self.instrumentation = OpenTelemetryInstrumentation(
+            tracer=tracer_provider.get_tracer(__name__),
+            meter=MeterProvider(metric_readers=[self.reader]).get_meter(__name__),
+        )
+
+    def metrics(self):
+        data = self.reader.get_metrics_data()
+        return {
+            metric.name: metric.data.data_points
+            for resource_metrics in data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+
+    def test_requests_are_traced(self):
+        self.instrumentation.request_ended(
+            request_metrics(),
+            self.instrumentation.request_started("chat.postMessage"),
+        )
+        self.instrumentation.request_ended(
+            request_metrics(status_code=429, error="ratelimited"),
+            self.instrumentation.request_started("chat.postMessage"),
+        )
+
+        ok, rate_limited = self.spans.get_finished_spans()
+        self.assertEqual(ok.name, "slack chat.postMessage")
+        self.assertEqual(ok.attributes["slack.method"], "chat.postMessage")
+        self.assertEqual(ok.attributes["http.response.status_code"], 200)
+        self.assertTrue(ok.status.is_ok)
+        self.assertEqual(rate_limited.attributes["error.type"], "ratelimited")
+        self.assertFalse(rate_limited.status.is_ok)
+
+        metrics = self.metrics()
+        (duration,) = metrics["slack.api.request.duration"]
+        self.assertEqual(duration.count, 2)
+        self.assertEqual(duration.sum, 0.5)
+        requests = {
+            point.attributes["status"]: point.value
+            for point in metrics["slack.api.requests"]
+        }
+        self.assertEqual(requests, {200: 1, 429: 1})
+        (in_flight,) = metrics["slack.api.requests.in_flight"]
+        self.assertEqual(in_flight.value, 0)
+
+    def test_rtm(self):
+        self.instrumentation.rtm_connected(1)
+        self.instrumentation.rtm_event_dispatched("message", 0.001)
+        self.instrumentation.rtm_callback_ran("message", "say_hello", 0.5)
+        metrics = self.metrics()
+        self.assertEqual(metrics["slack.rtm.connections"][0].value, 1)
+        self.assertEqual(
+            metrics["slack.rtm.events"][0].attributes, {"event": "message"}
+        )
+        self.assertEqual(metrics["slack.rtm.callback.duration"][0].sum, 0.5)
@@ -0,0 +1,188 @@
+# Standard Imports
+import collections
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+# ThirdParty Imports
+import asyncio
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.recording import (
+    FrameRecorder,
+    RecordingTransport,
+    ReplayTransport,
+    read_records,
+)
+from slack.web.transports import InMemoryTransport, TransportResponse
+from tests.emulator import SlackEmulator, Workspace
+
+
+class TestWebRecording(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "traffic.jsonl.gz")
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.sent = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    async def slack(self, http_verb, api_url, req_args):
+        self.sent += 1
+        await asyncio.sleep(0.02)
+        if api_url.endswith("users.info"):
+            user = req_args["params"]["user"]
+            return {"ok": True, "user": {"id": user}, "call": self.sent}
+        return {"ok": True, "ts": str(self.sent)}
+
+    def client(self, transport):
+        return slack.WebClient(token="xoxb-1", loop=self.loop, transport=transport)
+
+    def record(self, calls):
+        transport = RecordingTransport(InMemoryTransport(self.slack), self.path)
+        calls(self.client(transport))
+        self.loop.run_until_complete(transport.close())
+
+    def test_replayed_responses_are_the_recorded_ones(self):
+        def calls(client):
+            client.users_info(user="W1")
+            client.users_info(user="W2")
+            client.users_info(user="W1")
+            client.chat_postMessage(channel="C1", text="Hello")
+
+        self.record(calls)
+        self.assertEqual(self.sent, 4)
+        records = list(read_records(self.path))
+        self.assertEqual(
+            [r["method"] for r in records],
+            ["users.info", "users.info", "users.info", "chat.postMessage"],
+        )
+        self.assertGreaterEqual(records[0]["latency"], 0.02)
+
+        client = self.client(ReplayTransport(self.path))
+        self.assertEqual(client.users_info(user="W2")["call"], 2)
+        self.assertEqual(client.users_info(user="W1")["call"], 1)
+        self.assertEqual(client.users_info(user="W1")["call"], 3)
+        # The last response is repeated once they're used up.
+        self.assertEqual(client.users_info(user="W1")["call"], 3)
+        self.assertEqual(client.chat_postMessage(channel="C1", text="Hello")["ts"], "4")
+        self.assertEqual(self.sent, 4)
+
+    def test_unrecorded_arguments(self):
+        self.record(lambda client: client.chat_postMessage(channel="C1", text="Hi"))
+
+        client = self.client(ReplayTransport(self.path))
+        response = client.chat_postMessage(channel="C2", text="Bye")
+        self.assertEqual(response["ts"], "1")
+
+        client = self.client(ReplayTransport(self.path, strict=True))
+        with self.assertRaises(err.SlackRequestError):
+            client.chat_postMessage(channel="C2", text="Bye")
+        with self.assertRaises(err.SlackRequestError):
+            client.api_test()
+
+    def test_encoded_bodies(self):
+        def slack(http_verb, api_url, req_args):
+            return {"ok": True, "channel": json.loads(req_args["data"])["channel"]}
+
+        transport = RecordingTransport(InMemoryTransport(slack), self.path)
+        messages = [{"channel": f"C{n}", "text": "Hi"} for n in range(3)]
+        self.client(transport).chat_post_many(messages, per_channel_interval=0)
+        self.loop.run_until_complete(transport.close())
+
+        client = self.client(ReplayTransport(self.path, strict=True))
+        responses = client.chat_post_many(messages[::-1], per_channel_interval=0)
+        self.assertEqual([r["channel"] for r in responses], ["C2", "C1", "C0"])
+
+    def test_recorded_latency(self):
+        self.record(lambda client: client.api_test())
+
+        client = self.client(ReplayTransport(self.path))
+        start = time.perf_counter()
+        client.api_test()
+        self.assertLess(time.perf_counter() - start, 0.02)
+
+        client = self.client(ReplayTransport(self.path, latency=1))
+        start = time.perf_counter()
+        client.api_test()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.02)
+
+    def test_binary_bodies(self):
+        headers = CIMultiDictProxy(CIMultiDict({"Content-Type": "image/png"}))
+        body = b"\x89PNG\r\n\x1a\n\xff"
+        transport = RecordingTransport(
+            InMemoryTransport(lambda *args: TransportResponse(200, headers, body)),
+            self.path,
+        )
+        request = {"http_verb": "GET", "api_url": "https://x/api/a.b", "req_args": {}}
+        self.loop.run_until_complete(transport.send(**request))
+        self.loop.run_until_complete(transport.close())
+
+        response = self.loop.run_until_complete(
+            ReplayTransport(self.path).send(**request)
+        )
+        self.assertEqual(response.body, body)
+        self.assertEqual(response.headers["content-type"], "image/png")
+
+
+class TestFrameRecording(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "events.jsonl.gz")
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.emulator = SlackEmulator(
+            Workspace(users=20, channels=2), rate_limits=False
+        )
+        self.base_url = self.loop.run_until_complete(self.emulator.start())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.emulator.stop())
+        slack.RTMClient._callbacks = collections.defaultdict(list)
+        shutil.rmtree(self.directory)
+
+    def receive(self, send, count, **kwargs):
+        received = []
+
+        async def on_hello(**payload):
+            await send()
+
+        def on_message(**payload):
+            received.append(payload["data"])
+            if len(received) == count:
+                payload["rtm_client"].stop()
+
+        slack.RTMClient.on(event="hello", callback=on_hello)
+        slack.RTMClient.on(event="message", callback=on_message)
+        rtm_client = slack.RTMClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            run_async=True,
+            auto_reconnect=False,
+            **kwargs,
+        )
+        try:
+            self.loop.run_until_complete(asyncio.wait_for(rtm_client.start(), 5))
+        finally:
+            slack.RTMClient._callbacks = collections.defaultdict(list)
+        return received
+
+    def test_recorded_frames_can_be_replayed(self):
+        recorder = FrameRecorder(self.path)
+        recorded = self.receive(
+            lambda: self.emulator.flood(20), 20, frame_recorder=recorder
+        )
+        recorder.close()
+        self.assertEqual(recorder.writer.records, 21)  # and the hello
+
+        replayed = self.receive(lambda: self.emulator.replay(self.path, speed=0), 20)
+        self.assertEqual(replayed, recorded)
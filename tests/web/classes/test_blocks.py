@@ -3,6 +3,7 @@ import unittest
 from slack.errors import SlackObjectFormationError
 from slack.web.classes.blocks import (
     ActionsBlock,
+    Block,
     ContextBlock,
     DividerBlock,
     ImageBlock,
@@ -140,3 +141,71 @@ class ContextBlockTests(unittest.TestCase):
     def test_elements_length(self):
         with self.assertRaises(SlackObjectFormationError):
             ContextBlock(elements=self.elements * 6).to_dict()
+
+
+class BlockFromDictTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.blocks = [
+            {
+                "type": "section",
+                "block_id": "intro",
+                "text": {"type": "mrkdwn", "text": "*Deploy* finished", "verbatim": False},
+                "accessory": {
+                    "type": "button",
+                    "action_id": "logs",
+                    "text": {"type": "plain_text", "text": "Logs", "emoji": True},
+                    "url": "https://example.com/logs",
+                },
+            },
+            {"type": "divider", "block_id": "d1"},
+            {
+                "type": "context",
+                "block_id": "meta",
+                "elements": [
+                    {"type": "image", "image_url": "https://example.com/a.png", "alt_text": "a"},
+                    {"type": "plain_text", "text": "by @deploybot", "emoji": True},
+                ],
+            },
+            {"type": "rich_text", "block_id": "r", "elements": []},
+        ]
+
+    def test_dispatches_on_type(self):
+        section = Block.from_dict(self.blocks[0])
+        self.assertIsInstance(section, SectionBlock)
+        self.assertIsInstance(section.text, MarkdownTextObject)
+        self.assertIsInstance(section.accessory, ButtonElement)
+        self.assertIsInstance(section.accessory.text, PlainTextObject)
+        self.assertIsNone(section.fields)
+        self.assertIsInstance(DividerBlock.from_dict(self.blocks[1]), DividerBlock)
+
+        context = Block.from_dict(self.blocks[2])
+        self.assertIsInstance(context.elements[0], ImageElement)
+        self.assertIsInstance(context.elements[1], PlainTextObject)
+
+    def test_round_trip(self):
+        for block in self.blocks[:3]:
+            self.assertEqual(Block.from_dict(block).to_dict(), block)
+
+    def test_unknown_blocks_and_fields_are_kept(self):
+        rich_text = self.blocks[3]
+        self.assertIs(Block.from_dict(rich_text), rich_text)
+        divider = {"type": "divider", "block_id": "d1", "dispatch_action": False}
+        self.assertIs(Block.from_dict(divider), divider)
+
+    def test_lists_are_parsed_lazily(self):
+        blocks = Block.from_list(self.blocks)
+        self.assertEqual(len(blocks), 4)
+        self.assertEqual(blocks._items, self.blocks)
+
+        section = blocks[0]
+        self.assertIs(blocks[0], section)
+        self.assertIs(blocks._items[1], self.blocks[1])
+        section.text.text = "*Deploy* failed"
+        blocks.append(DividerBlock(block_id="d2"))
+        del blocks[1]
+
+        updated = blocks.to_list()
+        self.assertEqual(updated[0]["text"]["text"], "*Deploy* failed")
+        self.assertEqual(updated[1:3], self.blocks[2:])
+        self.assertEqual(updated[3], {"type": "divider", "block_id": "d2"})
+        self.assertEqual(self.blocks[0]["text"]["text"], "*Deploy* finished")
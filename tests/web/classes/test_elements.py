@@ -2,6 +2,7 @@ import unittest
 
 from slack.errors import SlackObjectFormationError
 from slack.web.classes.elements import (
+    BlockElement,
     ButtonElement,
     ChannelSelectElement,
     ConversationSelectElement,
@@ -233,3 +234,34 @@ class ExternalDropdownElementTests(unittest.TestCase):
 #                     "type": f"{dropdown_type.initial_object_type}s_select",
 #                 }
 #                 self.assertDictEqual(type, coded)
+
+
+class BlockElementFromDictTests(unittest.TestCase):
+    def test_static_select(self):
+        data = {
+            "type": "static_select",
+            "action_id": "project",
+            "placeholder": {"type": "plain_text", "text": "Pick one", "emoji": True},
+            "option_groups": [
+                {
+                    "label": {"type": "plain_text", "text": "Team A", "emoji": True},
+                    "options": [
+                        {"text": {"type": "plain_text", "text": "One", "emoji": True}, "value": "1"},
+                        {"text": {"type": "plain_text", "text": "Two", "emoji": True}, "value": "2"},
+                    ],
+                }
+            ],
+            "initial_option": {"text": {"type": "plain_text", "text": "One", "emoji": True}, "value": "1"},
+        }
+        element = BlockElement.from_dict(data)
+        self.assertIsInstance(element, StaticSelectElement)
+        self.assertIsInstance(element.placeholder, PlainTextObject)
+        self.assertIsInstance(element.initial_option, Option)
+        option = element.option_groups[0].options[1]
+        self.assertIsInstance(option, Option)
+        self.assertEqual((option.text.text, option.value), ("Two", "2"))
+        self.assertEqual(element.to_dict(), data)
+
+    def test_unknown_elements(self):
+        data = {"type": "timepicker", "action_id": "when"}
+        self.assertIs(BlockElement.from_dict(data), data)
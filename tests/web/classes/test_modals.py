@@ -81,3 +81,35 @@ class TestModals(unittest.TestCase):
             ]
         }
         self.assertDictEqual(modal, coded)
+
+    def test_from_dict(self):
+        view = {
+            "id": "VMHU10V25",
+            "team_id": "T8N4K1JN",
+            "type": "modal",
+            "title": {"type": "plain_text", "text": "Quite a plain modal", "emoji": True},
+            "submit": {"type": "plain_text", "text": "Create", "emoji": True},
+            "blocks": [
+                {
+                    "type": "input",
+                    "block_id": "a_block_id",
+                    "label": {"type": "plain_text", "text": "A simple label", "emoji": True},
+                    "optional": False,
+                    "element": {"type": "plain_text_input", "action_id": "an_action_id"},
+                }
+            ],
+            "private_metadata": "Shh",
+            "callback_id": "identify_your_modals",
+            "state": {"values": {}},
+            "hash": "156772938.1827394",
+            "clear_on_close": False,
+            "notify_on_close": False,
+        }
+        modal = ModalBuilder.from_dict(view)
+        self.assertIsInstance(modal.modal.title, PlainTextObject)
+        self.assertIsInstance(modal.modal.blocks[0].element, PlainTextElement)
+
+        modal.modal.blocks[0].label.text = "Another label"
+        expected = {key: value for key, value in view.items() if key not in ("id", "team_id", "state", "hash")}
+        expected["blocks"] = [dict(view["blocks"][0], label={"type": "plain_text", "text": "Another label", "emoji": True})]
+        self.assertDictEqual(modal.to_dict(), expected)
@@ -1,3 +1,4 @@
+import json
 import unittest
 
 from slack.errors import SlackObjectFormationError
@@ -14,6 +15,7 @@ from slack.web.classes.objects import (
     Option,
     OptionGroup,
     PlainTextObject,
+    TextObject,
 )
 from . import STRING_301_CHARS, STRING_51_CHARS
 
@@ -56,6 +58,27 @@ class JsonObjectTests(unittest.TestCase):
         with self.assertRaises(SlackObjectFormationError):
             self.bad_test_object.to_dict()
 
+    def test_slotted_json_formation(self):
+        option = Option(text=PlainTextObject(text="some text"), value="a")
+        self.assertFalse(hasattr(option, "__dict__"))
+        self.assertEqual(Option._fields, ("text", "value", "description"))
+        self.assertEqual(
+            json.dumps(PlainTextObject(text="some text").to_dict()),
+            '{"text": "some text", "type": "plain_text", "emoji": true}',
+        )
+
+    def test_subclass_without_slots(self):
+        class TitledTextObject(PlainTextObject):
+            def __init__(self, *, text: str, title: str):
+                super().__init__(text=text)
+                self.title = title
+                self.subtitle = None
+
+        self.assertDictEqual(
+            TitledTextObject(text="some text", title="a title").to_dict(),
+            {"text": "some text", "type": "plain_text", "emoji": True, "title": "a title"},
+        )
+
 
 class JsonValidatorTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -186,6 +209,32 @@ class MarkdownTextObjectTests(unittest.TestCase):
         )
 
 
+class TextObjectFromDictTests(unittest.TestCase):
+    def test_dispatches_on_type(self):
+        plain_text = TextObject.from_dict({"type": "plain_text", "text": "a", "emoji": False})
+        self.assertIsInstance(plain_text, PlainTextObject)
+        self.assertEqual((plain_text.text, plain_text.emoji), ("a", False))
+        markdown = TextObject.from_dict({"type": "mrkdwn", "text": "*a*"})
+        self.assertIsInstance(markdown, MarkdownTextObject)
+        self.assertIsNone(markdown.verbatim)
+        self.assertEqual(markdown.to_dict(), {"type": "mrkdwn", "text": "*a*"})
+
+    def test_unknown_types(self):
+        data = {"type": "rich_text", "text": "a"}
+        self.assertIs(TextObject.from_dict(data), data)
+
+    def test_confirm(self):
+        data = {
+            "title": {"type": "plain_text", "text": "Sure?"},
+            "text": {"type": "mrkdwn", "text": "It can't be undone"},
+            "confirm": {"type": "plain_text", "text": "Delete"},
+            "deny": {"type": "plain_text", "text": "Cancel"},
+        }
+        confirm = ConfirmObject.from_dict(data)
+        self.assertIsInstance(confirm.confirm, PlainTextObject)
+        self.assertEqual(confirm.to_dict(), data)
+
+
 class ConfirmObjectTests(unittest.TestCase):
     def test_basic_json(self):
         expected = {
@@ -0,0 +1,97 @@
+import unittest
+
+from slack.errors import SlackObjectFormationError
+from slack.web.classes.blocks import ActionsBlock, DividerBlock, SectionBlock
+from slack.web.classes.elements import ButtonElement
+from slack.web.classes.objects import MarkdownTextObject, PlainTextObject
+from slack.web.classes.templates import Slot, Template
+from . import STRING_3001_CHARS
+
+
+def build_blocks(user, task):
+    return [
+        SectionBlock(text=MarkdownTextObject(text=f"Welcome <@{user}>! :wave:")),
+        DividerBlock(),
+        ActionsBlock(
+            elements=[
+                ButtonElement(
+                    text=PlainTextObject(text="Done"), action_id="done", value=task
+                )
+            ]
+        ),
+    ]
+
+
+class SlotTests(unittest.TestCase):
+    def test_name(self):
+        self.assertEqual(Slot("user").name, "user")
+        self.assertIsInstance(Slot("user"), str)
+
+    def test_invalid_names(self):
+        with self.assertRaises(ValueError):
+            Slot("")
+        with self.assertRaises(ValueError):
+            Slot(str(Slot("user")))
+
+
+class TemplateTests(unittest.TestCase):
+    def test_render_matches_to_dict(self):
+        template = Template(build_blocks(Slot("user"), Slot("task")))
+        self.assertEqual(template.slots, {"user", "task"})
+        self.assertEqual(
+            template.render(user="U0123ABC", task="T1"),
+            [block.to_dict() for block in build_blocks("U0123ABC", "T1")],
+        )
+
+    def test_render_shares_parts_without_slots(self):
+        template = Template(build_blocks(Slot("user"), "T1"))
+        first = template.render(user="U1")
+        second = template.render(user="U2")
+        self.assertEqual(first[0]["text"]["text"], "Welcome <@U1>! :wave:")
+        self.assertEqual(second[0]["text"]["text"], "Welcome <@U2>! :wave:")
+        self.assertIsNot(first, second)
+        self.assertIsNot(first[0], second[0])
+        self.assertIs(first[1], second[1])
+        self.assertIs(first[2], second[2])
+
+    def test_render_without_slots(self):
+        template = Template({"type": "divider"})
+        self.assertEqual(template.slots, frozenset())
+        self.assertEqual(template.render(), {"type": "divider"})
+
+    def test_whole_value_slots_take_any_value(self):
+        template = Template({"type": "context", "elements": Slot("elements")})
+        elements = [PlainTextObject(text="a"), {"type": "mrkdwn", "text": "b"}]
+        self.assertEqual(
+            template.render(elements=elements),
+            {"type": "context", "elements": elements},
+        )
+        self.assertEqual(
+            Template({"text": Slot("text")}).render(text=PlainTextObject(text="a")),
+            {"text": {"type": "plain_text", "text": "a", "emoji": True}},
+        )
+
+    def test_embedded_slots_are_converted_to_strings(self):
+        template = Template({"text": f"{Slot('a')} and {Slot('b')}{Slot('a')}"})
+        self.assertEqual(template.render(a=1, b="x"), {"text": "1 and x1"})
+
+    def test_render_does_not_revalidate(self):
+        template = Template(SectionBlock(text=MarkdownTextObject(text=Slot("text"))))
+        rendered = template.render(text=STRING_3001_CHARS)
+        self.assertEqual(rendered["text"]["text"], STRING_3001_CHARS)
+
+    def test_invalid_objects(self):
+        with self.assertRaises(SlackObjectFormationError):
+            Template(
+                [
+                    SectionBlock(text=Slot("text")),
+                    ActionsBlock(elements=[DividerBlock()] * 6),
+                ]
+            )
+
+    def test_missing_and_unknown_values(self):
+        template = Template({"text": Slot("text")})
+        with self.assertRaises(TypeError):
+            template.render()
+        with self.assertRaises(TypeError):
+            template.render(text="a", other="b")
@@ -0,0 +1,178 @@
+# Standard Imports
+import collections
+import time
+import unittest
+
+# ThirdParty Imports
+import asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.web.transports import InMemoryTransport
+
+CHANNEL_INTERVAL = 0.05
+
+
+class RateLimitedSlack:
+    """A chat.postMessage stub enforcing Slack-like rate limits.
+
+    Each channel accepts a message every CHANNEL_INTERVAL seconds, and the
+    workspace accepts `burst` messages every `window` seconds. Requests
+    beyond either limit are answered with a 429.
+    """
+
+    def __init__(self, burst=100, window=1.0):
+        self.burst = burst
+        self.window = window
+        self.accepted = []
+        self.by_channel = collections.defaultdict(list)
+        self.last_posted = {}
+        self.rate_limited = 0
+        self.bodies = []
+
+    async def post_message(self, request):
+        self.bodies.append(await request.read())
+        message = await request.json()
+        now = time.monotonic()
+        channel = message["channel"]
+        recent = [t for t in self.accepted if now - t < self.window]
+        last = self.last_posted.get(channel)
+        if len(recent) >= self.burst or (
+            last is not None and now - last < CHANNEL_INTERVAL * 0.9
+        ):
+            self.rate_limited += 1
+            return web.json_response(
+                {"ok": False, "error": "ratelimited"},
+                status=429,
+                headers={"Retry-After": str(self.window)},
+            )
+        if message.get("text") == "fail":
+            return web.json_response({"ok": False, "error": "channel_not_found"})
+        self.accepted.append(now)
+        self.last_posted[channel] = now
+        self.by_channel[channel].append(message["text"])
+        return web.json_response({"ok": True, "channel": channel, "message": message})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post("/api/chat.postMessage", self.post_message)
+        return app
+
+
+class TestChatPostMany(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = None
+
+    def tearDown(self):
+        if self.server is not None:
+            self.loop.run_until_complete(self.server.close())
+
+    def start(self, slack_stub):
+        self.server = TestServer(slack_stub.app(), loop=self.loop)
+        self.loop.run_until_complete(self.server.start_server())
+        return slack.WebClient(
+            token="xoxb-1",
+            base_url=str(self.server.make_url("/api/")),
+            loop=self.loop,
+        )
+
+    def test_messages_are_posted_in_order_within_each_channel(self):
+        slack_stub = RateLimitedSlack()
+        client = self.start(slack_stub)
+        blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": "*Hi*"}}]
+        messages = [
+            {"channel": f"C{c}", "text": f"{c}-{n}", "blocks": blocks}
+            for n in range(3)
+            for c in range(5)
+        ]
+        progress = []
+        results = client.chat_post_many(
+            messages,
+            per_channel_interval=CHANNEL_INTERVAL,
+            on_progress=lambda done, total: progress.append((done, total)),
+        )
+
+        self.assertTrue(all(result["ok"] for result in results))
+        self.assertEqual(
+            [result["message"]["text"] for result in results],
+            [message["text"] for message in messages],
+        )
+        for c in range(5):
+            self.assertEqual(
+                slack_stub.by_channel[f"C{c}"], [f"{c}-{n}" for n in range(3)]
+            )
+        self.assertEqual(slack_stub.rate_limited, 0)
+        self.assertEqual(progress[-1], (15, 15))
+        self.assertEqual(len(progress), 15)
+
+    def test_rate_limited_messages_are_retried(self):
+        slack_stub = RateLimitedSlack(burst=4, window=0.2)
+        client = self.start(slack_stub)
+        messages = [{"channel": f"C{c}", "text": str(c)} for c in range(10)]
+        results = client.chat_post_many(messages, per_channel_interval=CHANNEL_INTERVAL)
+
+        self.assertGreater(slack_stub.rate_limited, 0)
+        self.assertTrue(all(result["ok"] for result in results))
+        self.assertEqual(len(slack_stub.accepted), 10)
+
+    def test_the_workspace_rate_is_limited(self):
+        slack_stub = RateLimitedSlack(burst=5, window=0.1)
+        client = self.start(slack_stub)
+        messages = [{"channel": f"C{c}", "text": str(c)} for c in range(10)]
+        started = time.monotonic()
+        results = client.chat_post_many(
+            messages, per_channel_interval=0, max_concurrency=2, max_per_minute=900
+        )
+
+        self.assertTrue(all(result["ok"] for result in results))
+        self.assertEqual(slack_stub.rate_limited, 0)
+        # 2 messages at once, then 15 per second.
+        self.assertGreaterEqual(time.monotonic() - started, 8 / 15)
+
+    def test_failures_are_returned_without_stopping_the_channel(self):
+        slack_stub = RateLimitedSlack()
+        client = self.start(slack_stub)
+        messages = [
+            {"channel": "C1", "text": "fail"},
+            {"channel": "C1", "text": "next"},
+        ]
+        results = client.chat_post_many(messages, per_channel_interval=0)
+        self.assertIsInstance(results[0], err.SlackApiError)
+        self.assertTrue(results[1]["ok"])
+
+    def test_unexpected_errors_are_returned_without_stopping_the_others(self):
+        def handler(http_verb, api_url, req_args):
+            if b'"C1"' in req_args["data"]:
+                raise ValueError("Unexpected")
+            return {"ok": True}
+
+        client = slack.WebClient(
+            token="xoxb-1", loop=self.loop, transport=InMemoryTransport(handler)
+        )
+        messages = [{"channel": f"C{c}", "text": "Hi"} for c in range(3)]
+        results = client.chat_post_many(messages, per_channel_interval=0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertTrue(results[0]["ok"])
+        self.assertTrue(results[2]["ok"])
+
+    def test_shared_blocks_are_sent_unchanged(self):
+        slack_stub = RateLimitedSlack()
+        client = self.start(slack_stub)
+        blocks = [{"type": "divider"}]
+        client.chat_post_many(
+            [{"channel": "C1", "text": "a", "blocks": blocks}], per_channel_interval=0
+        )
+        self.assertEqual(
+            slack_stub.bodies[0],
+            b'{"channel":"C1","text":"a","blocks":[{"type":"divider"}]}',
+        )
+
+    def test_messages_require_a_channel(self):
+        client = self.start(RateLimitedSlack())
+        with self.assertRaises(TypeError):
+            client.chat_post_many([{"text": "Hi"}])
@@ -0,0 +1,273 @@
+# Standard Imports
+import unittest
+from unittest import mock
+
+# ThirdParty Imports
+import asyncio
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.instrumentation import Instrumentation
+from slack.web.client_pool import WebClientPool
+from slack.web.rate_limits import RateLimiter
+from slack.web.transports import InMemoryTransport, make_response
+from tests.emulator import SlackEmulator, Workspace
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestWebClientPool(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.clock = FakeClock()
+        self.tokens = []
+        self.transport = InMemoryTransport(self.slack)
+        self.lookups = []
+
+    def slack(self, http_verb, api_url, req_args):
+        self.tokens.append(req_args["headers"]["Authorization"])
+        return {"ok": True}
+
+    def lookup(self, team_id, enterprise_id):
+        self.lookups.append((team_id, enterprise_id))
+        if team_id.startswith("T"):
+            return f"xoxb-{team_id}"
+        return None
+
+    def pool(self, **kwargs):
+        return WebClientPool(
+            transport=self.transport, loop=self.loop, clock=self.clock, **kwargs
+        )
+
+    def test_calls_are_routed_to_the_workspace_token(self):
+        pool = self.pool()
+        pool.add_token("xoxb-1", team_id="T1")
+        pool.add_token("xoxb-2", team_id="T2")
+        pool.add_token("xoxb-org", enterprise_id="E1")
+        pool.client(team_id="T1").api_test()
+        pool.client(team_id="T2").api_test()
+        pool.client(team_id="T3", enterprise_id="E1").api_test()
+        pool.client(team_id="T1", enterprise_id="E1").api_test()
+        self.assertEqual(
+            self.tokens,
+            ["Bearer xoxb-1", "Bearer xoxb-2", "Bearer xoxb-org", "Bearer xoxb-1"],
+        )
+        self.assertIs(pool.client(team_id="T1"), pool.client(team_id="T1"))
+        self.assertIs(
+            pool.client(team_id="T3", enterprise_id="E1"),
+            pool.client(enterprise_id="E1"),
+        )
+        self.assertEqual(len(pool), 3)
+        self.assertTrue(
+            all(
+                client.transport is self.transport
+                for client in (pool.client(team_id="T1"), pool.client(team_id="T2"))
+            )
+        )
+
+        with self.assertRaises(err.SlackRequestError):
+            pool.client(team_id="T4")
+        with self.assertRaises(err.SlackRequestError):
+            pool.add_token("xoxb-4")
+
+    def test_tokens_can_be_looked_up(self):
+        pool = self.pool(token_lookup=self.lookup)
+        pool.client(team_id="T1").api_test()
+        pool.client(team_id="T1").api_test()
+        self.assertEqual(self.tokens, ["Bearer xoxb-T1"] * 2)
+        self.assertEqual(self.lookups, [("T1", None)])
+        with self.assertRaises(err.SlackRequestError):
+            pool.client(team_id="X1")
+
+        pool.remove_token(team_id="T1")
+        self.assertEqual(len(pool), 0)
+        pool.client(team_id="T1")
+        self.assertEqual(len(self.lookups), 3)
+
+    def test_tokens_can_be_replaced(self):
+        pool = self.pool()
+        pool.add_token("xoxb-1", team_id="T1")
+        first = pool.client(team_id="T1")
+        pool.add_token("xoxb-rotated", team_id="T1")
+        self.assertIsNot(pool.client(team_id="T1"), first)
+        pool.client(team_id="T1").api_test()
+        self.assertEqual(self.tokens, ["Bearer xoxb-rotated"])
+        self.assertEqual(len(pool), 1)
+
+    def test_idle_clients_are_evicted(self):
+        pool = self.pool(token_lookup=self.lookup, idle_timeout=60, max_clients=3)
+        for team in ("T1", "T2", "T3"):
+            pool.client(team_id=team)
+        self.clock.now += 30
+        pool.client(team_id="T1")
+        pool.client(team_id="T4")  # T2 is the least recently used.
+        self.assertEqual(len(pool), 3)
+        self.assertEqual(len(pool._looked_up), 3)
+
+        self.clock.now += 45  # Only T1 and T4 were used in the last minute.
+        pool.client(team_id="T4")
+        self.assertEqual(len(pool), 2)
+        pool.client(team_id="T1")
+        self.assertEqual(self.lookups.count(("T1", None)), 1)
+        pool.client(team_id="T2")
+        self.assertEqual(self.lookups.count(("T2", None)), 2)
+
+    def test_clients_get_the_pool_options(self):
+        pool = self.pool(token_lookup=self.lookup, base_url="https://slack.test/api/")
+        client = pool.client(team_id="T1")
+        self.assertEqual(client.base_url, "https://slack.test/api/")
+        self.assertIsInstance(client.interceptors[-1], RateLimiter)
+        other = pool.client(team_id="T2")
+        self.assertIsNot(other.interceptors[-1], client.interceptors[-1])
+        pool = self.pool(token_lookup=self.lookup, rate_limits=False)
+        self.assertEqual(pool.client(team_id="T1").interceptors, [])
+
+    def test_rate_limits_outlive_evicted_clients(self):
+        headers = CIMultiDictProxy(CIMultiDict({"Retry-After": "120"}))
+        self.transport.handler = lambda *args: make_response(
+            {"ok": False, "error": "ratelimited"}, status_code=429, headers=headers
+        )
+        pool = self.pool(token_lookup=self.lookup, idle_timeout=60)
+        limiter = pool.client(team_id="T1").interceptors[-1]
+        with self.assertRaises(err.SlackApiError):
+            pool.client(team_id="T1").users_list()
+        pool.client(team_id="T2")
+
+        self.clock.now += 90  # T1 is evicted while users.list is paused.
+        pool.client(team_id="T2")
+        self.assertEqual(len(pool), 1)
+        self.assertIs(pool.client(team_id="T1").interceptors[-1], limiter)
+
+        self.clock.now += 90  # The pause is over, and T2 is evicted.
+        pool.client(team_id="T1")
+        self.assertEqual(set(pool._rate_limiters), {"xoxb-T1"})
+
+        pool.remove_token(team_id="T1")
+        self.assertEqual(pool._rate_limiters, {})
+
+    def test_tokens_are_looked_up_outside_the_lock(self):
+        def lookup(team_id, enterprise_id):
+            self.assertFalse(pool._lock.locked())
+            if team_id == "T1":
+                # Another call resolves the workspace meanwhile.
+                pool.add_token("xoxb-added", team_id="T1")
+            return f"xoxb-{team_id}"
+
+        pool = self.pool(token_lookup=lookup)
+        pool.client(team_id="T1").api_test()
+        pool.client(team_id="T2").api_test()
+        self.assertEqual(self.tokens, ["Bearer xoxb-added", "Bearer xoxb-T2"])
+        self.assertEqual(pool._looked_up, {("T2", None): "xoxb-T2"})
+
+
+class ConnectionCounter(Instrumentation):
+    def __init__(self):
+        self.reused = []
+
+    def request_ended(self, metrics, context):
+        self.reused.append(metrics.connection_reused)
+
+
+class TestSharedConnections(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.emulator = SlackEmulator(Workspace(users=10, channels=2))
+        self.base_url = self.loop.run_until_complete(self.emulator.start())
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.emulator.stop())
+
+    def test_workspaces_share_connections(self):
+        instrumentation = ConnectionCounter()
+        pool = WebClientPool(
+            token_lookup=lambda team_id, enterprise_id: f"xoxb-{team_id}",
+            base_url=self.base_url,
+            loop=self.loop,
+            instrumentation=instrumentation,
+        )
+        for team in range(20):
+            pool.client(team_id=f"T{team}").api_test()
+        self.loop.run_until_complete(pool.close())
+        self.assertEqual(instrumentation.reused, [False] + [True] * 19)
+        self.assertTrue(pool.transport.session.closed)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.clock = FakeClock()
+        self.waits = []
+        self.responses = []
+
+    async def sleep(self, seconds):
+        self.waits.append(seconds)
+        self.clock.now += seconds
+
+    def slack(self, http_verb, api_url, req_args):
+        if self.responses:
+            return self.responses.pop(0)
+        return {"ok": True}
+
+    def client(self, limiter):
+        return slack.WebClient(
+            token="xoxb-1",
+            loop=self.loop,
+            transport=InMemoryTransport(self.slack),
+            interceptors=[limiter],
+        )
+
+    def test_tiers_are_limited(self):
+        limiter = RateLimiter(clock=self.clock)
+        client = self.client(limiter)
+        with mock.patch("slack.web.rate_limits.asyncio.sleep", self.sleep):
+            for _ in range(20):
+                client.users_list()  # Tier 2: 20 per minute.
+            self.assertEqual(self.waits, [])
+            client.users_list()
+            client.users_list()
+            self.assertEqual(self.waits, [3.0, 3.0])
+            self.assertEqual(limiter.delayed, 2)
+
+            client.users_info(user="W1")  # Tier 4 has a bucket of its own.
+            client.chat_postMessage(channel="C1", text="Hi")  # Special.
+            client.api_call("unknown.method")
+            self.assertEqual(len(self.waits), 2)
+
+    def test_methods_of_a_tier_are_limited_separately(self):
+        limiter = RateLimiter(clock=self.clock)
+        client = self.client(limiter)
+        with mock.patch("slack.web.rate_limits.asyncio.sleep", self.sleep):
+            for _ in range(20):  # Tier 2: 20 per minute each.
+                client.users_list()
+                client.conversations_list()
+            self.assertEqual(self.waits, [])
+            client.conversations_list()
+            self.assertEqual(self.waits, [3.0])
+
+    def test_rate_limited_responses_pause_the_method(self):
+        limiter = RateLimiter(clock=self.clock)
+        client = self.client(limiter)
+        headers = CIMultiDictProxy(CIMultiDict({"Retry-After": "30"}))
+        self.responses.append(
+            make_response(
+                {"ok": False, "error": "ratelimited"}, status_code=429, headers=headers
+            )
+        )
+        with mock.patch("slack.web.rate_limits.asyncio.sleep", self.sleep):
+            with self.assertRaises(err.SlackApiError):
+                client.users_list()
+            client.users_list()
+            client.conversations_list()  # Tier 2 as well.
+            client.users_info(user="W1")
+            self.assertEqual(self.waits, [30.0])
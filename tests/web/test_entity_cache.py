@@ -0,0 +1,154 @@
+# Standard Imports
+import json
+import os
+import unittest
+from unittest import mock
+
+# ThirdParty Imports
+import asyncio
+
+# Internal Imports
+import slack
+from slack.web.entity_cache import BOT, CHANNEL, USER, EntityCache
+from tests.helpers import async_test, mock_request
+
+RTM_START_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "rtm.start.json")
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestEntityCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = EntityCache(max_size=2, ttl=60, clock=self.clock)
+
+    def test_get_returns_cached_entities(self):
+        self.cache.set(USER, "U1", {"id": "U1"})
+        self.assertEqual(self.cache.get(USER, "U1"), {"id": "U1"})
+        self.assertIsNone(self.cache.get(CHANNEL, "U1"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_callers_get_copies_of_the_entities(self):
+        user = {"id": "U1", "profile": {"title": "Ghostbuster"}}
+        self.cache.set(USER, "U1", user)
+        user["profile"]["title"] = "changed"
+        self.cache.get(USER, "U1")["profile"]["title"] = "changed"
+        self.assertEqual(self.cache.get(USER, "U1")["profile"]["title"], "Ghostbuster")
+
+    def test_entities_expire(self):
+        self.cache.set(USER, "U1", {"id": "U1"})
+        self.clock.now += 61
+        self.assertIsNone(self.cache.get(USER, "U1"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entities_are_evicted(self):
+        self.cache.set(USER, "U1", {"id": "U1"})
+        self.cache.set(USER, "U2", {"id": "U2"})
+        self.cache.get(USER, "U1")
+        self.cache.set(USER, "U3", {"id": "U3"})
+        self.assertIsNotNone(self.cache.get(USER, "U1"))
+        self.assertIsNone(self.cache.get(USER, "U2"))
+
+    def test_seed_caches_the_rtm_start_payload(self):
+        with open(RTM_START_PATH) as rtm_start:
+            data = json.load(rtm_start)
+        cache = EntityCache()
+        cache.seed(data)
+        user = data["users"][0]
+        self.assertEqual(cache.get(USER, user["id"]), user)
+        im = data["ims"][0]
+        self.assertEqual(cache.get(CHANNEL, im["id"]), im)
+        self.assertEqual(len(cache), 6)
+
+    def test_user_change_updates_the_user(self):
+        self.cache.set(USER, "U1", {"id": "U1", "name": "old"})
+        self.cache.handle_rtm_event(
+            "user_change", {"user": {"id": "U1", "name": "new"}}
+        )
+        self.assertEqual(self.cache.get(USER, "U1")["name"], "new")
+
+    def test_bot_changed_updates_the_bot(self):
+        self.cache.handle_rtm_event("bot_changed", {"bot": {"id": "B1", "name": "b"}})
+        self.assertEqual(self.cache.get(BOT, "B1")["name"], "b")
+
+    def test_channel_events_invalidate_the_channel(self):
+        self.cache.set(CHANNEL, "C1", {"id": "C1"})
+        self.cache.set(CHANNEL, "C2", {"id": "C2"})
+        self.cache.handle_rtm_event(
+            "channel_rename", {"channel": {"id": "C1", "name": "new"}}
+        )
+        self.cache.handle_rtm_event(
+            "member_joined_channel", {"user": "U1", "channel": "C2"}
+        )
+        self.assertIsNone(self.cache.get(CHANNEL, "C1"))
+        self.assertIsNone(self.cache.get(CHANNEL, "C2"))
+
+
+@mock.patch("slack.WebClient._request", new_callable=mock_request)
+class TestWebClientEntityCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = EntityCache()
+        self.client = slack.WebClient(
+            "xoxb-abc-123", loop=asyncio.get_event_loop(), entity_cache=self.cache
+        )
+
+    def test_info_methods_are_served_from_the_cache(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": True, "user": {"id": "W1", "name": "spengler"}},
+            "headers": {},
+            "status_code": 200,
+        }
+        first = self.client.users_info(user="W1")
+        second = self.client.users_info(user="W1")
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(first["user"], second["user"])
+        self.assertTrue(second["ok"])
+
+    def test_calls_with_other_arguments_are_not_cached(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": True, "user": {"id": "W1"}},
+            "headers": {},
+            "status_code": 200,
+        }
+        self.client.users_info(user="W1", include_locale=True)
+        self.client.users_info(user="W1", include_locale=True)
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_failed_calls_are_not_cached(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": False, "error": "bot_not_found"},
+            "headers": {},
+            "status_code": 200,
+        }
+        for _ in range(2):
+            with self.assertRaises(slack.errors.SlackApiError):
+                self.client.bots_info(bot="B1")
+        self.assertEqual(mock_request.call_count, 2)
+
+    @async_test
+    async def test_concurrent_misses_share_one_request(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": True, "channel": {"id": "C1"}},
+            "headers": {},
+            "status_code": 200,
+        }
+        self.client.run_async = True
+        self.client._event_loop = asyncio.get_event_loop()
+        responses = await asyncio.gather(
+            *[self.client.conversations_info(channel="C1") for _ in range(3)]
+        )
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual([r["channel"]["id"] for r in responses], ["C1"] * 3)
+        responses[0]["channel"]["name"] = "changed"
+        self.assertNotIn("name", responses[1]["channel"])
+
+        cached = await self.client.conversations_info(channel="C1")
+        self.assertEqual(cached["channel"], {"id": "C1"})
+        self.assertEqual(mock_request.call_count, 1)
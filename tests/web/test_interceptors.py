@@ -0,0 +1,145 @@
+# Standard Imports
+import unittest
+
+# ThirdParty Imports
+import asyncio
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.web.interceptors import Interceptor
+from slack.web.slack_response import SlackResponse
+from slack.web.transports import InMemoryTransport, make_response
+
+
+class Recorder(Interceptor):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    async def intercept(self, request, call_next):
+        self.log.append(f"{self.name} > {request.api_method}")
+        try:
+            response = await call_next(request)
+        except err.SlackApiError as e:
+            self.log.append(f"{self.name} < {e.response['error']}")
+            raise
+        self.log.append(f"{self.name} < {response.status_code}")
+        return response
+
+
+class AddHeader(Interceptor):
+    async def intercept(self, request, call_next):
+        headers = {**request.req_args["headers"], "X-Team": "T1"}
+        req_args = {**request.req_args, "headers": headers}
+        return await call_next(request._replace(req_args=req_args))
+
+
+class Cache(Interceptor):
+    def __init__(self):
+        self.responses = {}
+
+    async def intercept(self, request, call_next):
+        key = (request.api_method, str(request.req_args["params"]))
+        if key not in self.responses:
+            self.responses[key] = await call_next(request)
+        return self.responses[key]
+
+
+class Answer(Interceptor):
+    async def intercept(self, request, call_next):
+        return SlackResponse(
+            client=None,
+            http_verb=request.http_verb,
+            api_url=request.api_url,
+            req_args=request.req_args,
+            data={"ok": True, "answered": request.api_method},
+            headers={},
+            status_code=200,
+        )
+
+
+class TestInterceptors(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.requests = []
+        self.transport = InMemoryTransport(self.slack)
+
+    def slack(self, http_verb, api_url, req_args):
+        self.requests.append(req_args)
+        if api_url.endswith("chat.delete"):
+            return make_response({"ok": False, "error": "message_not_found"})
+        return {"ok": True}
+
+    def client(self, *interceptors, **kwargs):
+        return slack.WebClient(
+            token="xoxb-1",
+            loop=self.loop,
+            transport=self.transport,
+            interceptors=interceptors,
+            **kwargs,
+        )
+
+    def test_interceptors_run_in_order(self):
+        log = []
+        client = self.client(Recorder("outer", log), Recorder("inner", log))
+        client.api_test()
+        with self.assertRaises(err.SlackApiError):
+            client.chat_delete(channel="C1", ts="1")
+        self.assertEqual(
+            log,
+            [
+                "outer > api.test",
+                "inner > api.test",
+                "inner < 200",
+                "outer < 200",
+                "outer > chat.delete",
+                "inner > chat.delete",
+                "inner < message_not_found",
+                "outer < message_not_found",
+            ],
+        )
+
+    def test_requests_can_be_modified(self):
+        self.client(AddHeader()).api_test()
+        self.assertEqual(self.requests[0]["headers"]["X-Team"], "T1")
+        self.assertEqual(self.requests[0]["headers"]["Authorization"], "Bearer xoxb-1")
+
+    def test_requests_can_be_answered_without_sending_them(self):
+        cache = Cache()
+        client = self.client(cache)
+        first = client.users_info(user="W1")
+        self.assertIs(client.users_info(user="W1"), first)
+        client.users_info(user="W2")
+        self.assertEqual(len(self.requests), 2)
+
+        response = self.client(Answer()).api_test()
+        self.assertEqual(response["answered"], "api.test")
+        self.assertEqual(len(self.requests), 2)
+
+    def test_async_clients(self):
+        log = []
+        client = self.client(Recorder("only", log), run_async=True)
+
+        async def calls():
+            return await asyncio.gather(
+                client.api_test(), client.auth_test(), client.bots_info(bot="B1")
+            )
+
+        responses = self.loop.run_until_complete(calls())
+        self.assertTrue(all(response["ok"] for response in responses))
+        self.assertEqual(len(log), 6)
+
+    def test_batched_messages_are_intercepted(self):
+        log = []
+        client = self.client(Recorder("only", log))
+        client.chat_post_many(
+            [{"channel": "C1", "text": "Hi"}, {"channel": "C2", "text": "Hi"}]
+        )
+        self.assertEqual(log.count("only > chat.postMessage"), 2)
+
+    def test_clients_without_interceptors(self):
+        client = self.client()
+        self.assertEqual(client.interceptors, [])
+        self.assertTrue(client.api_test()["ok"])
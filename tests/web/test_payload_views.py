@@ -0,0 +1,45 @@
+# Standard Imports
+import json
+import os
+import unittest
+
+# Internal Imports
+from slack.web.payload_views import ChannelView, MessageView, UserView
+
+RTM_START_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "rtm.start.json")
+
+
+class TestPayloadViews(unittest.TestCase):
+    def setUp(self):
+        with open(RTM_START_PATH) as rtm_start:
+            self.data = json.load(rtm_start)
+
+    def test_message_view(self):
+        message = MessageView(
+            {"type": "message", "ts": "1503435956.000247", "thread_ts": "1503435900.0"}
+        )
+        self.assertEqual(message.timestamp, 1503435956.000247)
+        self.assertTrue(message.is_thread_reply)
+        self.assertEqual(message.text, "")
+        self.assertEqual(message.blocks, ())
+        self.assertIsNone(message.user)
+
+    def test_user_view_reads_the_profile(self):
+        user = self.data["users"][0]
+        view = UserView(user)
+        self.assertEqual(view.id, user["id"])
+        self.assertEqual(view.email, user["profile"]["email"])
+        self.assertTrue(view.is_admin)
+        self.assertIsNone(view.tz_offset)
+
+    def test_channel_view_reads_the_topic(self):
+        channel = self.data["channels"][0]
+        view = ChannelView(channel)
+        self.assertEqual(view.name, channel["name"])
+        self.assertEqual(view.topic, channel["topic"]["value"])
+        self.assertEqual(view, ChannelView(dict(channel)))
+        self.assertNotEqual(view, UserView(channel))
+
+    def test_views_have_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            UserView({}).extra = 1
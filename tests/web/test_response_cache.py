@@ -0,0 +1,165 @@
+# Standard Imports
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# ThirdParty Imports
+import asyncio
+
+# Internal Imports
+import slack
+from slack.web.response_cache import (
+    CachedResponse,
+    MemoryResponseStore,
+    ResponseCache,
+    SQLiteResponseStore,
+)
+from tests.helpers import async_test, mock_request
+
+OK_RESPONSE = {"data": {"ok": True}, "headers": {}, "status_code": 200}
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def cached_response(body=b'{"ok":true}'):
+    return CachedResponse(body, (("Content-Type", "application/json"),), 200, 2000.0)
+
+
+class TestMemoryResponseStore(unittest.TestCase):
+    def test_least_recently_used_responses_are_evicted_by_size(self):
+        store = MemoryResponseStore(max_bytes=25)
+        store.set("a", cached_response(b"x" * 10))
+        store.set("b", cached_response(b"x" * 10))
+        store.get("a")
+        store.set("c", cached_response(b"x" * 10))
+        self.assertIsNotNone(store.get("a"))
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.size, 20)
+
+    def test_responses_larger_than_the_store_are_not_kept(self):
+        store = MemoryResponseStore(max_bytes=5)
+        store.set("a", cached_response(b"x" * 10))
+        self.assertEqual((len(store), store.size), (0, 0))
+
+    def test_replacing_a_response_updates_the_size(self):
+        store = MemoryResponseStore()
+        store.set("a", cached_response(b"x" * 10))
+        store.set("a", cached_response(b"x" * 4))
+        store.discard("b")
+        self.assertEqual(store.size, 4)
+        store.discard("a")
+        self.assertEqual(store.size, 0)
+
+
+class TestSQLiteResponseStore(unittest.TestCase):
+    def test_responses_survive_the_store(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "responses.db")
+        store = SQLiteResponseStore(path)
+        store.set("a", cached_response())
+        store.close()
+
+        store = SQLiteResponseStore(path)
+        self.addCleanup(store.close)
+        self.assertEqual(store.get("a"), cached_response())
+        store.discard("a")
+        self.assertIsNone(store.get("a"))
+
+    def test_expired_responses_are_purged(self):
+        clock = FakeClock(now=1500.0)
+        store = SQLiteResponseStore(":memory:", purge_interval=60, clock=clock)
+        self.addCleanup(store.close)
+        store.set("a", cached_response())  # Expires at 2000.
+        clock.now = 2010.0
+        store.set("b", cached_response()._replace(expires_at=2050.0))
+        self.assertIsNone(store.get("a"))
+        clock.now = 2060.0
+        store.set("c", cached_response()._replace(expires_at=3000.0))
+        self.assertIsNotNone(store.get("b"))  # The next purge is at 2070.
+        clock.now = 2070.0
+        store.set("c", cached_response()._replace(expires_at=3000.0))
+        self.assertIsNone(store.get("b"))
+        self.assertIsNotNone(store.get("c"))
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_only_idempotent_methods_can_be_cached(self):
+        with self.assertRaises(ValueError):
+            ResponseCache(ttls={"chat.postMessage": 60})
+        with self.assertRaises(ValueError):
+            ResponseCache(ttls={"auth.revoke": 60})
+
+    def test_keys_do_not_contain_the_token(self):
+        key = ResponseCache.get_key("team.info", "xoxb-secret", ())
+        self.assertNotIn("secret", key)
+        self.assertNotEqual(key, ResponseCache.get_key("team.info", "xoxb-other", ()))
+
+
+@mock.patch("slack.WebClient._request", new_callable=mock_request)
+class TestWebClientResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls={"emoji.list": 60}, clock=self.clock)
+        self.client = slack.WebClient(
+            "xoxb-abc-123", loop=asyncio.get_event_loop(), response_cache=self.cache
+        )
+
+    def test_responses_are_served_from_the_cache(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": True, "emoji": {"shipit": "alias:squirrel"}},
+            "headers": {"Content-Type": "application/json"},
+            "status_code": 200,
+        }
+        live = self.client.emoji_list()
+        cached = self.client.emoji_list()
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertFalse(live.cached)
+        self.assertTrue(cached.cached)
+        self.assertEqual(cached.data, live.data)
+        self.assertEqual(cached.headers["content-type"], "application/json")
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_responses_expire(self, mock_request):
+        mock_request.response.return_value = OK_RESPONSE
+        self.client.emoji_list()
+        self.clock.now += 61
+        self.assertFalse(self.client.emoji_list().cached)
+        self.assertEqual(mock_request.call_count, 2)
+
+    def test_other_methods_and_arguments_are_not_shared(self, mock_request):
+        mock_request.response.return_value = OK_RESPONSE
+        self.client.emoji_list()
+        self.client.emoji_list(include_categories=True)
+        self.client.team_info()
+        self.client.team_info()
+        self.assertEqual(mock_request.call_count, 4)
+
+    def test_errors_are_not_cached(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": False, "error": "ratelimited"},
+            "headers": {},
+            "status_code": 429,
+        }
+        for _ in range(2):
+            with self.assertRaises(slack.errors.SlackApiError):
+                self.client.emoji_list()
+        self.assertEqual(mock_request.call_count, 2)
+
+    @async_test
+    async def test_cached_responses_are_futures_in_async_mode(self, mock_request):
+        self.client.run_async = True
+        self.client._event_loop = asyncio.get_event_loop()
+        mock_request.response.return_value = OK_RESPONSE
+        await self.client.emoji_list()
+        future = self.client.emoji_list()
+        self.assertTrue(asyncio.isfuture(future))
+        self.assertTrue((await future).cached)
@@ -0,0 +1,78 @@
+# Standard Imports
+import logging
+import unittest
+
+# Internal Imports
+from slack.web.payload_views import MessageView
+from slack.web.slack_response import SlackResponse
+
+
+def make_response(data, **kwargs):
+    return SlackResponse(
+        client=None,
+        http_verb="POST",
+        api_url="https://www.slack.com/api/chat.postMessage",
+        req_args={"headers": {"Authorization": "Bearer xoxb-1"}, "json": {}},
+        data=data,
+        headers={},
+        status_code=200,
+        **kwargs,
+    )
+
+
+class TestSlackResponse(unittest.TestCase):
+    def test_request_arguments_are_not_kept_by_default(self):
+        response = make_response({"ok": True})
+        self.assertIsNone(response.req_args)
+
+    def test_request_arguments_are_kept_for_pagination(self):
+        response = make_response(
+            {"ok": True, "response_metadata": {"next_cursor": "dXNlcjpVMEc5V0ZYTlo="}}
+        )
+        self.assertIn("headers", response.req_args)
+
+    def test_request_arguments_can_be_retained(self):
+        response = make_response({"ok": True}, retain_req_args=True)
+        self.assertIn("headers", response.req_args)
+
+    def test_responses_have_no_instance_dict(self):
+        response = make_response({"ok": True})
+        with self.assertRaises(AttributeError):
+            response.extra = 1
+
+    def test_validate_logs_a_bounded_representation(self):
+        data = {"ok": True, "members": [{"id": f"U{n}"} for n in range(1000)]}
+        with self.assertLogs("slack.web.slack_response", logging.DEBUG) as logs:
+            make_response(data).validate()
+        self.assertIn("...", logs.output[0])
+        self.assertLess(len(logs.output[0]), 1000)
+
+    def test_responses_can_be_read_like_their_data(self):
+        data = {"ok": True, "channel": "C1", "ts": "1503435956.000247"}
+        response = make_response(data)
+        self.assertIn("channel", response)
+        self.assertNotIn("error", response)
+        self.assertEqual(len(response), 3)
+        self.assertEqual(dict(response.items()), data)
+        self.assertEqual(list(response.keys()), list(data))
+        self.assertEqual(list(response.values()), list(data.values()))
+        self.assertIsNone(response["error"])
+
+    def test_get_path_reads_nested_values(self):
+        response = make_response(
+            {"ok": True, "message": {"blocks": [{"type": "section"}]}}
+        )
+        self.assertEqual(response.get_path("message", "blocks", 0, "type"), "section")
+        self.assertIsNone(response.get_path("message", "blocks", 1, "type"))
+        self.assertEqual(response.get_path("message", "text", default=""), "")
+        self.assertEqual(response.get_path("ok", "nested", default=0), 0)
+
+    def test_typed_views_share_the_response_data(self):
+        message = {"type": "message", "text": "Hi", "ts": "1503435956.000247"}
+        response = make_response({"ok": True, "channel": "C1", "message": message})
+        self.assertIsInstance(response.message, MessageView)
+        self.assertIs(response.message.data, message)
+        self.assertEqual(response.message.text, "Hi")
+        # The 'channel' of a chat.postMessage response is an id, not a channel.
+        self.assertIsNone(response.channel)
+        self.assertIsNone(response.user)
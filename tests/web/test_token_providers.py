@@ -0,0 +1,233 @@
+# Standard Imports
+import io
+import os
+import tempfile
+import unittest
+
+# ThirdParty Imports
+import asyncio
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.web.interceptors import Interceptor
+from slack.web.token_providers import (
+    AccessToken,
+    OAuthTokenRotator,
+    RefreshingTokenProvider,
+)
+from slack.web.transports import InMemoryTransport, make_response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRefreshingTokenProvider(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.clock = FakeClock()
+        self.sent = []
+        self.valid = set()
+        self.issued = 0
+        self.issue_valid_tokens = True
+
+    async def refresh(self):
+        await asyncio.sleep(0.01)
+        self.issued += 1
+        token = f"xoxb-{self.issued}"
+        if self.issue_valid_tokens:
+            self.valid = {token}
+        return AccessToken(token, self.clock() + 3600)
+
+    async def slack(self, http_verb, api_url, req_args):
+        _, _, token = req_args["headers"]["Authorization"].partition(" ")
+        self.sent.append(token)
+        if token not in self.valid:
+            return make_response({"ok": False, "error": "token_expired"})
+        return {"ok": True}
+
+    def client(self, provider, **kwargs):
+        return slack.WebClient(
+            loop=self.loop,
+            transport=InMemoryTransport(self.slack),
+            token_provider=provider,
+            **kwargs,
+        )
+
+    def provider(self, **kwargs):
+        return RefreshingTokenProvider(self.refresh, clock=self.clock, **kwargs)
+
+    def test_requests_use_the_provided_token(self):
+        provider = self.provider()
+        client = self.client(provider)
+        client.api_test()
+        client.auth_test()
+        self.assertEqual(self.sent, ["xoxb-1", "xoxb-1"])
+        self.assertEqual(provider.token, AccessToken("xoxb-1", 4600.0))
+
+    def test_concurrent_requests_share_a_refresh(self):
+        provider = self.provider()
+        client = self.client(provider, run_async=True)
+
+        async def calls():
+            return await asyncio.gather(*(client.api_test() for _ in range(10)))
+
+        self.loop.run_until_complete(calls())
+        self.assertEqual(self.sent, ["xoxb-1"] * 10)
+        self.assertEqual(provider.refreshes, 1)
+
+        self.clock.now += 3600  # It has expired.
+        self.loop.run_until_complete(calls())
+        self.assertEqual(self.sent[10:], ["xoxb-2"] * 10)
+        self.assertEqual(provider.refreshes, 2)
+
+    def test_tokens_are_refreshed_ahead_of_expiry(self):
+        self.valid = {"xoxb-0"}
+        provider = self.provider(
+            token=AccessToken("xoxb-0", self.clock() + 200), refresh_ahead=300
+        )
+        client = self.client(provider, run_async=True)
+
+        async def calls():
+            await client.api_test()  # Starts a refresh, without waiting for it.
+            self.valid.add("xoxb-0")
+            await client.api_test()
+            await asyncio.sleep(0.05)
+            await client.api_test()
+
+        self.loop.run_until_complete(calls())
+        self.assertEqual(self.sent, ["xoxb-0", "xoxb-0", "xoxb-1"])
+        self.assertEqual(provider.refreshes, 1)
+
+    def test_rejected_requests_are_retried_once(self):
+        self.valid = {"xoxb-0"}
+        provider = self.provider(token=AccessToken("xoxb-0"))
+        client = self.client(provider, run_async=True)
+        self.valid = set()  # Revoked.
+
+        async def calls():
+            return await asyncio.gather(*(client.api_test() for _ in range(5)))
+
+        responses = self.loop.run_until_complete(calls())
+        self.assertTrue(all(response["ok"] for response in responses))
+        self.assertEqual(self.sent, ["xoxb-0"] * 5 + ["xoxb-1"] * 5)
+        self.assertEqual(provider.refreshes, 1)
+
+        self.valid = set()  # Revoked, and refreshes don't help.
+        self.issue_valid_tokens = False
+        with self.assertRaises(err.SlackApiError):
+            self.loop.run_until_complete(client.api_test())
+        self.assertEqual(self.sent[10:], ["xoxb-1", "xoxb-2"])
+
+    def test_retried_uploads_send_the_file_again(self):
+        uploaded = []
+
+        async def upload(http_verb, api_url, req_args):
+            uploaded.append(req_args["data"]["file"].read())
+            return await self.slack(http_verb, api_url, req_args)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "file.txt")
+        with open(path, "wb") as file:
+            file.write(b"file contents")
+
+        self.valid = {"xoxb-0"}
+        provider = self.provider(token=AccessToken("xoxb-0"))
+        client = slack.WebClient(
+            loop=self.loop, transport=InMemoryTransport(upload), token_provider=provider
+        )
+        self.valid = set()  # Revoked.
+        self.assertTrue(client.files_upload(file=path, channels="C1")["ok"])
+        self.assertEqual(uploaded, [b"file contents"] * 2)
+        self.assertEqual(self.sent, ["xoxb-0", "xoxb-1"])
+
+        # File objects were read by the first attempt: it isn't retried.
+        self.valid = set()  # Revoked again.
+        with self.assertRaises(err.SlackApiError):
+            client.files_upload(file=io.BytesIO(b"file contents"), channels="C1")
+        self.assertEqual(self.sent[2:], ["xoxb-1"])
+        self.assertEqual(provider.token.token, "xoxb-2")
+
+    def test_retries_pass_through_the_interceptors(self):
+        class Counter(Interceptor):
+            requests = 0
+
+            async def intercept(self, request, call_next):
+                self.requests += 1
+                return await call_next(request)
+
+        counter = Counter()
+        self.valid = {"xoxb-0"}
+        provider = self.provider(token=AccessToken("xoxb-0"))
+        client = self.client(provider, interceptors=[counter])
+        self.valid = set()  # Revoked.
+        self.assertTrue(client.api_test()["ok"])
+        self.assertEqual(counter.requests, 2)
+
+    def test_failed_refreshes_are_retried(self):
+        failures = [RuntimeError("Slack is down")]
+
+        async def refresh():
+            if failures:
+                raise failures.pop()
+            return await self.refresh()
+
+        provider = RefreshingTokenProvider(refresh, clock=self.clock)
+        client = self.client(provider)
+        with self.assertRaises(RuntimeError):
+            client.api_test()
+        self.assertTrue(client.api_test()["ok"])
+        self.assertEqual(self.sent, ["xoxb-1"])
+
+    def test_bot_token_checks_are_skipped(self):
+        client = self.client(self.provider())
+        self.assertTrue(client.admin_apps_approve(app_id="A1")["ok"])
+
+
+class TestOAuthTokenRotator(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.requests = []
+
+    def slack(self, http_verb, api_url, req_args):
+        self.requests.append((api_url, req_args))
+        n = len(self.requests)
+        return {
+            "ok": True,
+            "access_token": f"xoxe.xoxb-{n}",
+            "refresh_token": f"xoxe-{n}",
+            "expires_in": 43200,
+        }
+
+    def test_tokens_are_rotated(self):
+        rotations = []
+        transport = InMemoryTransport(self.slack)
+        provider = OAuthTokenRotator(
+            client_id="1.2",
+            client_secret="secret",
+            refresh_token="xoxe-0",
+            on_rotate=lambda token, refresh_token: rotations.append(
+                (token, refresh_token)
+            ),
+            client=slack.WebClient(run_async=True, transport=transport),
+            clock=lambda: 1000.0,
+        )
+        self.assertEqual(
+            self.loop.run_until_complete(provider.get_token()), "xoxe.xoxb-1"
+        )
+        api_url, req_args = self.requests[0]
+        self.assertTrue(api_url.endswith("/oauth.v2.access"))
+        self.assertEqual(
+            req_args["data"], {"grant_type": "refresh_token", "refresh_token": "xoxe-0"}
+        )
+        self.assertEqual(req_args["auth"].login, "1.2")
+        self.assertEqual(rotations, [(AccessToken("xoxe.xoxb-1", 44200.0), "xoxe-1")])
+        self.assertEqual(provider.refresh_token, "xoxe-1")
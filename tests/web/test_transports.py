@@ -0,0 +1,325 @@
+# Standard Imports
+import io
+import json
+import unittest
+
+# ThirdParty Imports
+import asyncio
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict, CIMultiDictProxy
+
+# Internal Imports
+import slack
+import slack.errors as err
+from slack.web.transports import (
+    AiohttpTransport,
+    HTTP2Transport,
+    InMemoryTransport,
+    TransportResponse,
+    make_response,
+)
+from tests.helpers import async_test
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class TestInMemoryTransport(unittest.TestCase):
+    def test_default_transport(self):
+        client = slack.WebClient(token="xoxb-1", timeout=5)
+        self.assertIsInstance(client.transport, AiohttpTransport)
+        self.assertEqual(client.transport.timeout, 5)
+        self.assertIsNone(client.session)
+
+    def test_requests_are_answered_by_the_handler(self):
+        requests = []
+
+        def handler(http_verb, api_url, req_args):
+            requests.append((http_verb, api_url, req_args["json"]))
+            return {"ok": True, "channel": req_args["json"]["channel"]}
+
+        transport = InMemoryTransport(handler)
+        client = slack.WebClient(token="xoxb-1", transport=transport)
+        response = client.chat_postMessage(channel="C1234567890", text="Hello")
+
+        self.assertEqual(response["channel"], "C1234567890")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            requests,
+            [
+                (
+                    "POST",
+                    "https://www.slack.com/api/chat.postMessage",
+                    {"channel": "C1234567890", "text": "Hello"},
+                )
+            ],
+        )
+        self.assertEqual(transport.requests_sent, 1)
+
+    def test_default_handler(self):
+        client = slack.WebClient(token="xoxb-1", transport=InMemoryTransport())
+        self.assertEqual(client.api_test().data, {"ok": True})
+
+    @async_test
+    async def test_coroutine_handler(self):
+        async def handler(http_verb, api_url, req_args):
+            return make_response(
+                {"ok": False, "error": "ratelimited"},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+
+        client = slack.WebClient(
+            token="xoxb-1", run_async=True, transport=InMemoryTransport(handler)
+        )
+        with self.assertRaises(err.SlackApiError) as context:
+            await client.api_test()
+        response = context.exception.response
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["retry-after"], "1")
+
+    def test_bodies_that_are_not_json_have_no_data(self):
+        headers = CIMultiDictProxy(CIMultiDict({"Content-Type": "text/plain"}))
+        transport = InMemoryTransport(
+            lambda *args: TransportResponse(200, headers, b"ok")
+        )
+        client = slack.WebClient(token="xoxb-1", transport=transport)
+        with self.assertRaises(err.SlackApiError):
+            client.api_test()
+
+
+class EchoServerTestCase(unittest.TestCase):
+    async def echo(self, request):
+        if request.content_type == "application/json":
+            body = await request.json()
+        else:
+            form = await request.post()
+            body = {
+                key: (
+                    value.file.read().decode()
+                    if isinstance(value, web.FileField)
+                    else value
+                )
+                for key, value in form.items()
+            }
+        return web.json_response(
+            {
+                "ok": True,
+                "method": request.method,
+                "authorization": request.headers.get("Authorization"),
+                "body": body,
+            }
+        )
+
+    async def users_list(self, request):
+        """Answers a large list of users, compressed if the client asks for it."""
+        members = [{"id": f"W{n:010}", "name": f"user{n}"} for n in range(2000)]
+        response = web.json_response(
+            {
+                "ok": True,
+                "accept_encoding": request.headers.get("Accept-Encoding"),
+                "members": members,
+            }
+        )
+        coding = request.query.get("coding")
+        if coding is not None:
+            response.enable_compression(web.ContentCoding[coding])
+        if request.query.get("chunked"):
+            # Stream the body, so that it has no Content-Length.
+            stream = web.StreamResponse(headers={"Content-Type": "application/json"})
+            stream.enable_chunked_encoding()
+            stream.enable_compression(web.ContentCoding[coding])
+            await stream.prepare(request)
+            await stream.write(response.body)
+            await stream.write_eof()
+            return stream
+        return response
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        app = web.Application()
+        app.router.add_get("/api/users.list", self.users_list)
+        app.router.add_post("/api/{method}", self.echo)
+        self.server = TestServer(app, loop=self.loop)
+        self.loop.run_until_complete(self.server.start_server())
+        self.base_url = str(self.server.make_url("/api/"))
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.server.close())
+
+
+class TestAiohttpTransport(EchoServerTestCase):
+    def test_requests_without_a_session(self):
+        client = slack.WebClient(token="xoxb-1", base_url=self.base_url, loop=self.loop)
+        response = client.chat_postMessage(channel="C1", text="Hi")
+        self.assertEqual(response["body"], {"channel": "C1", "text": "Hi"})
+        self.assertEqual(response["authorization"], "Bearer xoxb-1")
+
+    def test_body_sizes(self):
+        transport = AiohttpTransport()
+        for req_args, size in (
+            ({"json": {"channel": "C1"}}, len(b'{"channel": "C1"}')),
+            ({"data": {"code": "a b"}}, len(b"code=a+b")),
+            ({"data": b'{"channel":"C1"}'}, len(b'{"channel":"C1"}')),
+        ):
+            response = self.loop.run_until_complete(
+                transport.send(
+                    http_verb="POST",
+                    api_url=self.base_url + "api.test",
+                    req_args=req_args,
+                )
+            )
+            self.assertEqual(response.bytes_sent, size)
+        response = self.list_users(transport, "identity")
+        self.assertEqual(response.bytes_sent, 0)
+
+    def test_requests_with_a_session(self):
+        async def post():
+            async with aiohttp.ClientSession() as session:
+                client = slack.WebClient(
+                    token="xoxb-1",
+                    base_url=self.base_url,
+                    run_async=True,
+                    session=session,
+                )
+                self.assertIs(client.session, session)
+                return await client.chat_postMessage(channel="C1", text="Hi")
+
+        response = self.loop.run_until_complete(post())
+        self.assertEqual(response["body"], {"channel": "C1", "text": "Hi"})
+
+    def list_users(self, transport, coding, **params):
+        return self.loop.run_until_complete(
+            transport.send(
+                http_verb="GET",
+                api_url=self.base_url + "users.list",
+                req_args={"headers": {}, "params": {"coding": coding, **params}},
+            )
+        )
+
+    def test_compressed_responses_are_decompressed(self):
+        transport = AiohttpTransport()
+        uncompressed = self.list_users(transport, "identity")
+        self.assertEqual(uncompressed.bytes_transferred, len(uncompressed.body))
+
+        for coding in ("gzip", "deflate"):
+            response = self.list_users(transport, coding)
+            self.assertNotIn("Content-Encoding", response.headers)
+            self.assertNotIn("Content-Length", response.headers)
+            self.assertEqual(response.body, uncompressed.body)
+            self.assertLess(response.bytes_transferred, len(response.body) / 5)
+        data = json.loads(response.body)
+        self.assertIn("gzip", data["accept_encoding"])
+        self.assertEqual(len(data["members"]), 2000)
+
+        response = self.list_users(transport, "gzip", chunked="1")
+        self.assertNotIn("Content-Length", response.headers)
+        self.assertEqual(response.body, uncompressed.body)
+        self.assertLess(response.bytes_transferred, len(response.body) / 5)
+
+        client = slack.WebClient(token="xoxb-1", base_url=self.base_url, loop=self.loop)
+        response = client.users_list(coding="gzip")
+        self.assertEqual(len(response["members"]), 2000)
+
+    def test_responses_of_a_given_session(self):
+        async def users_list(**kwargs):
+            async with aiohttp.ClientSession(**kwargs) as session:
+                transport = AiohttpTransport(session=session)
+                return await transport.send(
+                    http_verb="GET",
+                    api_url=self.base_url + "users.list",
+                    req_args={"headers": {}, "params": {"coding": "gzip"}},
+                )
+
+        response = self.loop.run_until_complete(users_list())
+        self.assertEqual(len(json.loads(response.body)["members"]), 2000)
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertLess(response.bytes_transferred, len(response.body))
+        self.assertIsNone(response.connection_reused)
+
+        response = self.loop.run_until_complete(users_list(auto_decompress=False))
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertEqual(response.bytes_transferred, len(response.body))
+
+    def test_reused_connections(self):
+        transport = AiohttpTransport(persistent=True)
+        responses = [self.list_users(transport, "identity") for _ in range(2)]
+        self.loop.run_until_complete(transport.close())
+        self.assertEqual([r.connection_reused for r in responses], [False, True])
+
+        transport = AiohttpTransport()
+        responses = [self.list_users(transport, "identity") for _ in range(2)]
+        self.assertEqual([r.connection_reused for r in responses], [False, False])
+
+
+@unittest.skipIf(httpx is None, "httpx isn't installed")
+class TestHTTP2Transport(EchoServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.transport = HTTP2Transport(connections=2)
+        self.client = slack.WebClient(
+            token="xoxb-1",
+            base_url=self.base_url,
+            loop=self.loop,
+            transport=self.transport,
+        )
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.transport.close())
+        super().tearDown()
+
+    def test_json(self):
+        response = self.client.chat_postMessage(channel="C1", text="Hi")
+        self.assertEqual(response["body"], {"channel": "C1", "text": "Hi"})
+        self.assertEqual(response["authorization"], "Bearer xoxb-1")
+        self.assertEqual(
+            response.headers["content-type"], "application/json; charset=utf-8"
+        )
+
+    def test_form_data_and_basic_auth(self):
+        response = self.client.oauth_access(
+            client_id="12345", client_secret="secret", code="abc"
+        )
+        self.assertEqual(response["body"], {"code": "abc"})
+        self.assertEqual(
+            response["authorization"], aiohttp.BasicAuth("12345", "secret").encode()
+        )
+
+    def test_files(self):
+        response = self.client.files_upload(
+            file=io.BytesIO(b"file contents"), channels="C1"
+        )
+        self.assertEqual(response["body"], {"file": "file contents", "channels": "C1"})
+
+    def test_concurrent_requests_are_spread_over_the_connections(self):
+        async def post():
+            client = slack.WebClient(
+                token="xoxb-1",
+                base_url=self.base_url,
+                run_async=True,
+                transport=self.transport,
+            )
+            return await asyncio.gather(
+                *(client.chat_postMessage(channel="C1", text=str(n)) for n in range(10))
+            )
+
+        responses = self.loop.run_until_complete(post())
+        self.assertEqual(
+            [r["body"]["text"] for r in responses], [str(n) for n in range(10)]
+        )
+        self.assertEqual(self.transport._in_flight, [0, 0])
+
+    def test_encoded_bodies(self):
+        blocks = [{"type": "divider"}]
+        messages = [{"channel": f"C{n}", "blocks": blocks} for n in range(3)]
+        responses = self.client.chat_post_many(messages, per_channel_interval=0)
+        self.assertEqual([r["body"] for r in responses], messages)
+
+    def test_form_data_objects_are_not_supported(self):
+        with self.assertRaises(TypeError):
+            self.client.api_call("files.upload", data=aiohttp.FormData({"a": "b"}))
@@ -4,10 +4,10 @@ from unittest import mock
 import asyncio
 import re
 
-
 # Internal Imports
 import slack
 from tests.helpers import async_test, fake_req_args, mock_request
+from slack.web.api_methods import API_METHODS
 import slack.errors as err
 
 
@@ -152,9 +152,29 @@ class TestWebClient(unittest.TestCase):
         )
 
     def test_xoxb_token_validation(self, mock_request):
-        with self.assertRaises(err.BotUserAccessError):
+        with self.assertRaises(err.BotUserAccessError) as context:
             # Channels can only be created with xoxa tokens.
             self.client.channels_create(name="test")
+        self.assertIn("'channels_create'", str(context.exception))
+
+    def test_every_registered_api_method_is_available(self, mock_request):
+        for spec in API_METHODS.values():
+            method = getattr(self.client, spec.attr_name)
+            self.assertEqual(method.__name__, spec.attr_name)
+
+    def test_api_methods_call_their_registered_endpoint(self, mock_request):
+        self.client.views_publish(user_id="U123", view={"type": "home"})
+        mock_request.assert_called_once_with(
+            http_verb="POST",
+            api_url="https://www.slack.com/api/views.publish",
+            req_args=fake_req_args(json={"user_id": "U123", "view": {"type": "home"}}),
+        )
+
+    def test_api_methods_require_their_required_arguments(self, mock_request):
+        with self.assertRaises(TypeError) as context:
+            self.client.chat_postMessage(text="Hello world!")
+        self.assertIn("'channel'", str(context.exception))
+        mock_request.assert_not_called()
 
     def test_json_can_only_be_sent_with_post_requests(self, mock_request):
         with self.assertRaises(err.SlackRequestError):
@@ -191,3 +211,74 @@ class TestWebClient(unittest.TestCase):
             api_url="https://www.slack.com/api/users.setPhoto",
             req_args=fake_req_args(),
         )
+
+    @async_test
+    async def test_identical_read_calls_share_a_request(self, mock_request):
+        self.client.run_async = True
+        self.client.coalesce_requests = True
+        self.client._event_loop = asyncio.get_event_loop()
+        responses = await asyncio.gather(
+            self.client.users_info(user="W1"),
+            self.client.users_info(user="W1"),
+            self.client.users_info(user="W2"),
+        )
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(self.client.coalesced_calls, 1)
+        self.assertIsNot(responses[0], responses[1])
+        self.assertTrue(all(response["ok"] for response in responses))
+
+        await self.client.users_info(user="W1")
+        self.assertEqual(mock_request.call_count, 3)
+
+    @async_test
+    async def test_shared_responses_have_their_own_data(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": True, "user": {"id": "W1", "name": "Bob"}},
+            "headers": {},
+            "status_code": 200,
+        }
+        self.client.run_async = True
+        self.client.coalesce_requests = True
+        self.client._event_loop = asyncio.get_event_loop()
+        first, second = await asyncio.gather(
+            self.client.users_info(user="W1"),
+            self.client.users_info(user="W1"),
+        )
+        self.assertEqual(self.client.coalesced_calls, 1)
+        first["user"]["name"] = "Alice"
+        self.assertEqual(second["user"]["name"], "Bob")
+        self.assertIsNone(second.req_args)
+
+    @async_test
+    async def test_write_calls_are_never_shared(self, mock_request):
+        self.client.token = "xoxp-1234"
+        self.client.run_async = True
+        self.client.coalesce_requests = True
+        self.client._event_loop = asyncio.get_event_loop()
+        await asyncio.gather(
+            self.client.chat_postMessage(channel="C1", text="Hi"),
+            self.client.chat_postMessage(channel="C1", text="Hi"),
+            self.client.dnd_setSnooze(num_minutes=10),
+            self.client.dnd_setSnooze(num_minutes=10),
+        )
+        self.assertEqual(mock_request.call_count, 4)
+        self.assertEqual(self.client.coalesced_calls, 0)
+
+    @async_test
+    async def test_shared_requests_raise_in_every_call(self, mock_request):
+        mock_request.response.return_value = {
+            "data": {"ok": False, "error": "user_not_found"},
+            "headers": {},
+            "status_code": 200,
+        }
+        self.client.run_async = True
+        self.client.coalesce_requests = True
+        self.client._event_loop = asyncio.get_event_loop()
+        results = await asyncio.gather(
+            self.client.users_info(user="W1"),
+            self.client.users_info(user="W1"),
+            return_exceptions=True,
+        )
+        self.assertEqual(mock_request.call_count, 1)
+        for result in results:
+            self.assertIsInstance(result, err.SlackApiError)